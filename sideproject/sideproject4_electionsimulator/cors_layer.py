@@ -0,0 +1,145 @@
+"""
+순수 ASGI CORS 레이어
+- 응답 헤더 튜플을 시작 시 미리 인코딩해 두고 http.response.start에 그대로 붙임
+- 프리플라이트(Origin + Access-Control-Request-Method가 있는 OPTIONS)는 앱까지 가지 않고 캐시된 204 응답으로 처리
+  (Access-Control-Max-Age 포함) - 그 밖의 OPTIONS 요청은 앱으로 전달
+- 명시적으로 허용된 Origin만 그대로 돌려주고 자격 증명 허용, '*'로만 허용되는 Origin에는 리터럴 '*' (자격 증명 없음)
+"""
+
+import os
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# === 설정 ===
+CORS_MAX_AGE = int(os.getenv("CORS_MAX_AGE", "600"))
+CORS_PREFLIGHT_CACHE_SIZE = int(os.getenv("CORS_PREFLIGHT_CACHE_SIZE", "256"))
+
+Header = Tuple[bytes, bytes]
+
+class CORSLayer:
+    """CORSMiddleware + 헤더 추가 미들웨어 + OPTIONS 핸들러를 대신하는 단일 레이어"""
+
+    def __init__(self, app, allow_origins: Iterable[str], allow_methods: Iterable[str],
+                 allow_headers: Iterable[str] = ("*",), expose_headers: Iterable[str] = (),
+                 allow_credentials: bool = False, max_age: int = CORS_MAX_AGE):
+        self.app = app
+        origins = set(allow_origins)
+        self.allow_all_origins = "*" in origins
+        self.allow_origins = {origin.encode("latin-1") for origin in origins if origin != "*"}
+        self.allow_credentials = allow_credentials
+        headers = list(allow_headers)
+        self.allow_all_headers = "*" in headers
+        # 응답이 Origin에 따라 달라지면 공유 캐시가 섞지 않도록 모든 응답에 Vary: Origin
+        self.vary_origin = not self.allow_all_origins or bool(self.allow_origins)
+
+        # 모든 허용 응답에 붙는 고정 헤더
+        common: List[Header] = []
+        expose = ", ".join(expose_headers)
+        if expose:
+            common.append((b"access-control-expose-headers", expose.encode("latin-1")))
+        self._common = common
+        # 자격 증명은 명시된 Origin에만 ('*'와 함께 보내면 브라우저가 거부)
+        self._credentials: List[Header] = [(b"access-control-allow-credentials", b"true")] if allow_credentials else []
+        self._wildcard_origin: List[Header] = [(b"access-control-allow-origin", b"*")]
+
+        self._allow_methods = ", ".join(allow_methods).encode("latin-1")
+        preflight: List[Header] = [
+            (b"access-control-allow-methods", self._allow_methods),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+            (b"content-length", b"0"),
+        ]
+        self._preflight = preflight
+        self._allow_headers = ", ".join(headers).encode("latin-1") if not self.allow_all_headers else b"*"
+        # (Origin, 요청 헤더) -> 완성된 프리플라이트 헤더 목록
+        self._preflight_cache: Dict[Tuple[bytes, bytes], List[Header]] = {}
+
+    # --- 헤더 계산 ---
+    def _origin_headers(self, origin: bytes) -> Optional[List[Header]]:
+        """명시된 Origin이면 그 Origin + 자격 증명, '*'로만 허용되면 리터럴 '*', 아니면 None"""
+        if origin in self.allow_origins:
+            return [(b"access-control-allow-origin", origin)] + self._credentials
+        if self.allow_all_origins:
+            return self._wildcard_origin
+        return None
+
+    def _echo_request_headers(self, origin: bytes) -> bool:
+        # 자격 증명 모드에서는 '*'가 와일드카드로 인정되지 않으므로 요청 헤더를 그대로 허용
+        return self.allow_all_headers and self.allow_credentials and origin in self.allow_origins
+
+    def _preflight_headers(self, origin: bytes, request_headers: bytes) -> Optional[List[Header]]:
+        echo = self._echo_request_headers(origin)
+        key = (origin, request_headers if echo else b"")
+        cached = self._preflight_cache.get(key)
+        if cached is not None:
+            return cached
+        origin_headers = self._origin_headers(origin)
+        if origin_headers is None:
+            return None
+        headers = origin_headers + self._common + self._preflight
+        if not echo:
+            headers.append((b"access-control-allow-headers", self._allow_headers))
+        elif request_headers:
+            headers.append((b"access-control-allow-headers", request_headers))
+        if self.vary_origin:
+            headers.append((b"vary", b"Origin"))
+        if len(self._preflight_cache) >= CORS_PREFLIGHT_CACHE_SIZE:
+            self._preflight_cache.clear()
+        self._preflight_cache[key] = headers
+        return headers
+
+    # --- ASGI ---
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = b""
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if scope["method"] == "OPTIONS" and origin is not None and request_method is not None:
+            await self._respond_preflight(origin, request_headers, send)
+            return
+
+        extra = self._origin_headers(origin) if origin is not None else None
+        if extra is not None:
+            extra = extra + self._common
+        if extra is None and not self.vary_origin:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                headers = list(message.get("headers", ()))
+                if self.vary_origin:
+                    self._add_vary_origin(headers)
+                if extra is not None:
+                    headers.extend(extra)
+                message = {**message, "headers": headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _respond_preflight(self, origin: bytes, request_headers: bytes, send) -> None:
+        """프리플라이트를 앱 라우팅 없이 204로 응답"""
+        headers = self._preflight_headers(origin, request_headers)
+        if headers is None:
+            # 허용되지 않은 Origin이면 CORS 헤더 없이 응답 (브라우저가 차단)
+            headers = [(b"allow", self._allow_methods), (b"content-length", b"0")]
+        await send({"type": "http.response.start", "status": 204, "headers": headers})
+        await send({"type": "http.response.body", "body": b""})
+
+    @staticmethod
+    def _add_vary_origin(headers: List[Header]) -> None:
+        for index, (name, value) in enumerate(headers):
+            if name.lower() == b"vary":
+                if b"origin" not in value.lower():
+                    headers[index] = (name, value + b", Origin")
+                return
+        headers.append((b"vary", b"Origin"))
@@ -0,0 +1,234 @@
+"""
+트렌드 히스토리 저장소
+- trend_summary 스냅샷을 SQLite 시계열 테이블로 적재 (추가 전용)
+- 실행 단위 후보 통계 + 기사 단위 레코드
+- 시간/일 단위 버킷 집계 조회
+"""
+
+import os
+import hashlib
+import logging
+import sqlite3
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from functools import lru_cache
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional, List, Iterable, Tuple
+
+from keyword_matcher import KeywordMatcher
+from snapshot_reader import SnapshotReader
+
+logger = logging.getLogger(__name__)
+
+# === 설정 ===
+HISTORY_DB_PATH = Path(os.getenv("HISTORY_DB_PATH", str(Path(__file__).parent / "cache" / "trend_history.db")))
+SENTIMENTS = ("긍정", "부정", "중립")
+
+# 버킷 단위 -> SQLite strftime 형식
+BUCKET_FORMATS = {
+    "hour": "%Y-%m-%dT%H:00",
+    "day": "%Y-%m-%d",
+}
+
+def _to_utc_naive(value: datetime) -> datetime:
+    """저장/비교용 UTC 시각 (tzinfo 없음) - tzinfo가 없는 값은 서버 로컬 시각으로 보고 변환"""
+    return value.astimezone(timezone.utc).replace(tzinfo=None)
+
+def _parse_published(published_date: str) -> Optional[datetime]:
+    """기사 발행 시각 파싱 (GNews RFC 2822 또는 ISO 형식)"""
+    if not published_date:
+        return None
+    try:
+        return _to_utc_naive(parsedate_to_datetime(published_date))
+    except (TypeError, ValueError):
+        pass
+    try:
+        return _to_utc_naive(datetime.fromisoformat(published_date))
+    except ValueError:
+        return None
+
+@lru_cache(maxsize=8)
+def _candidate_matcher(candidates: Tuple[str, ...]) -> KeywordMatcher:
+    """스냅샷 후보 목록용 매처 - 후보 목록은 거의 바뀌지 않으므로 재사용"""
+    return KeywordMatcher({"candidate": list(candidates)})
+
+def _article_id(article: Dict[str, Any]) -> str:
+    key = article.get("url") or (article.get("title", "") + article.get("summary", ""))
+    return hashlib.md5(key.encode()).hexdigest()
+
+class HistoryStore:
+    """스냅샷 히스토리 SQLite 저장소 - 같은 스냅샷(run_id)은 한 번만 적재"""
+
+    def __init__(self, db_path: Path = HISTORY_DB_PATH):
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(
+            "CREATE TABLE IF NOT EXISTS runs ("
+            " run_id TEXT PRIMARY KEY,"
+            " collected_at TEXT NOT NULL,"
+            " total_articles INTEGER NOT NULL,"
+            " time_range TEXT"
+            ") WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_runs_collected ON runs (collected_at);"
+            "CREATE TABLE IF NOT EXISTS run_candidate_stats ("
+            " run_id TEXT NOT NULL,"
+            " candidate TEXT NOT NULL,"
+            " positive INTEGER NOT NULL,"
+            " negative INTEGER NOT NULL,"
+            " neutral INTEGER NOT NULL,"
+            " PRIMARY KEY (run_id, candidate)"
+            ") WITHOUT ROWID;"
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " article_id TEXT PRIMARY KEY,"
+            " run_id TEXT NOT NULL,"
+            " published_at TEXT NOT NULL,"
+            " source TEXT,"
+            " sentiment TEXT NOT NULL,"
+            " title TEXT,"
+            " url TEXT"
+            ") WITHOUT ROWID;"
+            "CREATE INDEX IF NOT EXISTS idx_articles_published ON articles (published_at);"
+            "CREATE TABLE IF NOT EXISTS article_candidates ("
+            " candidate TEXT NOT NULL,"
+            " article_id TEXT NOT NULL,"
+            " PRIMARY KEY (candidate, article_id)"
+            ") WITHOUT ROWID;"
+        )
+        self._conn.commit()
+        self._ingested = {row[0] for row in self._conn.execute("SELECT run_id FROM runs")}
+
+    def has_run(self, run_id: str) -> bool:
+        return run_id in self._ingested
+
+    def ingest_snapshot(self, run_id: str, collected_at: datetime, data: Dict[str, Any]) -> bool:
+        """스냅샷 1개 적재 - 이미 적재된 run_id면 False (news_list는 이터레이터여도 됨)"""
+        if run_id in self._ingested:
+            return False
+
+        collected_at = _to_utc_naive(collected_at)
+        candidate_stats = data.get("candidate_stats", {}) or {}
+        candidates = list(candidate_stats)
+        matcher = _candidate_matcher(tuple(candidates))
+        news_list = data.get("news_list", []) or []
+
+        article_rows = []
+        mention_rows = []
+        for article in news_list:
+            article_id = _article_id(article)
+            published = _parse_published(article.get("published_date", "")) or collected_at
+            article_rows.append((
+                article_id, run_id, published.isoformat(sep=" ", timespec="seconds"),
+                article.get("source", ""), article.get("sentiment", "중립"),
+                article.get("title", ""), article.get("url", "")
+            ))
+            text = article.get("title", "") + "\n" + article.get("summary", "")
+            # 수집기 집계(TrendAggregator)와 같은 매칭 규칙으로 언급 판정
+            mentioned = matcher.find(text).get("candidate", ())
+            mention_rows.extend((candidate, article_id) for candidate in candidates if candidate.lower() in mentioned)
+
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO runs (run_id, collected_at, total_articles, time_range) VALUES (?, ?, ?, ?)",
+                    (run_id, collected_at.isoformat(sep=" ", timespec="seconds"),
+                     data.get("total_articles", len(article_rows)), data.get("time_range", ""))
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO run_candidate_stats (run_id, candidate, positive, negative, neutral) VALUES (?, ?, ?, ?, ?)",
+                    [(run_id, candidate, stats.get("긍정", 0), stats.get("부정", 0), stats.get("중립", 0))
+                     for candidate, stats in candidate_stats.items()]
+                )
+                # 기사는 처음 관측된 실행에만 귀속 (여러 스냅샷에 걸친 중복 집계 방지)
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO articles (article_id, run_id, published_at, source, sentiment, title, url) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    article_rows
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO article_candidates (candidate, article_id) VALUES (?, ?)",
+                    mention_rows
+                )
+            self._ingested.add(run_id)
+
+        logger.info(f"🗃️ 히스토리 적재: {run_id} (기사 {len(article_rows)}개)")
+        return True
+
+    def sync(self, snapshots: Iterable[Tuple[str, datetime, Path]]) -> int:
+        """아직 적재되지 않은 스냅샷 파일만 읽어 적재 - 적재한 개수 반환"""
+        ingested = 0
+        for run_id, collected_at, path in snapshots:
+            if run_id in self._ingested:
+                continue
+            try:
+                reader = SnapshotReader(path)
+                data = reader.read_header(("candidate_stats", "total_articles", "time_range"))
+                data["news_list"] = reader.iter_articles()
+                if self.ingest_snapshot(run_id, collected_at, data):
+                    ingested += 1
+            except Exception as e:
+                logger.error(f"❌ 히스토리 적재 실패 {path}: {str(e)}")
+        return ingested
+
+    def query(self, start: datetime, end: datetime, candidate: Optional[str] = None,
+              bucket: str = "day") -> Dict[str, Any]:
+        """[start, end) 구간의 후보별 감성 시계열과 실행별 통계"""
+        bucket_format = BUCKET_FORMATS[bucket]
+        start_str = _to_utc_naive(start).isoformat(sep=" ", timespec="seconds")
+        end_str = _to_utc_naive(end).isoformat(sep=" ", timespec="seconds")
+
+        article_sql = (
+            "SELECT strftime(?, a.published_at) AS bucket, c.candidate, a.sentiment, COUNT(*) "
+            "FROM articles a JOIN article_candidates c ON c.article_id = a.article_id "
+            "WHERE a.published_at >= ? AND a.published_at < ?"
+        )
+        article_params: List[Any] = [bucket_format, start_str, end_str]
+        run_sql = (
+            "SELECT r.run_id, r.collected_at, r.total_articles, s.candidate, s.positive, s.negative, s.neutral "
+            "FROM runs r JOIN run_candidate_stats s ON s.run_id = r.run_id "
+            "WHERE r.collected_at >= ? AND r.collected_at < ?"
+        )
+        run_params: List[Any] = [start_str, end_str]
+        if candidate:
+            article_sql += " AND c.candidate = ?"
+            article_params.append(candidate)
+            run_sql += " AND s.candidate = ?"
+            run_params.append(candidate)
+        article_sql += " GROUP BY bucket, c.candidate, a.sentiment ORDER BY bucket"
+        run_sql += " ORDER BY r.collected_at"
+
+        with self._lock:
+            article_rows = self._conn.execute(article_sql, article_params).fetchall()
+            run_rows = self._conn.execute(run_sql, run_params).fetchall()
+
+        # 버킷 -> 후보 -> 감성별 개수
+        series: Dict[str, Dict[str, Dict[str, int]]] = {}
+        for bucket_key, candidate_name, sentiment, count in article_rows:
+            stats = series.setdefault(bucket_key, {}).setdefault(
+                candidate_name, {**{s: 0 for s in SENTIMENTS}, "total": 0}
+            )
+            stats[sentiment] = stats.get(sentiment, 0) + count
+            stats["total"] += count
+
+        runs: Dict[str, Dict[str, Any]] = {}
+        for run_id, collected_at, total_articles, candidate_name, positive, negative, neutral in run_rows:
+            run = runs.setdefault(run_id, {
+                "run_id": run_id,
+                "collected_at": collected_at,
+                "total_articles": total_articles,
+                "candidate_stats": {}
+            })
+            run["candidate_stats"][candidate_name] = {"긍정": positive, "부정": negative, "중립": neutral}
+
+        return {
+            "from": start_str,
+            "to": end_str,
+            "bucket": bucket,
+            "candidate": candidate,
+            "series": [{"bucket": key, "candidates": value} for key, value in series.items()],
+            "runs": list(runs.values())
+        }
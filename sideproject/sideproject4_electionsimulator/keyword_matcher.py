@@ -0,0 +1,58 @@
+"""
+다중 키워드 매칭
+- Aho-Corasick 자동자로 여러 키워드 그룹을 텍스트 한 번 훑어서 찾음
+- 수집기/히스토리 저장소/API 서버가 같은 매칭 규칙을 쓰도록 공유
+"""
+
+from typing import Dict, List, Set, Tuple
+
+class KeywordMatcher:
+    """Aho-Corasick 자동자 - 여러 키워드 그룹을 텍스트 한 번 훑어서 모두 찾음"""
+
+    def __init__(self, groups: Dict[str, List[str]]):
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, str]]] = [[]]
+        
+        for group, keywords in groups.items():
+            for keyword in set(keywords):
+                self._insert(keyword.lower(), group)
+        self._build_failure_links()
+
+    def _insert(self, keyword: str, group: str):
+        node = 0
+        for char in keyword:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((group, keyword))
+
+    def _build_failure_links(self):
+        queue = list(self._goto[0].values())
+        for node in queue:
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                if node:
+                    fail = self._fail[node]
+                    while fail and char not in self._goto[fail]:
+                        fail = self._fail[fail]
+                    self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def find(self, text: str) -> Dict[str, Set[str]]:
+        """텍스트에 등장한 키워드를 그룹별 집합으로 반환"""
+        hits: Dict[str, Set[str]] = {}
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for char in text.lower():
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for group, keyword in output[node]:
+                hits.setdefault(group, set()).add(keyword)
+        return hits
@@ -0,0 +1,227 @@
+"""
+Prometheus 형식 지표
+- 외부 의존성 없는 카운터/게이지/히스토그램과 텍스트 노출 형식(0.0.4) 렌더링
+- 라벨 조합별 자식 객체를 한 번 만들어 두고 재사용 (기록 시 락 한 번 + 덧셈)
+- HTTP 라우트별 요청 수/지연 시간을 기록하는 ASGI 미들웨어
+"""
+
+import time
+import threading
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+# 기본 지연 시간 버킷 (초) - HTTP 요청부터 긴 LLM 호출까지
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+# 수집 단계처럼 분 단위로 걸리는 작업용
+STAGE_BUCKETS = (1.0, 5.0, 15.0, 30.0, 60.0, 120.0, 300.0, 600.0, 1200.0, 1800.0, 3600.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _escape_help(value: str) -> str:
+    """HELP 줄은 역슬래시와 줄바꿈만 이스케이프 (따옴표는 그대로)"""
+    return value.replace("\\", "\\\\").replace("\n", "\\n")
+
+def _format_value(value: float) -> str:
+    if value != value:
+        return "NaN"
+    if value in (float("inf"), float("-inf")):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+def _label_text(names: Tuple[str, ...], values: Tuple[str, ...], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+class Metric:
+    """라벨 조합 -> 자식 객체 보관 (라벨이 없으면 자기 자신이 유일한 자식)"""
+    kind = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[Tuple[str, ...], "Metric"] = {}
+        self._lock = threading.Lock()
+
+    def _new_child(self) -> "Metric":
+        raise NotImplementedError
+
+    def labels(self, *values) -> "Metric":
+        key = tuple(str(value) for value in values)
+        child = self._children.get(key)
+        if child is None:
+            if len(key) != len(self.labelnames):
+                raise ValueError(f"{self.name}: 라벨 {self.labelnames}에 값 {key}")
+            with self._lock:
+                child = self._children.setdefault(key, self._new_child())
+        return child
+
+    def _samples(self) -> Iterator[Tuple[str, Tuple[str, ...], str, float]]:
+        """(접미사, 라벨 값, 추가 라벨, 값)"""
+        raise NotImplementedError
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {_escape_help(self.documentation)}", f"# TYPE {self.name} {self.kind}"]
+        children = [((), self)] if not self.labelnames else sorted(self._children.items())
+        for values, child in children:
+            for suffix, _, extra, value in child._samples():
+                lines.append(f"{self.name}{suffix}{_label_text(self.labelnames, values, extra)} {_format_value(value)}")
+        return lines
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+
+    def _new_child(self) -> "Counter":
+        return Counter(self.name, self.documentation)
+
+    def inc(self, amount: float = 1.0) -> None:
+        with self._lock:
+            self._value += amount
+
+    def get(self) -> float:
+        return self._value
+
+    def _samples(self):
+        yield "", (), "", self._value
+
+class Gauge(Metric):
+    """현재 값 - set_function을 쓰면 노출 시점에 값을 읽음"""
+    kind = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._value = 0.0
+        self._function: Optional[Callable[[], float]] = None
+
+    def _new_child(self) -> "Gauge":
+        return Gauge(self.name, self.documentation)
+
+    def set(self, value: float) -> None:
+        self._value = value
+
+    def set_function(self, function: Callable[[], float]) -> None:
+        self._function = function
+
+    def _samples(self):
+        value = self._value
+        if self._function is not None:
+            try:
+                value = float(self._function())
+            except Exception:
+                value = float("nan")
+        yield "", (), "", value
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 버킷별 개수 (누적은 렌더링할 때 계산) + 마지막 칸은 +Inf
+        self._counts = [0] * (len(self.buckets) + 1)
+        self._sum = 0.0
+
+    def _new_child(self) -> "Histogram":
+        return Histogram(self.name, self.documentation, buckets=self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    @contextmanager
+    def time(self):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - started)
+
+    def _samples(self):
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        cumulative = 0
+        for bound, count in zip(self.buckets + (float("inf"),), counts):
+            cumulative += count
+            yield "_bucket", (), f'le="{_format_value(bound)}"', cumulative
+        yield "_sum", (), "", total
+        yield "_count", (), "", cumulative
+
+class Registry:
+    """등록된 지표를 한 번에 렌더링"""
+
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+        self._lock = threading.Lock()
+
+    def register(self, metric: Metric) -> Metric:
+        with self._lock:
+            # 모듈을 다시 불러와도 같은 이름은 처음 등록한 객체를 계속 사용
+            return self._metrics.setdefault(metric.name, metric)
+
+    def render(self) -> bytes:
+        lines: List[str] = []
+        for metric in list(self._metrics.values()):
+            lines.extend(metric.render())
+        return ("\n".join(lines) + "\n").encode("utf-8")
+
+REGISTRY = Registry()
+
+def counter(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+    return REGISTRY.register(Counter(name, documentation, labelnames))
+
+def gauge(name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+    return REGISTRY.register(Gauge(name, documentation, labelnames))
+
+def histogram(name: str, documentation: str, labelnames: Iterable[str] = (),
+              buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+    return REGISTRY.register(Histogram(name, documentation, labelnames, buckets))
+
+# === HTTP 지표 ===
+HTTP_REQUESTS = counter("http_requests_total", "HTTP 요청 수", ("method", "route", "status"))
+HTTP_REQUEST_SECONDS = histogram("http_request_duration_seconds", "HTTP 요청 처리 시간", ("method", "route"))
+
+class MetricsMiddleware:
+    """라우트 템플릿(/api/news, /{path:path} 등) 단위로 요청 수와 지연 시간 기록 - 경로 자체는 라벨로 쓰지 않음"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # 라우팅이 끝나면 scope에 매칭된 라우트가 기록됨
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            method = scope["method"]
+            HTTP_REQUEST_SECONDS.labels(method, route_path).observe(time.perf_counter() - started)
+            HTTP_REQUESTS.labels(method, route_path, status).inc()
@@ -6,20 +6,32 @@
 """
 
 import os
+import re
 import json
 import time
+import heapq
 import hashlib
 import logging
+import sqlite3
+import threading
+from itertools import islice
 from pathlib import Path
-from datetime import datetime, timedelta
+from collections import OrderedDict, Counter
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timedelta, timezone
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Tuple, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 
 import openai
 import backoff
 import requests
 from gnews import GNews
 
+from metrics import counter, histogram, STAGE_BUCKETS
+from keyword_matcher import KeywordMatcher
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -33,6 +45,24 @@ CACHE_DIR = Path("cache")
 ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# 분석 결과 캐시 설정 ('sqlite': 단일 파일 인덱스, 'json': 항목별 JSON 파일)
+ANALYSIS_CACHE_BACKEND = os.getenv('ANALYSIS_CACHE_BACKEND', 'sqlite')
+ANALYSIS_CACHE_DB = CACHE_DIR / "analysis_cache.db"
+CACHE_TTL = timedelta(hours=24)
+
+# 디스크 캐시 앞단의 메모리 LRU 크기 (항목 수 0이면 사용 안 함)
+MEMORY_CACHE_MAX_ENTRIES = int(os.getenv('MEMORY_CACHE_MAX_ENTRIES', '5000'))
+MEMORY_CACHE_MAX_BYTES = int(os.getenv('MEMORY_CACHE_MAX_BYTES', str(8 * 1024 * 1024)))
+
+# 스트리밍 파이프라인 설정 - 수집된 기사를 묶음 단위로 분석하고 진행 상황을 저널에 기록
+STREAM_CHUNK_SIZE = int(os.getenv('STREAM_CHUNK_SIZE', '20'))
+RUN_JOURNAL_PATH = CACHE_DIR / "run_journal.jsonl"
+
+# 증분 수집 트렌드 요약 재생성 조건 - 요약이 이 시간(분)보다 오래됐거나
+# 후보별 감성 집계가 윈도우 기사 수 대비 이 비율 이상 바뀌었을 때만 LLM 요약을 다시 만듦
+INCREMENTAL_SUMMARY_MAX_AGE_MINUTES = float(os.getenv('INCREMENTAL_SUMMARY_MAX_AGE_MINUTES', '60'))
+INCREMENTAL_SUMMARY_MIN_CHANGE = float(os.getenv('INCREMENTAL_SUMMARY_MIN_CHANGE', '0.1'))
+
 # API 키 설정
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
 
@@ -52,6 +82,9 @@ if OPENAI_API_KEY:
         logger.error(f"❌ OpenAI 클라이언트 초기화 실패: {e}")
         openai_client = None
 
+# 분석 대상 후보
+CANDIDATES = ['이재명', '김문수', '이준석']
+
 # 검색 키워드 설정 - 더 많은 키워드로 확장
 SEARCH_QUERIES = [
     "이재명 대선",
@@ -72,6 +105,89 @@ SEARCH_QUERIES = [
     "개혁신당 이준석"
 ]
 
+# 수집 목표 기사 수
+TARGET_ARTICLE_COUNT = 200
+
+# 동시 수집 설정 (워커 1개면 순차 수집)
+COLLECT_MAX_WORKERS = int(os.getenv('NEWS_COLLECT_MAX_WORKERS', '6'))
+COLLECT_QUERY_TIMEOUT = float(os.getenv('NEWS_COLLECT_QUERY_TIMEOUT', '30'))
+
+# LLM 동시 처리 및 호출 한도 설정
+LLM_MAX_WORKERS = int(os.getenv('LLM_MAX_WORKERS', '4'))
+OPENAI_RPM_LIMIT = int(os.getenv('OPENAI_RPM_LIMIT', '500'))
+OPENAI_TPM_LIMIT = int(os.getenv('OPENAI_TPM_LIMIT', '60000'))
+
+# 요약+감성을 한 번의 호출로 분석할지 여부
+LLM_COMBINED_ANALYSIS = os.getenv('LLM_COMBINED_ANALYSIS', 'true') == 'true'
+
+# 감성 분석 배치 크기 (한 번의 호출로 분류할 기사 수, 1이면 기사별 호출)
+SENTIMENT_BATCH_SIZE = int(os.getenv('SENTIMENT_BATCH_SIZE', '20'))
+
+# 유사(재배포) 기사 묶음 설정 - SimHash 해밍 거리 기준
+NEAR_DUP_DEDUP = os.getenv('NEAR_DUP_DEDUP', 'true') == 'true'
+NEAR_DUP_MAX_DISTANCE = int(os.getenv('NEAR_DUP_MAX_DISTANCE', '3'))
+
+# 유효한 감성 라벨
+VALID_SENTIMENTS = ["긍정", "부정", "중립"]
+
+# 감성 분석 프롬프트 공통 지침
+SENTIMENT_GUIDELINES = """**중요 지침:**
+1. 정치 뉴스는 대부분 긍정적이거나 부정적인 성향을 가집니다.
+2. 중립은 정말 예외적인 경우에만 사용하세요 (단순 일정 공지, 수치 발표만 있는 경우).
+3. 후보자가 언급된 기사는 거의 항상 긍정 또는 부정 중 하나입니다.
+4. 애매하면 긍정 쪽으로 판단하세요.
+
+감성 분류 기준:
+- **긍정**: 지지 표명, 정책 발표, 성과 강조, 호의적 분석, 지지율 상승, 칭찬, 성공적 활동
+- **부정**: 비판, 논란, 스캔들, 지지율 하락, 실정, 문제점 지적, 갈등, 반대 의견
+- **중립**: 단순 일정 발표, 객관적 수치만 제시 (매우 제한적으로만 사용)"""
+
+# 중요도 평가 키워드
+IMPORTANT_KEYWORDS = ['대선', '선거', '후보', '정치', '여론조사', '지지율']
+
+# 룰 베이스 감성 분석 키워드 (목록에 두 번 있는 키워드는 두 번 셈)
+POSITIVE_KEYWORDS = [
+    '성과', '성공', '지지', '상승', '개선', '발전', '호응', '환영', '찬성', '칭찬',
+    '좋', '우수', '훌륭', '뛰어난', '효과적', '성취', '달성', '승리', '선도',
+    '혁신', '개혁', '약속', '공약', '정책', '비전', '희망', '미래', '발표'
+]
+NEGATIVE_KEYWORDS = [
+    '비판', '논란', '문제', '하락', '실패', '우려', '걱정', '반대', '갈등', '충돌',
+    '스캔들', '의혹', '조사', '수사', '기소', '구속', '사퇴', '사과', '실정',
+    '부정', '거부', '반발', '항의', '고발', '고소', '폭로', '폭로'
+]
+
+# === 지표 ===
+NEWS_FETCH_SECONDS = histogram("news_fetch_seconds", "GNews 키워드 검색 시간", ("query",))
+NEWS_FETCH_ARTICLES = counter("news_fetch_articles_total", "키워드 검색으로 받은 기사 수", ("query",))
+NEWS_FETCH_ERRORS = counter("news_fetch_errors_total", "실패한 키워드 검색 수", ("query",))
+NEWS_FETCH_TIMEOUTS = counter("news_fetch_timeouts_total", "타임아웃으로 버린 키워드 검색 수", ("query",))
+
+LLM_REQUEST_SECONDS = histogram("llm_request_seconds", "OpenAI 호출 시간 (리미터 대기 제외)", ("json_mode",))
+LLM_REQUESTS = counter("llm_requests_total", "OpenAI 호출 수", ("result",))
+LLM_TOKENS = counter("llm_tokens_total", "OpenAI 사용 토큰 수", ("type",))
+LLM_RETRIES = counter("llm_retries_total", "OpenAI 호출 재시도 수")
+LLM_BACKOFF_SECONDS = counter("llm_backoff_seconds_total", "재시도로 공유 리미터를 멈춘 시간 합계")
+LLM_LIMITER_WAIT_SECONDS = histogram("llm_rate_limiter_wait_seconds", "RPM/TPM 예산을 기다린 시간")
+
+ANALYSIS_CACHE_LOOKUPS = counter("analysis_cache_lookups_total", "분석 결과 캐시 조회 수", ("analysis_type", "result"))
+
+PIPELINE_STAGE_SECONDS = histogram("pipeline_stage_seconds", "수집 파이프라인 단계별 소요 시간",
+                                   ("mode", "stage"), buckets=STAGE_BUCKETS)
+PIPELINE_RUNS = counter("pipeline_runs_total", "수집 파이프라인 실행 수", ("mode", "result"))
+PIPELINE_RUN_SECONDS = histogram("pipeline_run_seconds", "수집 파이프라인 전체 소요 시간",
+                                 ("mode",), buckets=STAGE_BUCKETS)
+
+# === 다중 키워드 매칭 ===
+keyword_matcher = KeywordMatcher({
+    "candidate": CANDIDATES,
+    "important": IMPORTANT_KEYWORDS,
+    "positive": POSITIVE_KEYWORDS,
+    "negative": NEGATIVE_KEYWORDS
+})
+_POSITIVE_WEIGHTS = Counter(POSITIVE_KEYWORDS)
+_NEGATIVE_WEIGHTS = Counter(NEGATIVE_KEYWORDS)
+
 # === 데이터 클래스 ===
 @dataclass
 class NewsArticle:
@@ -88,13 +204,119 @@ class NewsArticle:
         """기사 고유 ID 생성 (URL 기반)"""
         return hashlib.md5(self.url.encode()).hexdigest()
 
+    @cached_property
+    def normalized_text(self) -> str:
+        """비교용 정규화 텍스트 (제목 + 설명)"""
+        return normalize_article_text(self.title, self.description, self.source)
+
+    @property
+    def content_id(self) -> str:
+        """내용 기반 ID - URL이 달라도 같은 기사면 같은 값 (분석 캐시 키)
+        
+        정규화 후 빈 텍스트면 모든 기사가 같은 키가 되므로 URL 기반 ID 사용
+        """
+        if not self.normalized_text:
+            return self.unique_id
+        return hashlib.md5(self.normalized_text.encode()).hexdigest()
+
+    @cached_property
+    def fingerprint(self) -> int:
+        """유사 기사 판별용 64비트 SimHash"""
+        return simhash(self.normalized_text)
+
+# === 유사 기사 중복 제거 ===
+_BRACKET_PATTERN = re.compile(r"[\[\(【<].{0,10}?[\]\)】>]")
+_NON_WORD_PATTERN = re.compile(r"[^\w]+")
+
+def normalize_article_text(title: str, description: str, source: str = "") -> str:
+    """말머리([속보] 등), 언론사 꼬리표, 문장부호, 공백을 제거한 비교용 텍스트"""
+    parts = []
+    for text in (title, description):
+        text = (text or "").strip()
+        # Google News 제목/설명 끝의 " - 언론사" / "  언론사" 제거
+        if source and text.endswith(source):
+            text = text[:-len(source)].rstrip(" -\u00a0")
+        text = _BRACKET_PATTERN.sub(" ", text.lower())
+        parts.append(_NON_WORD_PATTERN.sub("", text))
+    # 설명이 제목을 그대로 반복하는 경우가 많으므로 중복은 한 번만
+    if parts[1].startswith(parts[0]):
+        return parts[1]
+    return parts[0] + parts[1]
+
+def simhash(text: str, ngram: int = 3) -> int:
+    """문자 n-gram SimHash (64비트)"""
+    if not text:
+        return 0
+    weights = [0] * 64
+    shingles = {text[i:i + ngram] for i in range(max(1, len(text) - ngram + 1))}
+    for shingle in shingles:
+        value = int.from_bytes(hashlib.blake2b(shingle.encode(), digest_size=8).digest(), 'big')
+        for bit in range(64):
+            weights[bit] += 1 if value >> bit & 1 else -1
+    fingerprint = 0
+    for bit, weight in enumerate(weights):
+        if weight > 0:
+            fingerprint |= 1 << bit
+    return fingerprint
+
+class NearDuplicateIndex:
+    """SimHash LSH 인덱스 - 지문을 밴드로 나눠 후보를 찾고 해밍 거리로 확인"""
+
+    def __init__(self, max_distance: int = NEAR_DUP_MAX_DISTANCE):
+        self.max_distance = max_distance
+        # 비둘기집 원리: 거리가 k 이하면 k+1개 밴드 중 하나는 반드시 일치
+        self.bands = max_distance + 1
+        self.band_bits = 64 // self.bands
+        self._buckets: Dict[Tuple[int, int], List[int]] = {}
+        self._fingerprints: List[int] = []
+
+    def _band_keys(self, fingerprint: int) -> List[Tuple[int, int]]:
+        mask = (1 << self.band_bits) - 1
+        return [(band, fingerprint >> (band * self.band_bits) & mask) for band in range(self.bands)]
+
+    def find(self, fingerprint: int) -> Optional[int]:
+        """등록된 지문 중 가까운 것의 번호 반환"""
+        for key in self._band_keys(fingerprint):
+            for candidate in self._buckets.get(key, ()):
+                if bin(self._fingerprints[candidate] ^ fingerprint).count("1") <= self.max_distance:
+                    return candidate
+        return None
+
+    def add(self, fingerprint: int, searchable: bool = True) -> int:
+        """지문 등록 후 번호 반환 - searchable=False면 번호만 부여하고 검색 대상에서 제외"""
+        number = len(self._fingerprints)
+        self._fingerprints.append(fingerprint)
+        if searchable:
+            for key in self._band_keys(fingerprint):
+                self._buckets.setdefault(key, []).append(number)
+        return number
+
+class NearDuplicateClusterer:
+    """유사 기사 묶음 번호 부여 - 기사가 여러 번에 나눠 들어와도 같은 실행 안에서는 같은 묶음으로 판별"""
+
+    def __init__(self, enabled: bool = True, max_distance: int = NEAR_DUP_MAX_DISTANCE):
+        self.enabled = enabled
+        self.index = NearDuplicateIndex(max_distance)
+
+    def assign(self, article: NewsArticle) -> Tuple[int, bool]:
+        """(묶음 번호, 새 묶음 여부) 반환 - 새 묶음이면 이 기사가 대표"""
+        searchable = self.enabled and bool(article.normalized_text)
+        found = self.index.find(article.fingerprint) if searchable else None
+        if found is None:
+            return self.index.add(article.fingerprint, searchable=searchable), True
+        return found, False
+
 # === 뉴스 수집 클래스 ===
 class NewsCollector:
     """뉴스 수집 담당 클래스 (GNews 사용)"""
     
-    def __init__(self, period: str = "24h", max_results: int = 50):
+    def __init__(self, period: str = "24h", max_results: int = 50,
+                 max_workers: int = COLLECT_MAX_WORKERS, query_timeout: float = COLLECT_QUERY_TIMEOUT):
         self.period = period
         self.max_results = max_results
+        self.max_workers = max(1, max_workers)
+        self.query_timeout = query_timeout
+        self.skipped_old = 0  # 마지막 수집에서 published_after 때문에 건너뛴 기사 수
         self.gnews = GNews(
             language='ko',
             country='KR',
@@ -105,6 +327,7 @@ class NewsCollector:
 
     def fetch_news(self, query: str) -> List[Dict[str, Any]]:
         """특정 키워드로 뉴스 검색"""
+        started = time.perf_counter()
         try:
             logger.info(f"뉴스 검색 중: '{query}' (최대 {self.max_results}개)")
             
@@ -124,89 +347,172 @@ class NewsCollector:
                 formatted_articles.append(formatted_article)
             
             logger.info(f"✅ '{query}' 검색 결과: {len(formatted_articles)}개 기사")
+            NEWS_FETCH_ARTICLES.labels(query).inc(len(formatted_articles))
             return formatted_articles
             
         except Exception as e:
             logger.error(f"❌ 뉴스 검색 실패 '{query}': {str(e)}")
+            NEWS_FETCH_ERRORS.labels(query).inc()
             return []
+        finally:
+            NEWS_FETCH_SECONDS.labels(query).observe(time.perf_counter() - started)
 
-    def collect_all_news(self) -> List[NewsArticle]:
-        """모든 키워드로 뉴스 수집 - 200개 목표"""
-        all_articles = []
-        seen_urls = set()
-        
-        logger.info(f"📰 뉴스 수집 시작 - 키워드: {SEARCH_QUERIES} (목표: 200개)")
-        
+    def _iter_query_results_sequentially(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """키워드별 순차 수집"""
         for query in SEARCH_QUERIES:
-            # 각 키워드당 더 많은 기사 수집
-            articles = self.fetch_news(query)
+            yield query, self.fetch_news(query)
+
+    def _iter_query_results_concurrently(self) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """키워드별 동시 수집 - 결과는 키워드 순서대로 반환"""
+        started_at: Dict[int, float] = {}
+
+        def fetch(index: int, query: str) -> List[Dict[str, Any]]:
+            started_at[index] = time.monotonic()
+            return self.fetch_news(query)
+
+        executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="news-collect")
+        try:
+            futures = {
+                executor.submit(fetch, index, query): index
+                for index, query in enumerate(SEARCH_QUERIES)
+            }
+            pending = set(futures)
+            results: Dict[int, List[Dict[str, Any]]] = {}
+            next_index = 0
             
-            for article in articles:
-                url = article.get('url', '')
-                if url and url not in seen_urls:
-                    seen_urls.add(url)
-                    
-                    news_article = NewsArticle(
-                        title=article.get('title', ''),
-                        description=article.get('description', ''),
-                        url=url,
-                        published_date=article.get('publishedAt', ''),
-                        source=article.get('source', {}).get('name', ''),
-                        query=query
-                    )
-                    all_articles.append(news_article)
+            while next_index < len(SEARCH_QUERIES):
+                if pending:
+                    done, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[futures[future]] = future.result()
                     
-                    # 200개에 도달하면 중단
-                    if len(all_articles) >= 200:
-                        logger.info(f"🎯 목표 200개 기사 수집 완료!")
-                        break
-            
-            if len(all_articles) >= 200:
-                break
+                    # 쿼리별 타임아웃 - 시작 후 제한 시간을 넘긴 쿼리는 버림
+                    now = time.monotonic()
+                    for future in list(pending):
+                        index = futures[future]
+                        if index in started_at and now - started_at[index] > self.query_timeout:
+                            logger.warning(f"⏰ 뉴스 검색 타임아웃 '{SEARCH_QUERIES[index]}' ({self.query_timeout:.0f}초)")
+                            NEWS_FETCH_TIMEOUTS.labels(SEARCH_QUERIES[index]).inc()
+                            pending.discard(future)
+                            results[index] = []
+                
+                # 순차 수집과 같은 결과가 나오도록 키워드 순서대로 반환
+                while next_index in results:
+                    yield SEARCH_QUERIES[next_index], results.pop(next_index)
+                    next_index += 1
+        finally:
+            # 목표 도달 또는 종료 시 남은 쿼리 취소
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def iter_all_news(self, seen_urls: Optional[Iterable[str]] = None, start_count: int = 0,
+                      published_after: Optional[datetime] = None) -> Iterator[NewsArticle]:
+        """중복 제거된 기사를 키워드 순서대로 하나씩 반환 - 목표 개수에 도달하면 남은 검색 취소
+        
+        seen_urls/start_count: 이미 처리한 기사 (이어서 수집할 때)
+        published_after: 발행 시각이 이 시각 이전인 기사는 키워드 결과에서 바로 건너뜀 (목표 개수에 세지 않음)
+        """
+        seen_urls = set(seen_urls or ())
+        count = start_count
+        self.skipped_old = 0
+        cutoff = to_utc(published_after) if published_after is not None else None
+        if count >= TARGET_ARTICLE_COUNT:
+            return
+        
+        if self.max_workers > 1:
+            query_results = self._iter_query_results_concurrently()
+        else:
+            query_results = self._iter_query_results_sequentially()
+        
+        try:
+            for query, articles in query_results:
+                for article in articles:
+                    url = article.get('url', '')
+                    if cutoff is not None:
+                        # 검색 결과는 발행 시각 순이 아닐 수 있으므로 중단하지 않고 건너뜀
+                        published = parse_published_date(article.get('publishedAt', ''))
+                        if published is not None and to_utc(published) <= cutoff:
+                            self.skipped_old += 1
+                            continue
+                    if url and url not in seen_urls:
+                        seen_urls.add(url)
+                        
+                        yield NewsArticle(
+                            title=article.get('title', ''),
+                            description=article.get('description', ''),
+                            url=url,
+                            published_date=article.get('publishedAt', ''),
+                            source=article.get('source', {}).get('name', ''),
+                            query=query
+                        )
+                        count += 1
+                        
+                        # 목표 개수에 도달하면 중단
+                        if count >= TARGET_ARTICLE_COUNT:
+                            logger.info(f"🎯 목표 {TARGET_ARTICLE_COUNT}개 기사 수집 완료!")
+                            return
+        finally:
+            query_results.close()
+
+    def collect_all_news(self) -> List[NewsArticle]:
+        """모든 키워드로 뉴스 수집 - 200개 목표"""
+        logger.info(f"📰 뉴스 수집 시작 - 키워드: {SEARCH_QUERIES} (목표: {TARGET_ARTICLE_COUNT}개, 동시 작업: {self.max_workers})")
+        
+        all_articles = list(self.iter_all_news())
         
         logger.info(f"✅ 총 {len(all_articles)}개의 고유 기사 수집 완료")
         return all_articles
 
 # === 뉴스 중요도 평가 함수 ===
-def rank_news_by_importance(news_data: List[Dict[str, Any]], limit: int = 100) -> List[Dict[str, Any]]:
-    """뉴스 중요도 기준으로 정렬"""
+@dataclass
+class RankingWeights:
+    """중요도 점수 가중치"""
+    candidate: float = 10        # 후보자 1명 언급당
+    title_keyword: float = 5     # 제목의 중요 키워드 1개당
+    summary_keyword: float = 3   # 요약의 중요 키워드 1개당
+    sentiment: float = 3         # 긍정/부정 기사
+    title_length: float = 2      # 제목 길이 10~50자
+
+DEFAULT_RANKING_WEIGHTS = RankingWeights()
+
+def _extract_ranking_features(news_data: List[Dict[str, Any]]) -> Dict[str, List[int]]:
+    """기사별 특징을 열 단위로 한 번에 추출 (열 이름 = RankingWeights 필드)"""
+    features: Dict[str, List[int]] = {
+        "candidate": [], "title_keyword": [], "summary_keyword": [], "sentiment": [], "title_length": []
+    }
+    for article in news_data:
+        title = article.get('title', '')
+        title_hits = keyword_matcher.find(title)
+        summary_hits = keyword_matcher.find(article.get('summary', ''))
+        
+        features["candidate"].append(len(title_hits.get("candidate", set()) | summary_hits.get("candidate", set())))
+        features["title_keyword"].append(len(title_hits.get("important", ())))
+        features["summary_keyword"].append(len(summary_hits.get("important", ())))
+        features["sentiment"].append(1 if article.get('sentiment', '중립') in ['긍정', '부정'] else 0)
+        # 제목 길이 점수 (너무 짧거나 긴 제목은 제외)
+        features["title_length"].append(1 if 10 <= len(title) <= 50 else 0)
+    return features
+
+def rank_news_by_importance(news_data: List[Dict[str, Any]], limit: int = 100,
+                            weights: Optional[RankingWeights] = None) -> List[Dict[str, Any]]:
+    """뉴스 중요도 기준 상위 limit개 선별 - 전체 정렬 대신 부분 선택, 동점은 원래 순서 유지"""
     try:
         logger.info(f"📊 뉴스 중요도 평가 시작: {len(news_data)}개 기사")
+        weights = weights or DEFAULT_RANKING_WEIGHTS
         
-        for article in news_data:
-            score = 0
-            title = article.get('title', '').lower()
-            summary = article.get('summary', '').lower()
-            
-            # 후보자 언급 점수
-            candidates = ['이재명', '김문수', '이준석']
-            for candidate in candidates:
-                if candidate in title or candidate in summary:
-                    score += 10
-            
-            # 키워드 점수
-            important_keywords = ['대선', '선거', '후보', '정치', '여론조사', '지지율']
-            for keyword in important_keywords:
-                if keyword in title:
-                    score += 5
-                if keyword in summary:
-                    score += 3
-            
-            # 감성 점수
-            sentiment = article.get('sentiment', '중립')
-            if sentiment in ['긍정', '부정']:
-                score += 3
-            
-            # 제목 길이 점수 (너무 짧거나 긴 제목은 감점)
-            title_length = len(title)
-            if 10 <= title_length <= 50:
-                score += 2
-            
-            article['importance_score'] = score
-        
-        # 중요도 순으로 정렬
-        sorted_news = sorted(news_data, key=lambda x: x.get('importance_score', 0), reverse=True)
-        result = sorted_news[:limit]
+        # 특징 열마다 가중치를 곱해 점수 합산
+        scores = [0] * len(news_data)
+        for name, column in _extract_ranking_features(news_data).items():
+            weight = getattr(weights, name)
+            if weight:
+                scores = [score + weight * value for score, value in zip(scores, column)]
+        
+        # 상위 limit개만 선택 (heapq.nlargest는 sorted(..., reverse=True)[:limit]와 같은 결과)
+        top_indexes = heapq.nlargest(limit, range(len(news_data)), key=scores.__getitem__)
+        result = []
+        for index in top_indexes:
+            article = news_data[index]
+            article['importance_score'] = scores[index]
+            result.append(article)
         
         logger.info(f"✅ 중요도 평가 완료: 상위 {len(result)}개 기사 선별")
         return result
@@ -215,24 +521,146 @@ def rank_news_by_importance(news_data: List[Dict[str, Any]], limit: int = 100) -
         logger.error(f"❌ 뉴스 중요도 평가 실패: {str(e)}")
         return news_data[:limit]
 
-# === 뉴스 분석 클래스 ===
-class NewsAnalyzer:
-    """뉴스 분석 담당 클래스 (OpenAI GPT 사용)"""
+def select_top_news(articles: Iterable[Dict[str, Any]], limit: int = 100, chunk_size: int = 500,
+                    weights: Optional[RankingWeights] = None) -> List[Dict[str, Any]]:
+    """기사 스트림에서 상위 limit개 선별 - 청크 단위로 점수를 매겨 메모리에는 상위 후보만 유지
     
-    def __init__(self):
-        self.api_usage_count = 0
-        self.daily_limit = 100
-        self.cache_enabled = True
+    기사 점수는 서로 독립이므로 결과는 rank_news_by_importance(list(articles), limit)와 같음
+    """
+    weights = weights or DEFAULT_RANKING_WEIGHTS
+    kept: List[Tuple[float, int, Dict[str, Any]]] = []
+    offset = 0
+    
+    for chunk in _chunked(articles, chunk_size):
+        scores = [0] * len(chunk)
+        for name, column in _extract_ranking_features(chunk).items():
+            weight = getattr(weights, name)
+            if weight:
+                scores = [score + weight * value for score, value in zip(scores, column)]
+        # 동점은 먼저 나온 기사 우선 (-순번)
+        kept = heapq.nlargest(
+            limit,
+            kept + [(score, -(offset + i), article) for i, (score, article) in enumerate(zip(scores, chunk))],
+            key=lambda item: (item[0], item[1])
+        )
+        offset += len(chunk)
+    
+    result = []
+    for score, _, article in kept:
+        article['importance_score'] = score
+        result.append(article)
+    logger.info(f"✅ 중요도 평가 완료: {offset}개 중 상위 {len(result)}개 기사 선별")
+    return result
+
+# === OpenAI 호출 한도 관리 ===
+class RateLimiter:
+    """분당 요청 수(RPM)/토큰 수(TPM) 토큰 버킷 - 모든 스레드가 공유"""
+    
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.rpm = max(1, requests_per_minute)
+        self.tpm = max(1, tokens_per_minute)
+        self._request_budget = float(self.rpm)
+        self._token_budget = float(self.tpm)
+        self._last_refill = time.monotonic()
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        elapsed = now - self._last_refill
+        self._last_refill = now
+        self._request_budget = min(self.rpm, self._request_budget + elapsed * self.rpm / 60)
+        self._token_budget = min(self.tpm, self._token_budget + elapsed * self.tpm / 60)
+
+    def acquire(self, tokens: int):
+        """요청 1건과 예상 토큰만큼 예산이 생길 때까지 대기"""
+        tokens = min(tokens, self.tpm)
+        started = time.perf_counter()
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if now < self._paused_until:
+                    delay = self._paused_until - now
+                elif self._request_budget >= 1 and self._token_budget >= tokens:
+                    self._request_budget -= 1
+                    self._token_budget -= tokens
+                    LLM_LIMITER_WAIT_SECONDS.observe(time.perf_counter() - started)
+                    return
+                else:
+                    request_wait = (1 - self._request_budget) * 60 / self.rpm
+                    token_wait = (tokens - self._token_budget) * 60 / self.tpm
+                    delay = max(request_wait, token_wait, 0.01)
+            time.sleep(delay)
+
+    def settle(self, estimated_tokens: int, actual_tokens: int):
+        """예상 토큰과 실제 사용량의 차이 반영"""
+        with self._lock:
+            self._token_budget = min(self.tpm, self._token_budget + estimated_tokens - actual_tokens)
+
+    def pause(self, seconds: float):
+        """429 등으로 백오프가 필요할 때 모든 스레드의 호출을 잠시 중단"""
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+        logger.warning(f"⏸️ OpenAI 호출 일시 중단: {seconds:.1f}초")
+
+llm_rate_limiter = RateLimiter(OPENAI_RPM_LIMIT, OPENAI_TPM_LIMIT)
+
+def shared_expo(base: float = 2, factor: float = 1, max_value: Optional[float] = 30):
+    """backoff 대기 시간을 공유 리미터에 넘기고 스레드 자체는 대기하지 않는 wait 생성기"""
+    delays = backoff.expo(base=base, factor=factor, max_value=max_value)
+    next(delays)
+    yield
+    while True:
+        delay = next(delays)
+        LLM_BACKOFF_SECONDS.inc(delay)
+        llm_rate_limiter.pause(delay)
+        yield 0
+
+def _record_llm_retry(details: Dict[str, Any]):
+    LLM_RETRIES.inc()
+
+# 일시적인 오류만 재시도 (429, 연결/타임아웃, 5xx)
+RETRYABLE_LLM_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.APIStatusError)
+
+def is_permanent_llm_error(error: Exception) -> bool:
+    """인증 오류 등 4xx는 재시도해도 같은 결과 - 공유 리미터를 멈추지 않고 바로 실패"""
+    if isinstance(error, (openai.RateLimitError, openai.APIConnectionError)):
+        return False
+    return isinstance(error, openai.APIStatusError) and error.status_code < 500
+
+# === 분석 결과 캐시 저장소 ===
+class CacheBackend:
+    """분석 결과 캐시 저장소 인터페이스 - 키는 (article_id, analysis_type)"""
+
+    def get(self, article_id: str, analysis_type: str) -> Optional[str]:
+        return self.get_many([article_id], analysis_type).get(article_id)
+
+    def put(self, article_id: str, analysis_type: str, result: str):
+        self.put_many({article_id: result}, analysis_type)
+
+    def get_many(self, article_ids: List[str], analysis_type: str) -> Dict[str, str]:
+        entries = self.get_entries(article_ids, analysis_type)
+        return {article_id: result for article_id, (result, _) in entries.items()}
+
+    def get_entries(self, article_ids: List[str], analysis_type: str) -> Dict[str, Tuple[str, float]]:
+        """유효한 항목을 {article_id: (결과, 저장 시각 epoch)}로 반환"""
+        raise NotImplementedError
+
+    def put_many(self, results: Dict[str, str], analysis_type: str):
+        raise NotImplementedError
+
+class JsonFileCache(CacheBackend):
+    """항목마다 JSON 파일 하나를 쓰는 캐시 (기존 방식)"""
+
+    def __init__(self, cache_dir: Path = CACHE_DIR, ttl: timedelta = CACHE_TTL):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
 
     def _get_cache_path(self, article_id: str, analysis_type: str) -> Path:
         """캐시 파일 경로 생성"""
-        return CACHE_DIR / f"{analysis_type}_{article_id}.json"
+        return self.cache_dir / f"{analysis_type}_{article_id}.json"
 
-    def _load_from_cache(self, article_id: str, analysis_type: str) -> Optional[str]:
-        """캐시에서 분석 결과 로드"""
-        if not self.cache_enabled:
-            return None
-            
+    def _read_entry(self, article_id: str, analysis_type: str) -> Optional[Tuple[str, float]]:
         cache_path = self._get_cache_path(article_id, analysis_type)
         if cache_path.exists():
             try:
@@ -240,55 +668,532 @@ class NewsAnalyzer:
                     data = json.load(f)
                     # 캐시가 24시간 이내인지 확인
                     cache_time = datetime.fromisoformat(data['timestamp'])
-                    if datetime.now() - cache_time < timedelta(hours=24):
-                        logger.debug(f"📋 캐시에서 로드: {analysis_type}_{article_id}")
-                        return data['result']
+                    if datetime.now() - cache_time < self.ttl:
+                        return data['result'], cache_time.timestamp()
                     else:
                         cache_path.unlink()  # 오래된 캐시 삭제
             except Exception as e:
                 logger.warning(f"⚠️ 캐시 로드 실패: {str(e)}")
         return None
 
+    def get_entries(self, article_ids: List[str], analysis_type: str) -> Dict[str, Tuple[str, float]]:
+        entries = {}
+        for article_id in article_ids:
+            entry = self._read_entry(article_id, analysis_type)
+            if entry and entry[0]:
+                entries[article_id] = entry
+        return entries
+
+    def put_many(self, results: Dict[str, str], analysis_type: str):
+        timestamp = datetime.now().isoformat()
+        for article_id, result in results.items():
+            cache_data = {
+                'timestamp': timestamp,
+                'result': result
+            }
+            with open(self._get_cache_path(article_id, analysis_type), 'w', encoding='utf-8') as f:
+                json.dump(cache_data, f, ensure_ascii=False, indent=2)
+
+class SQLiteCache(CacheBackend):
+    """단일 SQLite 파일 캐시 - (analysis_type, article_id) 기본키 인덱스로 조회, TTL은 쿼리에서 적용"""
+
+    def __init__(self, db_path: Path = ANALYSIS_CACHE_DB, ttl: timedelta = CACHE_TTL,
+                 legacy_dir: Optional[Path] = CACHE_DIR):
+        self.db_path = db_path
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS analysis_cache ("
+            " analysis_type TEXT NOT NULL,"
+            " article_id TEXT NOT NULL,"
+            " result TEXT NOT NULL,"
+            " created_at REAL NOT NULL,"
+            " PRIMARY KEY (analysis_type, article_id)"
+            ") WITHOUT ROWID"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_analysis_cache_created ON analysis_cache (created_at)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS cache_meta (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.commit()
+        
+        if legacy_dir is not None:
+            self._migrate_json_files(legacy_dir)
+        self.purge_expired()
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl.total_seconds()
+
+    def get_entries(self, article_ids: List[str], analysis_type: str) -> Dict[str, Tuple[str, float]]:
+        if not article_ids:
+            return {}
+        entries = {}
+        cutoff = self._cutoff()
+        with self._lock:
+            # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+            for start in range(0, len(article_ids), 500):
+                chunk = article_ids[start:start + 500]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT article_id, result, created_at FROM analysis_cache "
+                    f"WHERE analysis_type = ? AND article_id IN ({placeholders}) AND created_at >= ?",
+                    [analysis_type, *chunk, cutoff]
+                ).fetchall()
+                for article_id, result, created_at in rows:
+                    entries[article_id] = (result, created_at)
+        return entries
+
+    def put_many(self, results: Dict[str, str], analysis_type: str):
+        if not results:
+            return
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO analysis_cache (analysis_type, article_id, result, created_at) VALUES (?, ?, ?, ?)",
+                [(analysis_type, article_id, result, now) for article_id, result in results.items()]
+            )
+            self._conn.commit()
+
+    def purge_expired(self) -> int:
+        """만료된 항목 삭제"""
+        with self._lock:
+            deleted = self._conn.execute("DELETE FROM analysis_cache WHERE created_at < ?", (self._cutoff(),)).rowcount
+            self._conn.commit()
+        if deleted:
+            logger.info(f"🧹 만료된 캐시 {deleted}개 삭제")
+        return deleted
+
+    def _migrate_json_files(self, legacy_dir: Path):
+        """기존 JSON 파일 캐시를 한 번만 옮기고, 실제로 옮겨진 파일만 삭제
+        
+        이름 형식을 모르는 파일이나 읽기 실패한 파일은 그대로 남김
+        """
+        with self._lock:
+            if self._conn.execute("SELECT 1 FROM cache_meta WHERE key = 'json_migrated'").fetchone():
+                return
+        
+        rows = []
+        for cache_file in legacy_dir.glob("*.json"):
+            # {type}_{id}.json 과 이전 버전의 {id}_{type}.json 모두 지원
+            first, _, second = cache_file.stem.partition('_')
+            if first in ('summary', 'sentiment'):
+                analysis_type, article_id = first, second
+            elif second in ('summary', 'sentiment'):
+                analysis_type, article_id = second, first
+            else:
+                continue
+            try:
+                with open(cache_file, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                timestamp = data['timestamp']
+                created_at = float(timestamp) if isinstance(timestamp, (int, float)) else datetime.fromisoformat(timestamp).timestamp()
+                result = data['result']
+                if not isinstance(result, str):
+                    raise ValueError(f"result가 문자열이 아닙니다: {type(result).__name__}")
+                rows.append((cache_file, (analysis_type, article_id, result, created_at)))
+            except Exception as e:
+                logger.warning(f"⚠️ 캐시 파일 이전 실패 {cache_file.name}: {str(e)}")
+        
+        migrated = []
+        with self._lock:
+            with self._conn:
+                for cache_file, row in rows:
+                    inserted = self._conn.execute(
+                        "INSERT OR IGNORE INTO analysis_cache (analysis_type, article_id, result, created_at) VALUES (?, ?, ?, ?)",
+                        row
+                    ).rowcount
+                    if inserted:
+                        migrated.append(cache_file)
+                self._conn.execute("INSERT OR REPLACE INTO cache_meta (key, value) VALUES ('json_migrated', ?)", (datetime.now().isoformat(),))
+        
+        # 커밋이 끝난 뒤에만 삭제
+        for cache_file in migrated:
+            cache_file.unlink(missing_ok=True)
+        if migrated:
+            logger.info(f"📦 JSON 캐시 {len(migrated)}개를 {self.db_path.name}로 이전 완료")
+
+class MemoryCacheTier(CacheBackend):
+    """디스크 캐시 앞단의 메모리 LRU - 항목 수/바이트 상한, TTL 준수, 쓰기 시 갱신"""
+
+    def __init__(self, backend: CacheBackend, max_entries: int = MEMORY_CACHE_MAX_ENTRIES,
+                 max_bytes: int = MEMORY_CACHE_MAX_BYTES, ttl: timedelta = CACHE_TTL):
+        self.backend = backend
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl.total_seconds()
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[str, float, int]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def _entry_size(key: Tuple[str, str], result: str) -> int:
+        return len(key[0]) + len(key[1]) + len(result.encode('utf-8'))
+
+    def _remember(self, key: Tuple[str, str], result: str, created_at: float):
+        """락을 잡은 상태에서 호출 - 항목 추가 후 상한을 넘으면 오래된 것부터 제거"""
+        self._forget(key)
+        size = self._entry_size(key, result)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (result, created_at, size)
+        self._bytes += size
+        while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+            _, (_, _, evicted_size) = self._entries.popitem(last=False)
+            self._bytes -= evicted_size
+            self.evictions += 1
+
+    def _forget(self, key: Tuple[str, str]):
+        entry = self._entries.pop(key, None)
+        if entry:
+            self._bytes -= entry[2]
+
+    def get_entries(self, article_ids: List[str], analysis_type: str) -> Dict[str, Tuple[str, float]]:
+        entries = {}
+        missing = []
+        cutoff = time.time() - self.ttl_seconds
+        with self._lock:
+            for article_id in article_ids:
+                key = (analysis_type, article_id)
+                entry = self._entries.get(key)
+                if entry and entry[1] >= cutoff:
+                    self._entries.move_to_end(key)
+                    entries[article_id] = (entry[0], entry[1])
+                    self.hits += 1
+                else:
+                    if entry:
+                        self._forget(key)  # 만료
+                    missing.append(article_id)
+                    self.misses += 1
+        
+        if missing:
+            loaded = self.backend.get_entries(missing, analysis_type)
+            with self._lock:
+                for article_id, (result, created_at) in loaded.items():
+                    self._remember((analysis_type, article_id), result, created_at)
+            entries.update(loaded)
+        return entries
+
+    def put_many(self, results: Dict[str, str], analysis_type: str):
+        with self._lock:
+            for article_id in results:
+                self._forget((analysis_type, article_id))
+        self.backend.put_many(results, analysis_type)
+        now = time.time()
+        with self._lock:
+            for article_id, result in results.items():
+                self._remember((analysis_type, article_id), result, now)
+
+    def stats(self) -> Dict[str, Any]:
+        """캐시 통계"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+def create_cache_backend(name: str = ANALYSIS_CACHE_BACKEND) -> CacheBackend:
+    """설정에 맞는 캐시 저장소 생성 - SQLite 사용 불가시 JSON 파일로 대체, 메모리 LRU를 앞에 둠"""
+    if name == 'json':
+        backend = JsonFileCache()
+    else:
+        try:
+            backend = SQLiteCache()
+        except Exception as e:
+            logger.error(f"❌ SQLite 캐시 초기화 실패, JSON 파일 캐시 사용: {str(e)}")
+            backend = JsonFileCache()
+    
+    if MEMORY_CACHE_MAX_ENTRIES > 0:
+        return MemoryCacheTier(backend)
+    return backend
+
+# === 후보별 통계 ===
+def empty_candidate_stats() -> Dict[str, Dict[str, int]]:
+    """후보별 감성 통계 초기값"""
+    return {candidate: {"긍정": 0, "부정": 0, "중립": 0} for candidate in CANDIDATES}
+
+def parse_published_date(published_date: str) -> Optional[datetime]:
+    """기사 발행 시각 파싱 (GNews RFC 2822 또는 ISO 형식)"""
+    if not published_date:
+        return None
+    try:
+        return parsedate_to_datetime(published_date)
+    except (TypeError, ValueError):
+        pass
+    try:
+        return datetime.fromisoformat(published_date)
+    except ValueError:
+        return None
+
+def to_utc(value: datetime) -> datetime:
+    """비교용 UTC 시각 - tzinfo가 없는 값은 서버 로컬 시각으로 보고 변환"""
+    return value.astimezone(timezone.utc)
+
+class TrendAggregator:
+    """후보별/감성별/언론사별/시간대별 집계를 기사 단위로 증감하는 집계기
+    
+    기사를 추가/제거할 때 해당 기사의 기여분만 반영하므로 비용은 변경된 기사 수에 비례
+    """
+
+    def __init__(self, news_data: Iterable[Dict[str, Any]] = ()):
+        self._contributions: Dict[str, Tuple[Tuple[str, ...], str, str, Optional[str]]] = {}
+        self._expiry_heap: List[Tuple[float, str]] = []
+        self._expiry_times: Dict[str, float] = {}
+        self.candidate_counts = empty_candidate_stats()
+        self.sentiment_counts: Counter = Counter()
+        self.source_counts: Counter = Counter()
+        self.hourly_counts: Counter = Counter()
+        self.add_many(news_data)
+
+    def __len__(self) -> int:
+        return len(self._contributions)
+
+    def __contains__(self, article: Dict[str, Any]) -> bool:
+        return self._article_key(article) in self._contributions
+
+    @staticmethod
+    def _first_seen(article: Dict[str, Any]) -> datetime:
+        """발행 시각이 없는 기사의 만료 기준 시각 - 처음 수집된 시각 (기록이 없으면 지금)"""
+        try:
+            return datetime.fromisoformat(article['first_seen_at'])
+        except (KeyError, TypeError, ValueError):
+            return datetime.now(timezone.utc)
+
+    @staticmethod
+    def _article_key(article: Dict[str, Any]) -> str:
+        return article.get('url') or hashlib.md5(
+            (article.get('title', '') + article.get('summary', '')).encode()
+        ).hexdigest()
+
+    def _mentioned_candidates(self, article: Dict[str, Any]) -> Tuple[str, ...]:
+        mentioned = keyword_matcher.find(article.get('title', '') + "\n" + article.get('summary', '')).get("candidate", ())
+        return tuple(candidate for candidate in CANDIDATES if candidate in mentioned)
+
+    def _apply(self, contribution: Tuple[Tuple[str, ...], str, str, Optional[str]], delta: int):
+        candidates, sentiment, source, hour = contribution
+        for candidate in candidates:
+            self.candidate_counts[candidate][sentiment] = self.candidate_counts[candidate].get(sentiment, 0) + delta
+        self.sentiment_counts[sentiment] += delta
+        if source:
+            self.source_counts[source] += delta
+        if hour:
+            self.hourly_counts[hour] += delta
+
+    def add(self, article: Dict[str, Any]):
+        """기사 1건 반영 - 같은 기사가 다시 들어오면 이전 기여분을 교체"""
+        key = self._article_key(article)
+        previous_expiry = self._expiry_times.get(key)
+        if key in self._contributions:
+            self.remove(article)
+        
+        published = parse_published_date(article.get('published_date', ''))
+        hour = published.strftime('%Y-%m-%dT%H:00') if published else None
+        contribution = (
+            self._mentioned_candidates(article),
+            article.get('sentiment', '중립'),
+            article.get('source', ''),
+            hour
+        )
+        self._contributions[key] = contribution
+        self._apply(contribution, 1)
+        
+        # 발행 시각이 없는 기사는 처음 수집된 시각 기준으로 만료 (다시 들어와도 기준 유지)
+        if published:
+            timestamp = published.timestamp()
+        elif previous_expiry is not None and 'first_seen_at' not in article:
+            timestamp = previous_expiry
+        else:
+            timestamp = self._first_seen(article).timestamp()
+        self._expiry_times[key] = timestamp
+        heapq.heappush(self._expiry_heap, (timestamp, key))
+
+    def add_many(self, news_data: Iterable[Dict[str, Any]]):
+        for article in news_data:
+            self.add(article)
+
+    def remove(self, article: Dict[str, Any]) -> bool:
+        """기사 1건의 기여분 제거"""
+        return self._remove_key(self._article_key(article))
+
+    def _remove_key(self, key: str) -> bool:
+        contribution = self._contributions.pop(key, None)
+        if contribution is None:
+            return False
+        self._apply(contribution, -1)
+        # 힙 항목은 expire 시 지연 삭제
+        self._expiry_times.pop(key, None)
+        return True
+
+    def expire_before(self, cutoff: datetime) -> int:
+        """발행 시각(없으면 처음 수집된 시각)이 cutoff 이전인 기사 제거 (윈도우 밖으로 밀려난 기사) - 제거된 개수 반환"""
+        cutoff_timestamp = cutoff.timestamp()
+        removed = 0
+        while self._expiry_heap and self._expiry_heap[0][0] < cutoff_timestamp:
+            timestamp, key = heapq.heappop(self._expiry_heap)
+            # 이미 제거되었거나 다시 추가된 기사의 오래된 힙 항목은 건너뜀
+            if self._expiry_times.get(key) == timestamp and self._remove_key(key):
+                removed += 1
+        return removed
+
+    def candidate_stats(self) -> Dict[str, Dict[str, int]]:
+        """기존 candidate_stats 형식의 복사본"""
+        return {candidate: dict(stats) for candidate, stats in self.candidate_counts.items()}
+
+    def snapshot(self) -> Dict[str, Any]:
+        """전체 집계 복사본"""
+        return {
+            "candidate_stats": self.candidate_stats(),
+            "sentiment_stats": {sentiment: self.sentiment_counts.get(sentiment, 0) for sentiment in VALID_SENTIMENTS},
+            "source_stats": {source: count for source, count in self.source_counts.items() if count > 0},
+            "hourly_stats": {hour: count for hour, count in sorted(self.hourly_counts.items()) if count > 0},
+            "total_articles": len(self._contributions)
+        }
+
+# === 뉴스 분석 클래스 ===
+class NewsAnalyzer:
+    """뉴스 분석 담당 클래스 (OpenAI GPT 사용)"""
+    
+    def __init__(self):
+        self.api_usage_count = 0
+        self.daily_limit = 100
+        self.cache_enabled = True
+        self.cache = create_cache_backend()
+        self.rate_limiter = llm_rate_limiter
+        self._usage_lock = threading.Lock()
+
+    def _load_from_cache(self, article_id: str, analysis_type: str,
+                         legacy_id: Optional[str] = None) -> Optional[str]:
+        """캐시에서 분석 결과 로드 - legacy_id: 내용 기반 키 도입 전의 URL 기반 키"""
+        result = self._load_many_from_cache(
+            [article_id], analysis_type, {article_id: legacy_id} if legacy_id else None
+        ).get(article_id)
+        if result:
+            logger.debug(f"📋 캐시에서 로드: {analysis_type}_{article_id}")
+        return result
+
+    def _load_many_from_cache(self, article_ids: List[str], analysis_type: str,
+                              legacy_ids: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+        """캐시에서 여러 기사의 분석 결과를 한 번에 로드
+        
+        새 키로 못 찾으면 legacy_ids의 URL 기반 키로 한 번 더 찾고, 찾은 결과는 새 키로 옮겨 저장
+        (업그레이드 직후 첫 실행에서 기존 캐시를 버리고 전부 다시 분석하지 않도록)
+        """
+        if not self.cache_enabled:
+            return {}
+            
+        try:
+            results = self.cache.get_many(article_ids, analysis_type)
+            fallback = {
+                article_id: legacy_ids[article_id] for article_id in article_ids
+                if legacy_ids and article_id not in results and legacy_ids.get(article_id, article_id) != article_id
+            }
+            if fallback:
+                legacy_results = self.cache.get_many(list(set(fallback.values())), analysis_type)
+                promoted = {
+                    article_id: legacy_results[legacy_id]
+                    for article_id, legacy_id in fallback.items() if legacy_id in legacy_results
+                }
+                if promoted:
+                    self.cache.put_many(promoted, analysis_type)
+                    results.update(promoted)
+            ANALYSIS_CACHE_LOOKUPS.labels(analysis_type, "hit").inc(len(results))
+            ANALYSIS_CACHE_LOOKUPS.labels(analysis_type, "miss").inc(len(article_ids) - len(results))
+            return results
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 로드 실패: {str(e)}")
+            return {}
+
     def _save_to_cache(self, article_id: str, analysis_type: str, result: str):
         """분석 결과를 캐시에 저장"""
-        if not self.cache_enabled:
+        self._save_many_to_cache({article_id: result}, analysis_type)
+
+    def _save_many_to_cache(self, results: Dict[str, str], analysis_type: str):
+        """여러 기사의 분석 결과를 한 번에 캐시에 저장"""
+        if not self.cache_enabled or not results:
             return
             
-        cache_path = self._get_cache_path(article_id, analysis_type)
         try:
-            cache_data = {
-                'timestamp': datetime.now().isoformat(),
-                'result': result
-            }
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(cache_data, f, ensure_ascii=False, indent=2)
-            logger.debug(f"💾 캐시에 저장: {analysis_type}_{article_id}")
+            self.cache.put_many(results, analysis_type)
+            logger.debug(f"💾 캐시에 저장: {analysis_type} {len(results)}개")
         except Exception as e:
             logger.warning(f"⚠️ 캐시 저장 실패: {str(e)}")
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """메모리 캐시 적중률 등 통계"""
+        if isinstance(self.cache, MemoryCacheTier):
+            return self.cache.stats()
+        return {}
+
     def _track_api_usage(self):
         """API 사용량 추적"""
-        self.api_usage_count += 1
-        if self.api_usage_count >= self.daily_limit:
-            logger.warning(f"⚠️ 일일 API 사용 한도 도달: {self.api_usage_count}/{self.daily_limit}")
+        with self._usage_lock:
+            self.api_usage_count += 1
+            usage_count = self.api_usage_count
+        if usage_count >= self.daily_limit:
+            logger.warning(f"⚠️ 일일 API 사용 한도 도달: {usage_count}/{self.daily_limit}")
             return False
         return True
 
     @backoff.on_exception(
-        backoff.expo,
-        (openai.RateLimitError, openai.APIError, openai.AuthenticationError),
+        shared_expo,
+        RETRYABLE_LLM_ERRORS,
+        giveup=is_permanent_llm_error,
         max_tries=3,
-        max_time=30
+        max_time=30,
+        on_backoff=_record_llm_retry
     )
-    def summarize_news(self, article_id: str, title: str, description: str) -> str:
+    def _chat_completion(self, prompt: str, max_tokens: int, temperature: float, json_mode: bool = False) -> str:
+        """OpenAI 호출 - 공유 리미터로 RPM/TPM 예산을 지키고 429 시 전체 백오프"""
+        estimated_tokens = len(prompt) // 2 + max_tokens
+        self.rate_limiter.acquire(estimated_tokens)
+        
+        options = {"response_format": {"type": "json_object"}} if json_mode else {}
+        started = time.perf_counter()
+        try:
+            response = openai_client.chat.completions.create(
+                model="gpt-3.5-turbo",
+                messages=[{"role": "user", "content": prompt}],
+                max_tokens=max_tokens,
+                temperature=temperature,
+                **options
+            )
+        except Exception as e:
+            LLM_REQUESTS.labels(type(e).__name__).inc()
+            raise
+        finally:
+            LLM_REQUEST_SECONDS.labels(json_mode).observe(time.perf_counter() - started)
+        LLM_REQUESTS.labels("ok").inc()
+        
+        usage = getattr(response, 'usage', None)
+        if usage is not None and getattr(usage, 'total_tokens', None):
+            self.rate_limiter.settle(estimated_tokens, usage.total_tokens)
+            LLM_TOKENS.labels("prompt").inc(getattr(usage, 'prompt_tokens', 0) or 0)
+            LLM_TOKENS.labels("completion").inc(getattr(usage, 'completion_tokens', 0) or 0)
+        return response.choices[0].message.content.strip()
+
+    @staticmethod
+    def _fallback_summary(description: str) -> str:
+        """OpenAI 사용 불가시 설명 앞부분을 요약으로 사용"""
+        return description[:200] + "..." if len(description) > 200 else description
+
+    def summarize_news(self, article_id: str, title: str, description: str,
+                       legacy_id: Optional[str] = None) -> str:
         """뉴스 요약"""
         # 캐시 확인
-        cached_result = self._load_from_cache(article_id, 'summary')
+        cached_result = self._load_from_cache(article_id, 'summary', legacy_id)
         if cached_result:
             return cached_result
 
         if not openai_client:
-            return description[:200] + "..." if len(description) > 200 else description
+            return self._fallback_summary(description)
 
         if not self._track_api_usage():
             return description[:200] + "..."
@@ -302,14 +1207,7 @@ class NewsAnalyzer:
 
 요약:"""
 
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=150,
-                temperature=0.3
-            )
-            
-            summary = response.choices[0].message.content.strip()
+            summary = self._chat_completion(prompt, max_tokens=150, temperature=0.3)
             
             # 캐시에 저장
             self._save_to_cache(article_id, 'summary', summary)
@@ -319,18 +1217,13 @@ class NewsAnalyzer:
             
         except Exception as e:
             logger.error(f"❌ 뉴스 요약 실패: {str(e)}")
-            return description[:200] + "..." if len(description) > 200 else description
+            return self._fallback_summary(description)
 
-    @backoff.on_exception(
-        backoff.expo,
-        (openai.RateLimitError, openai.APIError, openai.AuthenticationError),
-        max_tries=3,
-        max_time=30
-    )
-    def analyze_sentiment(self, article_id: str, title: str, description: str) -> str:
+    def analyze_sentiment(self, article_id: str, title: str, description: str,
+                          legacy_id: Optional[str] = None) -> str:
         """감성 분석 - 더 공격적으로 긍정/부정 판정"""
         # 캐시 확인
-        cached_result = self._load_from_cache(article_id, 'sentiment')
+        cached_result = self._load_from_cache(article_id, 'sentiment', legacy_id)
         if cached_result:
             return cached_result
 
@@ -348,31 +1241,15 @@ class NewsAnalyzer:
 제목: {title}
 내용: {description}
 
-**중요 지침:**
-1. 정치 뉴스는 대부분 긍정적이거나 부정적인 성향을 가집니다.
-2. 중립은 정말 예외적인 경우에만 사용하세요 (단순 일정 공지, 수치 발표만 있는 경우).
-3. 후보자가 언급된 기사는 거의 항상 긍정 또는 부정 중 하나입니다.
-4. 애매하면 긍정 쪽으로 판단하세요.
-
-감성 분류 기준:
-- **긍정**: 지지 표명, 정책 발표, 성과 강조, 호의적 분석, 지지율 상승, 칭찬, 성공적 활동
-- **부정**: 비판, 논란, 스캔들, 지지율 하락, 실정, 문제점 지적, 갈등, 반대 의견
-- **중립**: 단순 일정 발표, 객관적 수치만 제시 (매우 제한적으로만 사용)
+{SENTIMENT_GUIDELINES}
 
 답변은 "긍정", "부정", "중립" 중 하나만 답하세요."""
 
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=10,
-                temperature=0.1  # 더 일관된 결과를 위해 낮춤
-            )
-            
-            sentiment = response.choices[0].message.content.strip()
+            # 더 일관된 결과를 위해 temperature 낮춤
+            sentiment = self._chat_completion(prompt, max_tokens=10, temperature=0.1)
             
             # 유효한 감성인지 확인
-            valid_sentiments = ["긍정", "부정", "중립"]
-            if sentiment not in valid_sentiments:
+            if sentiment not in VALID_SENTIMENTS:
                 # 기본값으로 룰 베이스 분석 사용
                 sentiment = self._rule_based_sentiment(title, description)
             
@@ -386,26 +1263,141 @@ class NewsAnalyzer:
             logger.error(f"❌ 감성 분석 실패: {str(e)}")
             return self._rule_based_sentiment(title, description)
 
-    def _rule_based_sentiment(self, title: str, description: str) -> str:
-        """룰 베이스 감성 분석 (OpenAI 사용 불가시 대안)"""
-        text = (title + " " + description).lower()
+    def _classify_sentiment_batch(self, batch: List[Tuple[str, str, str]]) -> Dict[int, str]:
+        """기사 여러 개를 한 번에 분류 - 유효한 라벨만 {배치 내 인덱스: 감성}으로 반환"""
+        if not self._track_api_usage():
+            return {}
+
+        articles_text = "\n\n".join(
+            f"[{i}]\n제목: {title}\n내용: {description}"
+            for i, (_, title, description) in enumerate(batch, 1)
+        )
+        prompt = f"""
+다음 정치 뉴스 기사 {len(batch)}개의 감성을 각각 분석해주세요.
+
+{articles_text}
+
+{SENTIMENT_GUIDELINES}
+
+기사 번호를 키로, "긍정", "부정", "중립" 중 하나를 값으로 하는 JSON으로만 답하세요.
+예: {{"1": "긍정", "2": "부정"}}"""
+
+        try:
+            content = self._chat_completion(prompt, max_tokens=10 * len(batch) + 20, temperature=0.1, json_mode=True)
+            parsed = json.loads(content)
+        except Exception as e:
+            logger.error(f"❌ 배치 감성 분석 실패: {str(e)}")
+            return {}
+        # JSON이어도 객체가 아니면(배열/문자열/숫자) 라벨을 읽을 수 없음
+        if not isinstance(parsed, dict):
+            logger.error(f"❌ 배치 감성 분석 응답이 JSON 객체가 아닙니다: {content[:100]}")
+            return {}
+
+        labels = {}
+        for i in range(1, len(batch) + 1):
+            sentiment = str(parsed.get(str(i), '')).strip()
+            if sentiment in VALID_SENTIMENTS:
+                labels[i - 1] = sentiment
+        return labels
+
+    def analyze_sentiments_batch(self, articles: List[Tuple[str, str, str]],
+                                 batch_size: int = SENTIMENT_BATCH_SIZE,
+                                 legacy_ids: Optional[List[str]] = None) -> List[str]:
+        """(article_id, title, description) 목록의 감성을 배치 단위로 분석 - 입력 순서대로 반환"""
+        article_ids = [article_id for article_id, _, _ in articles]
+        cached = self._load_many_from_cache(
+            article_ids, 'sentiment', dict(zip(article_ids, legacy_ids)) if legacy_ids else None
+        )
+        results: List[Optional[str]] = [cached.get(article_id) for article_id, _, _ in articles]
+        pending = [i for i, result in enumerate(results) if not result]
+        batch_size = max(1, batch_size)
+
+        if openai_client and pending:
+            logger.info(f"🧮 배치 감성 분석: {len(pending)}개 (배치 크기 {batch_size})")
+            for start in range(0, len(pending), batch_size):
+                batch_indexes = pending[start:start + batch_size]
+                
+                # 실패한 기사만 한 번 더 요청
+                for _ in range(2):
+                    labels = self._classify_sentiment_batch([articles[i] for i in batch_indexes])
+                    for position, sentiment in labels.items():
+                        results[batch_indexes[position]] = sentiment
+                    self._save_many_to_cache(
+                        {articles[batch_indexes[position]][0]: sentiment for position, sentiment in labels.items()},
+                        'sentiment'
+                    )
+                    batch_indexes = [i for i in batch_indexes if not results[i]]
+                    if not batch_indexes:
+                        break
+
+        # 남은 기사는 룰 베이스 분석
+        for i, result in enumerate(results):
+            if not result:
+                _, title, description = articles[i]
+                results[i] = self._rule_based_sentiment(title, description)
+        return results
+
+    def analyze_article(self, article_id: str, title: str, description: str,
+                        legacy_id: Optional[str] = None) -> Dict[str, str]:
+        """요약과 감성 분석을 한 번의 JSON 응답으로 처리"""
+        cached_summary = self._load_from_cache(article_id, 'summary', legacy_id)
+        cached_sentiment = self._load_from_cache(article_id, 'sentiment', legacy_id)
         
-        # 긍정 키워드
-        positive_keywords = [
-            '성과', '성공', '지지', '상승', '개선', '발전', '호응', '환영', '찬성', '칭찬',
-            '좋', '우수', '훌륭', '뛰어난', '효과적', '성취', '달성', '승리', '선도',
-            '혁신', '개혁', '약속', '공약', '정책', '비전', '희망', '미래', '발표'
-        ]
+        # 하나만 캐시에 있으면 나머지만 개별 분석
+        if cached_summary and cached_sentiment:
+            return {"summary": cached_summary, "sentiment": cached_sentiment}
+        if cached_summary:
+            return {"summary": cached_summary, "sentiment": self.analyze_sentiment(article_id, title, description)}
+        if cached_sentiment:
+            return {"summary": self.summarize_news(article_id, title, description), "sentiment": cached_sentiment}
+
+        fallback = {
+            "summary": self._fallback_summary(description),
+            "sentiment": self._rule_based_sentiment(title, description)
+        }
+
+        if not openai_client or not self._track_api_usage():
+            return fallback
+
+        try:
+            prompt = f"""
+다음 정치 뉴스 기사를 한국어로 2-3문장 요약하고 감성을 분석해주세요.
+
+제목: {title}
+내용: {description}
+
+{SENTIMENT_GUIDELINES}
+
+다음 JSON 형식으로만 답하세요:
+{{"summary": "요약", "sentiment": "긍정" | "부정" | "중립"}}"""
+
+            content = self._chat_completion(prompt, max_tokens=200, temperature=0.2, json_mode=True)
+            parsed = json.loads(content)
+            summary = str(parsed.get('summary', '')).strip()
+            sentiment = str(parsed.get('sentiment', '')).strip()
+        except Exception as e:
+            logger.error(f"❌ 통합 분석 실패: {str(e)}")
+            return fallback
+
+        if summary:
+            self._save_to_cache(article_id, 'summary', summary)
+        else:
+            summary = fallback["summary"]
+        
+        # 유효한 감성인지 확인
+        if sentiment not in VALID_SENTIMENTS:
+            sentiment = fallback["sentiment"]
+        self._save_to_cache(article_id, 'sentiment', sentiment)
         
-        # 부정 키워드
-        negative_keywords = [
-            '비판', '논란', '문제', '하락', '실패', '우려', '걱정', '반대', '갈등', '충돌',
-            '스캔들', '의혹', '조사', '수사', '기소', '구속', '사퇴', '사과', '실정',
-            '부정', '거부', '반발', '항의', '고발', '고소', '폭로', '폭로'
-        ]
+        logger.debug(f"✅ 통합 분석 완료: {article_id} -> {sentiment}")
+        return {"summary": summary, "sentiment": sentiment}
+
+    def _rule_based_sentiment(self, title: str, description: str) -> str:
+        """룰 베이스 감성 분석 (OpenAI 사용 불가시 대안)"""
+        hits = keyword_matcher.find(title + " " + description)
         
-        positive_score = sum(1 for keyword in positive_keywords if keyword in text)
-        negative_score = sum(1 for keyword in negative_keywords if keyword in text)
+        positive_score = sum(_POSITIVE_WEIGHTS[keyword] for keyword in hits.get("positive", ()))
+        negative_score = sum(_NEGATIVE_WEIGHTS[keyword] for keyword in hits.get("negative", ()))
         
         if positive_score > negative_score:
             return "긍정"
@@ -413,7 +1405,7 @@ class NewsAnalyzer:
             return "부정"
         else:
             # 동점이거나 둘 다 0이면 제목 길이와 내용으로 판단
-            if len(title) > 20 and any(candidate in text for candidate in ['이재명', '김문수', '이준석']):
+            if len(title) > 20 and hits.get("candidate"):
                 # 후보자가 언급된 긴 제목은 보통 긍정 또는 부정
                 import random
                 return random.choice(["긍정", "부정"])
@@ -421,7 +1413,7 @@ class NewsAnalyzer:
 
     def _summarize_news_batch(self, news_batch: List[Dict[str, Any]], batch_num: int, total_batches: int) -> str:
         """뉴스 배치 요약"""
-        if not openai_client:
+        if not openai_client or not self._track_api_usage():
             return f"배치 {batch_num}: 총 {len(news_batch)}개의 뉴스가 수집되었습니다."
 
         try:
@@ -442,14 +1434,7 @@ class NewsAnalyzer:
 
 요약 (2-3문장):"""
 
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=200,
-                temperature=0.5
-            )
-            
-            summary = response.choices[0].message.content.strip()
+            summary = self._chat_completion(prompt, max_tokens=200, temperature=0.5)
             logger.info(f"✅ 배치 {batch_num}/{total_batches} 요약 완료")
             return summary
             
@@ -459,7 +1444,7 @@ class NewsAnalyzer:
 
     def _create_final_summary(self, batch_summaries: List[str], time_range: str) -> str:
         """최종 트렌드 요약 생성"""
-        if not openai_client or not batch_summaries:
+        if not openai_client or not batch_summaries or not self._track_api_usage():
             return f"{time_range} 기간 동안의 대선 관련 뉴스를 분석했습니다."
 
         try:
@@ -474,14 +1459,7 @@ class NewsAnalyzer:
 
 종합 요약 (3-4문장으로 핵심 트렌드 정리):"""
 
-            response = openai_client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=300,
-                temperature=0.4
-            )
-            
-            final_summary = response.choices[0].message.content.strip()
+            final_summary = self._chat_completion(prompt, max_tokens=300, temperature=0.4)
             logger.info("✅ 최종 트렌드 요약 생성 완료")
             return final_summary
             
@@ -489,44 +1467,38 @@ class NewsAnalyzer:
             logger.error(f"❌ 최종 요약 생성 실패: {str(e)}")
             return f"{time_range} 기간 동안의 대선 관련 뉴스를 종합 분석했습니다."
 
-    def analyze_trends(self, news_data: List[Dict[str, Any]], time_range: str) -> Dict[str, Any]:
-        """뉴스 트렌드 분석"""
+    def analyze_trends(self, news_data: List[Dict[str, Any]], time_range: str,
+                       aggregator: Optional[TrendAggregator] = None,
+                       trend_summary: Optional[str] = None) -> Dict[str, Any]:
+        """뉴스 트렌드 분석 - 이미 집계한 aggregator가 있으면 재계산하지 않고, trend_summary를 주면 LLM 요약을 생략"""
         logger.info(f"📈 트렌드 분석 시작: {len(news_data)}개 기사")
         
         # 후보별 통계 계산
-        candidate_stats = {
-            "이재명": {"긍정": 0, "부정": 0, "중립": 0},
-            "김문수": {"긍정": 0, "부정": 0, "중립": 0},
-            "이준석": {"긍정": 0, "부정": 0, "중립": 0}
-        }
+        if aggregator is None:
+            aggregator = TrendAggregator(news_data)
+        aggregates = aggregator.snapshot()
         
-        for article in news_data:
-            title = article.get('title', '')
-            summary = article.get('summary', '')
-            sentiment = article.get('sentiment', '중립')
+        if trend_summary is None:
+            # 배치별 요약 생성
+            batch_size = 10
+            batches = [news_data[i:i + batch_size] for i in range(0, len(news_data), batch_size)]
+            batch_summaries = []
             
-            # 후보자별 감성 통계
-            for candidate in candidate_stats.keys():
-                if candidate in title or candidate in summary:
-                    candidate_stats[candidate][sentiment] += 1
-        
-        # 배치별 요약 생성
-        batch_size = 10
-        batches = [news_data[i:i + batch_size] for i in range(0, len(news_data), batch_size)]
-        batch_summaries = []
-        
-        for i, batch in enumerate(batches, 1):
-            if len(batch_summaries) >= 5:  # 최대 5개 배치만 처리
-                break
-            summary = self._summarize_news_batch(batch, i, len(batches))
-            batch_summaries.append(summary)
-        
-        # 최종 트렌드 요약
-        trend_summary = self._create_final_summary(batch_summaries, time_range)
+            for i, batch in enumerate(batches, 1):
+                if len(batch_summaries) >= 5:  # 최대 5개 배치만 처리
+                    break
+                summary = self._summarize_news_batch(batch, i, len(batches))
+                batch_summaries.append(summary)
+            
+            # 최종 트렌드 요약
+            trend_summary = self._create_final_summary(batch_summaries, time_range)
         
         result = {
             "trend_summary": trend_summary,
-            "candidate_stats": candidate_stats,
+            "candidate_stats": aggregates["candidate_stats"],
+            "sentiment_stats": aggregates["sentiment_stats"],
+            "source_stats": aggregates["source_stats"],
+            "hourly_stats": aggregates["hourly_stats"],
             "total_articles": len(news_data),
             "time_range": time_range,
             "news_list": news_data
@@ -535,18 +1507,146 @@ class NewsAnalyzer:
         logger.info("✅ 트렌드 분석 완료")
         return result
 
+# === 실행 저널 ===
+class RunJournal:
+    """처리된 기사를 한 줄씩 기록하는 JSON Lines 저널 - 중단된 실행을 이어서 처리"""
+
+    def __init__(self, path: Path = RUN_JOURNAL_PATH):
+        self.path = path
+        self._file = None
+        self._valid_size: Optional[int] = None  # 마지막으로 온전히 기록된 줄까지의 바이트 수
+
+    def load(self, run_date: str) -> List[Dict[str, Any]]:
+        """같은 날짜의 미완료 실행 기록 로드 - 다른 날짜면 폐기"""
+        self._valid_size = None
+        if not self.path.exists():
+            return []
+        
+        records = []
+        try:
+            with open(self.path, 'rb') as f:
+                header_line = f.readline()
+                header = json.loads(header_line or b'{}')
+                if header.get('run_date') != run_date:
+                    logger.info(f"🗑️ 이전 날짜의 실행 저널 폐기: {header.get('run_date')}")
+                    self.discard()
+                    return []
+                valid_size = len(header_line)
+                for line in f:
+                    # 줄바꿈까지 기록되지 않은 마지막 줄은 중단된 기록
+                    if not line.endswith(b"\n"):
+                        break
+                    try:
+                        records.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        break
+                    valid_size += len(line)
+        except Exception as e:
+            logger.warning(f"⚠️ 실행 저널 로드 실패: {str(e)}")
+            return []
+        self._valid_size = valid_size
+        return records
+
+    def open(self, run_date: str, resume: bool):
+        """저널 쓰기 시작 - 이어서 처리하지 않으면 새로 작성"""
+        self.close()
+        if resume:
+            self._file = open(self.path, 'a', encoding='utf-8')
+            # 중단된 마지막 줄을 잘라내야 이어 쓴 기록이 그 줄에 붙지 않음
+            if self._valid_size is not None:
+                self._file.truncate(self._valid_size)
+        else:
+            self._file = open(self.path, 'w', encoding='utf-8')
+            self._file.write(json.dumps({"run_date": run_date, "started_at": datetime.now().isoformat()}) + "\n")
+            self._file.flush()
+
+    def append(self, records: List[Dict[str, Any]]):
+        """처리된 기사 기록"""
+        if not self._file or not records:
+            return
+        for record in records:
+            self._file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self):
+        if self._file:
+            self._file.close()
+            self._file = None
+
+    def discard(self):
+        """실행 완료 후 저널 삭제"""
+        self.close()
+        self.path.unlink(missing_ok=True)
+
+def _chunked(items: Iterable[Any], size: int) -> Iterator[List[Any]]:
+    """반복자를 size개씩 묶어서 반환"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
 # === 뉴스 파이프라인 클래스 ===
+# 실행이 없는 상태의 단계 (이 단계에서 벗어나면 새 실행 시작)
+TERMINAL_STAGES = ("idle", "completed", "failed")
+
 class NewsPipeline:
     """뉴스 수집 및 분석 파이프라인"""
     
-    def __init__(self):
+    def __init__(self, llm_workers: int = LLM_MAX_WORKERS, combined_analysis: bool = LLM_COMBINED_ANALYSIS,
+                 sentiment_batch_size: int = SENTIMENT_BATCH_SIZE, near_dup_dedup: bool = NEAR_DUP_DEDUP):
         # 200개 기사 수집을 위해 더 큰 수치로 초기화
         self.collector = NewsCollector(period="24h", max_results=50)  # 각 키워드당 50개씩
         self.analyzer = NewsAnalyzer()
+        self.llm_workers = max(1, llm_workers)
+        self.combined_analysis = combined_analysis
+        self.sentiment_batch_size = max(1, sentiment_batch_size)
+        self.near_dup_dedup = near_dup_dedup
+        self.chunk_size = max(1, STREAM_CHUNK_SIZE)
+        self.journal = RunJournal()
+        # 증분 수집 롤링 윈도우 - 실행 사이에 유지 (None이면 다음 증분 수집이 최신 스냅샷으로 다시 채움)
+        self._window_articles: List[Dict[str, Any]] = []
+        self._window_aggregator: Optional[TrendAggregator] = None
+        # 마지막 증분 트렌드 요약 (요약, 그때의 후보별 집계, 생성 시각 monotonic)
+        self._window_summary: Optional[Tuple[str, Dict[str, Dict[str, int]], float]] = None
         self.last_run_date = None
         self.final_run_completed = False  # 최종 실행 완료 플래그
+        self._progress_lock = threading.Lock()
+        self._run_lock = threading.Lock()
+        self.progress: Dict[str, Any] = {"stage": "idle"}
+        self._stage_started = time.perf_counter()
+        self._run_started = self._stage_started
+
+    def _set_progress(self, **updates):
+        with self._progress_lock:
+            previous = self.progress
+            self.progress = {**previous, **updates}
+            stage = updates.get("stage")
+            if stage is not None and stage != previous.get("stage"):
+                self._record_stage(previous, stage)
 
-    def _should_run_today(self) -> bool:
+    def _record_stage(self, previous: Dict[str, Any], stage: str):
+        """단계가 바뀔 때 이전 단계의 소요 시간 기록 - 락을 잡은 상태에서 호출"""
+        now = time.perf_counter()
+        mode = self.progress.get("mode", "daily")
+        if previous.get("stage") in TERMINAL_STAGES:
+            # 새 실행 시작
+            self._run_started = now
+        else:
+            PIPELINE_STAGE_SECONDS.labels(mode, previous["stage"]).observe(now - self._stage_started)
+            if stage in TERMINAL_STAGES:
+                PIPELINE_RUNS.labels(mode, stage).inc()
+                PIPELINE_RUN_SECONDS.labels(mode).observe(now - self._run_started)
+        self._stage_started = now
+
+    def get_progress(self) -> Dict[str, Any]:
+        """진행 중인 실행 상태 (단계, 처리 개수, 중간 후보별 통계)"""
+        with self._progress_lock:
+            return dict(self.progress)
+
+    def _should_run_today(self, force: bool = False) -> bool:
         """오늘 실행해야 하는지 확인 - 최종 실행 후에는 더 이상 실행하지 않음"""
         if self.final_run_completed:
             logger.info("🚫 최종 실행이 이미 완료되었습니다. 더 이상 실행하지 않습니다.")
@@ -554,8 +1654,8 @@ class NewsPipeline:
             
         today = datetime.now().date()
         
-        # 강제 실행 모드 확인
-        if os.environ.get('FORCE_NEWS_COLLECTION') == 'true':
+        # 강제 실행 모드 확인 (호출 인자 또는 프로세스 시작 시 설정된 환경변수)
+        if force or os.environ.get('FORCE_NEWS_COLLECTION') == 'true':
             logger.info("🔥 강제 실행 모드 - 오늘 실행 여부 무시")
             return True
         
@@ -566,49 +1666,144 @@ class NewsPipeline:
         
         return True
 
-    def process_articles(self, articles: List[NewsArticle]) -> List[Dict[str, Any]]:
-        """기사 처리 (요약 및 감성 분석)"""
-        processed_articles = []
-        
-        logger.info(f"🔄 기사 처리 시작: {len(articles)}개")
-        
-        for i, article in enumerate(articles, 1):
-            try:
-                logger.info(f"📝 기사 처리 중 ({i}/{len(articles)}): {article.title[:50]}...")
-                
+    def _process_article(self, article: NewsArticle, index: int, total: int,
+                         sentiment: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """기사 1건 처리 (요약 및 감성 분석)"""
+        try:
+            logger.info(f"📝 기사 처리 중 ({index}/{total}): {article.title[:50]}...")
+            
+            if self.combined_analysis:
+                # 요약 + 감성 분석 한 번에
+                analysis = self.analyzer.analyze_article(
+                    article.content_id,
+                    article.title,
+                    article.description,
+                    legacy_id=article.unique_id
+                )
+                summary = analysis["summary"]
+                sentiment = analysis["sentiment"]
+            else:
                 # 요약 생성
                 summary = self.analyzer.summarize_news(
-                    article.unique_id, 
+                    article.content_id, 
                     article.title, 
-                    article.description
+                    article.description,
+                    legacy_id=article.unique_id
                 )
                 
-                # 감성 분석
-                sentiment = self.analyzer.analyze_sentiment(
-                    article.unique_id,
-                    article.title,
-                    article.description
-                )
-                
-                processed_article = {
-                    "title": article.title,
-                    "summary": summary,
-                    "url": article.url,
-                    "published_date": article.published_date,
-                    "source": article.source,
-                    "sentiment": sentiment,
-                    "query": article.query
-                }
-                
-                processed_articles.append(processed_article)
-                
-            except Exception as e:
-                logger.error(f"❌ 기사 처리 실패: {str(e)}")
+                # 감성 분석 (배치로 미리 분석하지 않은 경우)
+                if sentiment is None:
+                    sentiment = self.analyzer.analyze_sentiment(
+                        article.content_id,
+                        article.title,
+                        article.description,
+                        legacy_id=article.unique_id
+                    )
+            
+            return {
+                "title": article.title,
+                "summary": summary,
+                "url": article.url,
+                "published_date": article.published_date,
+                "source": article.source,
+                "sentiment": sentiment,
+                "query": article.query
+            }
+            
+        except Exception as e:
+            logger.error(f"❌ 기사 처리 실패: {str(e)}")
+            return None
+
+    def process_articles(self, articles: List[NewsArticle],
+                         clusterer: Optional[NearDuplicateClusterer] = None,
+                         cluster_results: Optional[Dict[int, Optional[Dict[str, Any]]]] = None) -> List[Dict[str, Any]]:
+        """기사 처리 (요약 및 감성 분석) - 유사 기사는 대표만 분석, 호출 한도 내에서 동시 처리, 순서 유지
+        
+        clusterer/cluster_results를 넘기면 여러 번 나눠 호출해도 앞서 분석한 묶음의 결과를 재사용
+        """
+        if clusterer is None:
+            clusterer = NearDuplicateClusterer(self.near_dup_dedup)
+        if cluster_results is None:
+            cluster_results = {}
+        
+        assignments = [clusterer.assign(article)[0] for article in articles]
+        representatives = {}
+        for article, cluster in zip(articles, assignments):
+            if cluster not in cluster_results and cluster not in representatives:
+                representatives[cluster] = article
+        if len(representatives) < len(articles):
+            logger.info(f"🧬 유사 기사 묶음: {len(articles)}개 → {len(representatives)}개 분석 대상")
+        
+        results = self._analyze_articles(list(representatives.values()))
+        cluster_results.update(zip(representatives.keys(), results))
+        
+        # 대표의 분석 결과를 묶음 내 기사에 공유
+        processed_articles = []
+        for article, cluster in zip(articles, assignments):
+            result = cluster_results.get(cluster)
+            if result is None:
                 continue
+            processed_articles.append({
+                **result,
+                "title": article.title,
+                "url": article.url,
+                "published_date": article.published_date,
+                "source": article.source,
+                "query": article.query
+            })
         
         logger.info(f"✅ 기사 처리 완료: {len(processed_articles)}개")
         return processed_articles
 
+    def _stream_articles(self, processed_articles: List[Dict[str, Any]],
+                         aggregator: TrendAggregator) -> List[Dict[str, Any]]:
+        """수집 → 분석 → 집계를 묶음 단위로 흘려보내며 저널과 중간 통계 갱신"""
+        clusterer = NearDuplicateClusterer(self.near_dup_dedup)
+        cluster_results: Dict[int, Optional[Dict[str, Any]]] = {}
+        
+        articles = self.collector.iter_all_news(
+            seen_urls=[article.get('url', '') for article in processed_articles],
+            start_count=len(processed_articles)
+        )
+        collected = len(processed_articles)
+        for chunk in _chunked(articles, self.chunk_size):
+            collected += len(chunk)
+            self._set_progress(stage="analyzing", collected=collected)
+            
+            results = self.process_articles(chunk, clusterer, cluster_results)
+            self.journal.append(results)
+            processed_articles.extend(results)
+            
+            aggregator.add_many(results)
+            self._set_progress(processed=len(processed_articles), candidate_stats=aggregator.candidate_stats())
+        
+        return processed_articles
+
+    def _analyze_articles(self, articles: List[NewsArticle]) -> List[Optional[Dict[str, Any]]]:
+        """기사 목록 분석 - 입력 순서대로, 실패한 기사는 None"""
+        total = len(articles)
+        logger.info(f"🔄 기사 처리 시작: {total}개 (동시 작업: {self.llm_workers})")
+        
+        # 통합 분석을 쓰지 않으면 감성은 배치로 먼저 분석
+        sentiments: List[Optional[str]] = [None] * total
+        if not self.combined_analysis and self.sentiment_batch_size > 1:
+            sentiments = self.analyzer.analyze_sentiments_batch(
+                [(article.content_id, article.title, article.description) for article in articles],
+                batch_size=self.sentiment_batch_size,
+                legacy_ids=[article.unique_id for article in articles]
+            )
+        
+        indexes = range(1, total + 1)
+        if self.llm_workers > 1 and total > 1:
+            with ThreadPoolExecutor(max_workers=self.llm_workers, thread_name_prefix="news-analyze") as executor:
+                results = list(executor.map(self._process_article, articles, indexes, [total] * total, sentiments))
+        else:
+            results = [
+                self._process_article(article, i, total, sentiment)
+                for article, i, sentiment in zip(articles, indexes, sentiments)
+            ]
+        return results
+
     def save_trend_summary(self, trend_data: Dict[str, Any]):
         """트렌드 요약 저장"""
         try:
@@ -641,8 +1836,20 @@ class NewsPipeline:
         except Exception as e:
             logger.error(f"❌ 트렌드 요약 저장 실패: {str(e)}")
 
-    def run_daily_collection(self):
-        """최종 뉴스 수집 및 분석 실행 (한 번만)"""
+    def run_daily_collection(self, force: bool = False):
+        """최종 뉴스 수집 및 분석 실행 (한 번만) - 동시에 한 번만 실행"""
+        if not self._run_lock.acquire(blocking=False):
+            logger.warning("⏳ 뉴스 수집이 이미 실행 중입니다. 중복 실행을 건너뜁니다.")
+            return
+        try:
+            # 최종 수집이 새 스냅샷을 만들 수 있으므로 증분 윈도우는 그 스냅샷에서 다시 시작
+            self._window_aggregator = None
+            self._window_summary = None
+            self._run_daily_collection(force)
+        finally:
+            self._run_lock.release()
+
+    def _run_daily_collection(self, force: bool):
         try:
             if self.final_run_completed:
                 logger.info("🚫 최종 실행이 이미 완료되어 더 이상 실행하지 않습니다.")
@@ -652,40 +1859,55 @@ class NewsPipeline:
             logger.info(f"🚀 최종 뉴스 수집 시작: {start_time} (목표: 200개 기사)")
             
             # 실행 여부 확인
-            if not self._should_run_today():
+            if not self._should_run_today(force):
                 return
             
-            # 1. 뉴스 수집 (200개 목표)
-            articles = self.collector.collect_all_news()
-            if not articles:
+            # 1~2. 뉴스 수집과 기사 처리 (요약 및 감성 분석)를 묶음 단위로 진행
+            run_date = start_time.strftime('%Y-%m-%d')
+            processed_articles = self.journal.load(run_date)
+            if processed_articles:
+                logger.info(f"♻️ 중단된 실행을 이어서 진행: 이미 처리된 기사 {len(processed_articles)}개")
+            self.journal.open(run_date, resume=bool(processed_articles))
+            aggregator = TrendAggregator(processed_articles)
+            self._set_progress(
+                stage="collecting",
+                mode="daily",
+                started_at=start_time.isoformat(),
+                resumed_articles=len(processed_articles),
+                collected=len(processed_articles),
+                processed=len(processed_articles),
+                candidate_stats=aggregator.candidate_stats()
+            )
+            
+            processed_articles = self._stream_articles(processed_articles, aggregator)
+            if not processed_articles:
                 logger.warning("⚠️ 수집된 뉴스가 없습니다.")
                 # 빈 데이터라도 오늘 날짜로 저장
                 empty_data = {
                     "trend_summary": "수집된 뉴스가 없습니다.",
-                    "candidate_stats": {
-                        "이재명": {"긍정": 0, "부정": 0, "중립": 0},
-                        "김문수": {"긍정": 0, "부정": 0, "중립": 0},
-                        "이준석": {"긍정": 0, "부정": 0, "중립": 0}
-                    },
+                    "candidate_stats": empty_candidate_stats(),
                     "total_articles": 0,
                     "time_range": f"{start_time.strftime('%Y-%m-%d')} 최종 수집",
                     "news_list": []
                 }
                 self.save_trend_summary(empty_data)
+                self.journal.discard()
+                self._set_progress(stage="completed", finished_at=datetime.now().isoformat())
                 self.final_run_completed = True
                 return
             
-            logger.info(f"📊 수집 완료: {len(articles)}개 기사")
-            
-            # 2. 기사 처리 (요약 및 감성 분석)
-            processed_articles = self.process_articles(articles)
+            logger.info(f"📊 수집 및 처리 완료: {len(processed_articles)}개 기사")
             
             # 3. 트렌드 분석
+            self._set_progress(stage="summarizing")
             time_range = f"{start_time.strftime('%Y-%m-%d')} 최종 수집 (총 {len(processed_articles)}개 기사)"
-            trend_data = self.analyzer.analyze_trends(processed_articles, time_range)
+            trend_data = self.analyzer.analyze_trends(processed_articles, time_range, aggregator)
             
-            # 4. 결과 저장
+            # 4. 결과 저장 - 저장이 끝나면 저널은 더 이상 필요 없음
+            self._set_progress(stage="saving")
             self.save_trend_summary(trend_data)
+            self.journal.discard()
+            self._set_progress(stage="completed", finished_at=datetime.now().isoformat())
             
             # 5. 최종 실행 완료 표시
             self.final_run_completed = True
@@ -708,15 +1930,14 @@ class NewsPipeline:
             
         except Exception as e:
             logger.error(f"❌ 최종 뉴스 수집 실패: {str(e)}")
+            # 저널은 남겨서 재시작 시 이어서 처리
+            self.journal.close()
+            self._set_progress(stage="failed", error=str(e), finished_at=datetime.now().isoformat())
             # 오류 발생 시에도 오늘 날짜로 기본 데이터 저장
             try:
                 error_data = {
                     "trend_summary": f"뉴스 수집 중 오류가 발생했습니다: {str(e)}",
-                    "candidate_stats": {
-                        "이재명": {"긍정": 0, "부정": 0, "중립": 0},
-                        "김문수": {"긍정": 0, "부정": 0, "중립": 0},
-                        "이준석": {"긍정": 0, "부정": 0, "중립": 0}
-                    },
+                    "candidate_stats": empty_candidate_stats(),
                     "total_articles": 0,
                     "time_range": f"{datetime.now().strftime('%Y-%m-%d')} 오류 발생",
                     "news_list": []
@@ -726,6 +1947,136 @@ class NewsPipeline:
             except Exception as e2:
                 logger.error(f"❌ 오류 데이터 저장도 실패: {str(e2)}")
 
+    def _reusable_window_summary(self, aggregator: TrendAggregator) -> Optional[str]:
+        """직전 증분 요약을 그대로 쓸 수 있으면 반환 - 오래됐거나 후보별 집계가 크게 바뀌었으면 None"""
+        if self._window_summary is None:
+            return None
+        summary, stats, created = self._window_summary
+        if time.monotonic() - created >= INCREMENTAL_SUMMARY_MAX_AGE_MINUTES * 60:
+            return None
+        
+        current = aggregator.candidate_stats()
+        changed = sum(
+            abs(counts.get(sentiment, 0) - stats.get(candidate, {}).get(sentiment, 0))
+            for candidate, counts in current.items() for sentiment in VALID_SENTIMENTS
+        )
+        if changed >= max(1, INCREMENTAL_SUMMARY_MIN_CHANGE * len(aggregator)):
+            return None
+        return summary
+
+    def run_incremental_collection(self, previous_articles: Iterable[Dict[str, Any]] = (),
+                                   high_water_mark: Optional[datetime] = None,
+                                   window: timedelta = timedelta(hours=24)) -> Optional[Dict[str, Any]]:
+        """증분 수집 - 이전 실행 이후 발행된 기사만 분석해 롤링 윈도우에 병합 후 저장
+        
+        윈도우 기사와 집계기는 실행 사이에 유지하고 새 기사 추가와 만료만 반영
+        previous_articles는 유지 중인 윈도우가 없을 때(첫 실행)만 읽으므로 지연 이터레이터를 넘기면 됨
+        다른 수집이 실행 중이면 None, 완료되면 실행 지표 반환 (새 high_water_mark 포함, UTC)
+        """
+        if not self._run_lock.acquire(blocking=False):
+            logger.warning("⏳ 뉴스 수집이 이미 실행 중입니다. 증분 수집을 건너뜁니다.")
+            return None
+        try:
+            start_time = datetime.now()
+            api_calls_before = self.analyzer.api_usage_count
+            self._set_progress(stage="collecting", mode="incremental", started_at=start_time.isoformat(),
+                               collected=0, processed=0, error=None, finished_at=None)
+            
+            seeded: List[Dict[str, Any]] = []
+            if self._window_aggregator is None:
+                seeded = list(previous_articles)
+                self._window_articles = seeded
+                self._window_aggregator = TrendAggregator(seeded)
+                logger.info(f"🪟 증분 수집 윈도우 초기화: 이전 스냅샷 기사 {len(seeded)}개")
+            aggregator = self._window_aggregator
+            
+            # 1. 윈도우에 이미 있는 URL과 high_water_mark 이전에 발행된 기사는 키워드 결과에서 바로 건너뜀
+            new_articles = list(self.collector.iter_all_news(
+                seen_urls=[a.get('url', '') for a in self._window_articles],
+                published_after=high_water_mark
+            ))
+            fetched = len(new_articles) + self.collector.skipped_old
+            self._set_progress(stage="analyzing", collected=fetched)
+            logger.info(f"🆕 증분 수집: {fetched}개 중 새 기사 {len(new_articles)}개")
+            
+            # 2. 새 기사만 분석 (분석 캐시에 있는 기사는 API 호출 없음)
+            processed = self.process_articles(new_articles) if new_articles else []
+            self._set_progress(processed=len(processed))
+            # 발행 시각이 없는 기사는 처음 수집된 시각을 남겨 재시작 후에도 같은 기준으로 만료
+            first_seen_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
+            for article in processed:
+                if not parse_published_date(article.get('published_date', '')):
+                    article.setdefault('first_seen_at', first_seen_at)
+            
+            # 3. 롤링 윈도우 갱신 - 새 기사만 더하고 윈도우 밖으로 밀려난 기사 제거
+            cutoff = start_time - window
+            aggregator.add_many(processed)
+            expired = aggregator.expire_before(cutoff)
+            if expired:
+                self._window_articles = [article for article in self._window_articles if article in aggregator]
+            self._window_articles = processed + self._window_articles
+            merged = self._window_articles
+            
+            # 새로 들어온 기사만 보면 됨 (윈도우의 나머지는 이전 high_water_mark 이하)
+            published_times = [
+                to_utc(published) for published in
+                (parse_published_date(article.get('published_date', '')) for article in seeded + processed) if published
+            ]
+            if high_water_mark is not None:
+                published_times.append(to_utc(high_water_mark))
+            new_high_water_mark = max(published_times, default=None)
+            
+            # 4. 트렌드 분석 및 저장 (새 기사가 없으면 저장 생략)
+            # LLM 요약은 오래됐거나 집계가 크게 바뀐 경우에만 다시 생성
+            summary_refreshed = False
+            if processed or expired:
+                self._set_progress(stage="summarizing", candidate_stats=aggregator.candidate_stats())
+                time_range = f"{start_time.strftime('%Y-%m-%d %H:%M')} 증분 수집 (최근 {int(window.total_seconds() // 3600)}시간, 총 {len(merged)}개 기사)"
+                reused_summary = self._reusable_window_summary(aggregator)
+                trend_data = self.analyzer.analyze_trends(merged, time_range, aggregator, trend_summary=reused_summary)
+                if reused_summary is None:
+                    summary_refreshed = True
+                    self._window_summary = (trend_data["trend_summary"], aggregator.candidate_stats(), time.monotonic())
+                # 재시작 후에도 이어서 수집하도록 high_water_mark를 스냅샷에 함께 저장 (news_list보다 앞에 두어 헤더만 읽어도 찾음)
+                trend_data = {
+                    "high_water_mark": new_high_water_mark.isoformat() if new_high_water_mark else None,
+                    **trend_data
+                }
+                self._set_progress(stage="saving")
+                self.save_trend_summary(trend_data)
+            
+            self.last_run_date = start_time.date()
+            duration = (datetime.now() - start_time).total_seconds()
+            self._set_progress(stage="completed", finished_at=datetime.now().isoformat())
+            
+            metrics = {
+                "started_at": start_time.isoformat(),
+                "duration_seconds": round(duration, 1),
+                "fetched": fetched,
+                "skipped_old": self.collector.skipped_old,
+                "new_articles": len(new_articles),
+                "analyzed": len(processed),
+                "expired": expired,
+                "window_articles": len(merged),
+                "api_calls": self.analyzer.api_usage_count - api_calls_before,
+                "saved": bool(processed or expired),
+                "summary_refreshed": summary_refreshed,
+                "high_water_mark": new_high_water_mark.isoformat() if new_high_water_mark else None
+            }
+            logger.info(f"✅ 증분 수집 완료: 새 기사 {len(processed)}개, 만료 {expired}개, 윈도우 {len(merged)}개 ({duration:.1f}초)")
+            return metrics
+            
+        except Exception as e:
+            logger.error(f"❌ 증분 수집 실패: {str(e)}")
+            # 저장되지 않은 변경이 남지 않도록 다음 실행은 마지막 스냅샷에서 다시 시작
+            self._window_aggregator = None
+            self._window_articles = []
+            self._window_summary = None
+            self._set_progress(stage="failed", error=str(e), finished_at=datetime.now().isoformat())
+            raise
+        finally:
+            self._run_lock.release()
+
 # === 전역 인스턴스 ===
 pipeline = NewsPipeline()
 
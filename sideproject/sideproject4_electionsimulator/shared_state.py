@@ -0,0 +1,326 @@
+"""
+멀티 워커 공유 상태
+- 파일 락(flock)으로 리더 선출 - 리더 프로세스만 뉴스 수집
+- 리더가 캐시 스냅샷을 공유 파일에 게시, 다른 워커는 mmap으로 읽음
+- 워커는 공유 파일 교체(inode 변경)를 감지해 캐시 갱신, 리더가 죽으면 락을 넘겨받음
+- 팔로워가 받은 수집/롤백 요청은 요청 파일로 남기고 리더가 가져가 실행
+- 리더가 수집 상태를 상태 파일로 공유해 팔로워의 상태 API도 리더 기준으로 응답
+- 최종 수집 완료 표시를 공유 디렉토리에 남겨 승계한 리더가 다시 수집하지 않음
+"""
+
+import os
+import json
+import mmap
+import time
+import struct
+import asyncio
+import logging
+from pathlib import Path
+from typing import Optional, Callable, Awaitable, Tuple, Dict, Any, List
+
+# flock은 POSIX 전용 (없으면 공유 모드 사용 불가)
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# === 설정 ===
+SHARED_STATE_DIR = Path(os.getenv("SHARED_STATE_DIR", str(Path(__file__).parent / "cache" / "shared")))
+SHARED_POLL_SECONDS = float(os.getenv("SHARED_POLL_SECONDS", "1"))
+
+# 팔로워 -> 리더 요청 종류 (종류별 파일 하나, 가져가기 전 요청은 최신 것으로 합쳐짐)
+REQUEST_KINDS = ("collection", "rollback")
+
+def shared_state_supported() -> bool:
+    return fcntl is not None
+
+class LeaderLock:
+    """비차단 flock 기반 리더 락 - 프로세스가 죽으면 OS가 자동으로 해제"""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._fd: Optional[int] = None
+
+    @property
+    def held(self) -> bool:
+        return self._fd is not None
+
+    def try_acquire(self) -> bool:
+        if self._fd is not None:
+            return True
+        fd = os.open(str(self.path), os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            os.close(fd)
+            return False
+        # 디버깅용으로 리더 PID 기록
+        os.ftruncate(fd, 0)
+        os.write(fd, str(os.getpid()).encode())
+        self._fd = fd
+        return True
+
+    def release(self) -> None:
+        if self._fd is not None:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+            os.close(self._fd)
+            self._fd = None
+
+class SharedSnapshotFile:
+    """헤더(매직, 세대, 캐시 버전, 길이) + JSON 본문 파일
+
+    새 파일을 끝까지 쓴 뒤 os.replace로 교체하므로 읽는 쪽은 항상 완전한 파일 하나를 mmap
+    캐시 버전은 리더의 스냅샷 번호 - 팔로워도 같은 번호를 써서 롤백 요청의 버전이 모든 워커에서 같은 뜻
+    """
+    HEADER = struct.Struct("<8sQQQ")
+    MAGIC = b"ELECSNP2"
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._seen: Optional[Tuple[int, int]] = None  # (inode, mtime_ns)
+
+    def publish(self, body: bytes, version: int = 0) -> int:
+        """스냅샷 게시 - 세대 번호 반환"""
+        generation = time.time_ns()
+        tmp_path = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(self.HEADER.pack(self.MAGIC, generation, version, len(body)))
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.path)
+        self._seen = self._identity()
+        return generation
+
+    def _identity(self) -> Optional[Tuple[int, int]]:
+        try:
+            stat = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def changed(self) -> bool:
+        """마지막으로 읽거나 쓴 뒤 파일이 교체되었는지 (stat 한 번)"""
+        identity = self._identity()
+        return identity is not None and identity != self._seen
+
+    def read(self) -> Optional[Tuple[int, int, bytes]]:
+        """(세대, 캐시 버전, 본문) - 파일이 없거나 손상되었으면 None"""
+        try:
+            with open(self.path, "rb") as f:
+                identity = os.fstat(f.fileno())
+                if identity.st_size < self.HEADER.size:
+                    return None
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    magic, generation, version, length = self.HEADER.unpack_from(mapped, 0)
+                    if magic != self.MAGIC or self.HEADER.size + length > len(mapped):
+                        logger.error(f"❌ 공유 스냅샷 파일이 손상되었습니다: {self.path}")
+                        return None
+                    body = mapped[self.HEADER.size:self.HEADER.size + length]
+        except FileNotFoundError:
+            return None
+        self._seen = (identity.st_ino, identity.st_mtime_ns)
+        return generation, version, body
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]) -> None:
+    _write_text_atomic(path, json.dumps(data, ensure_ascii=False, default=str))
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+class SharedStateCoordinator:
+    """리더 선출 + 스냅샷 게시/구독 + 팔로워 요청 전달 + 리더 수집 상태/최종 수집 완료 공유"""
+
+    def __init__(self, directory: Path = SHARED_STATE_DIR, poll_seconds: float = SHARED_POLL_SECONDS):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.directory = directory
+        self.poll_seconds = poll_seconds
+        self.lock = LeaderLock(directory / "leader.lock")
+        self.snapshot_file = SharedSnapshotFile(directory / "snapshot.bin")
+        self.request_path = self._request_path("collection")
+        self.status_path = directory / "leader_status.json"
+        self.completion_path = directory / "final_collection.done"
+        self._published_status: Optional[str] = None
+        self.published = 0
+        self.received = 0
+        self.forwarded = 0
+        self.handled_requests = 0
+        self._task: Optional[asyncio.Task] = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self.lock.held
+
+    def try_become_leader(self) -> bool:
+        if self.lock.held:
+            return True
+        if self.lock.try_acquire():
+            logger.info(f"👑 리더 워커로 선출되었습니다 (pid {os.getpid()})")
+            return True
+        return False
+
+    def publish(self, body: bytes, version: int = 0) -> None:
+        """리더만 게시"""
+        if not self.is_leader:
+            return
+        self.snapshot_file.publish(body, version)
+        self.published += 1
+
+    def read_latest(self) -> Optional[Tuple[bytes, int]]:
+        """게시된 (본문, 캐시 버전)"""
+        result = self.snapshot_file.read()
+        if result is None:
+            return None
+        self.received += 1
+        return result[2], result[1]
+
+    # --- 팔로워 -> 리더 요청 ---
+    def _request_path(self, kind: str) -> Path:
+        return self.directory / f"{kind}.request"
+
+    def send_request(self, kind: str, **fields: Any) -> None:
+        """리더에게 요청 - 같은 종류의 요청이 아직 처리되지 않았으면 덮어씀"""
+        _write_json_atomic(self._request_path(kind), {
+            **fields,
+            "kind": kind,
+            "pid": os.getpid(),
+            "requested_at": time.time()
+        })
+        self.forwarded += 1
+
+    def take_request(self, kind: str) -> Optional[Dict[str, Any]]:
+        """리더가 대기 중인 요청을 가져감 - 이름을 바꿔 선점하므로 한 번만 처리"""
+        path = self._request_path(kind)
+        claimed_path = path.with_name(f"{path.name}.{os.getpid()}.taken")
+        try:
+            os.replace(path, claimed_path)
+        except FileNotFoundError:
+            return None
+        request = _read_json(claimed_path)
+        claimed_path.unlink(missing_ok=True)
+        if request is not None:
+            request.setdefault("kind", kind)
+            self.handled_requests += 1
+        return request
+
+    def take_requests(self) -> List[Dict[str, Any]]:
+        """대기 중인 모든 종류의 요청"""
+        return [request for request in map(self.take_request, REQUEST_KINDS) if request is not None]
+
+    def request_collection(self, reason: str) -> None:
+        """리더에게 수집 요청 (리더 쪽에서 진행 중인 실행에 합류하므로 하나로 합쳐져도 됨)"""
+        self.send_request("collection", reason=reason)
+
+    def take_collection_request(self) -> Optional[Dict[str, Any]]:
+        return self.take_request("collection")
+
+    def request_rollback(self, version: Optional[int]) -> None:
+        """리더에게 캐시 롤백 요청 - 리더가 되돌린 스냅샷을 다시 게시하면 모든 워커에 반영"""
+        self.send_request("rollback", version=version)
+
+    # --- 리더 수집 상태 공유 ---
+    def publish_status(self, status: Dict[str, Any]) -> None:
+        """리더의 수집 상태를 상태 파일에 기록 (내용이 바뀐 경우만)"""
+        if not self.is_leader:
+            return
+        text = json.dumps({**status, "leader_pid": os.getpid()}, ensure_ascii=False, default=str)
+        if text != self._published_status:
+            _write_text_atomic(self.status_path, text)
+            self._published_status = text
+
+    def read_leader_status(self) -> Optional[Dict[str, Any]]:
+        """리더가 마지막으로 기록한 수집 상태 - 없으면 None"""
+        return _read_json(self.status_path)
+
+    # --- 최종 수집 완료 표시 ---
+    def mark_final_collection_completed(self) -> None:
+        """최종 수집 완료 기록 - 같은 서버 실행(같은 부모 프로세스의 워커들) 안에서만 유효"""
+        _write_json_atomic(self.completion_path, {
+            "ppid": os.getppid(),
+            "pid": os.getpid(),
+            "completed_at": time.time()
+        })
+
+    def final_collection_completed(self) -> bool:
+        """이 서버 실행에서 다른 워커가 최종 수집을 마쳤는지 - 서버를 다시 시작하면 기존처럼 다시 수집"""
+        marker = _read_json(self.completion_path)
+        return marker is not None and marker.get("ppid") == os.getppid()
+
+    # --- 감시 루프 ---
+    def start(self, on_snapshot: Callable[[bytes, int], None],
+              on_leader: Callable[[], Awaitable[None]],
+              on_request: Callable[[Dict[str, Any]], None],
+              leader_status: Optional[Callable[[], Dict[str, Any]]] = None) -> None:
+        """감시 루프 시작
+        
+        팔로워: 스냅샷 교체 시 on_snapshot(본문, 캐시 버전) - 역직렬화/압축이 있으므로 스레드에서 호출, 리더 승계 시 on_leader
+        리더: 팔로워가 남긴 요청마다 on_request, 주기마다 leader_status()를 상태 파일에 기록
+        """
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._watch(on_snapshot, on_leader, on_request, leader_status)
+            )
+
+    async def _watch(self, on_snapshot: Callable[[bytes, int], None],
+                     on_leader: Callable[[], Awaitable[None]],
+                     on_request: Callable[[Dict[str, Any]], None],
+                     leader_status: Optional[Callable[[], Dict[str, Any]]]) -> None:
+        while not self.is_leader:
+            await asyncio.sleep(self.poll_seconds)
+            if self.try_become_leader():
+                await on_leader()
+                break
+            if self.snapshot_file.changed():
+                latest = self.read_latest()
+                if latest is not None:
+                    try:
+                        await asyncio.to_thread(on_snapshot, *latest)
+                    except Exception as e:
+                        logger.error(f"❌ 공유 스냅샷 반영 실패: {str(e)}")
+        
+        while True:
+            for request in self.take_requests():
+                try:
+                    on_request(request)
+                except Exception as e:
+                    logger.error(f"❌ 전달된 요청 처리 실패: {str(e)}")
+            if leader_status is not None:
+                try:
+                    self.publish_status(leader_status())
+                except Exception as e:
+                    logger.error(f"❌ 리더 상태 기록 실패: {str(e)}")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        self.lock.release()
+
+    def get_status(self) -> dict:
+        return {
+            "enabled": True,
+            "role": "leader" if self.is_leader else "follower",
+            "pid": os.getpid(),
+            "directory": str(self.directory),
+            "published": self.published,
+            "received": self.received,
+            "forwarded_requests": self.forwarded,
+            "handled_requests": self.handled_requests,
+            "final_collection_completed": self.final_collection_completed()
+        }
@@ -0,0 +1,140 @@
+"""
+trend_summary 스냅샷 스트리밍 리더
+- news_list를 메모리에 올리지 않고 헤더 필드만 읽기
+- news_list 기사를 하나씩 꺼내는 이터레이터
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, Optional, Iterator, Iterable, Tuple
+
+READ_CHUNK_SIZE = 64 * 1024
+LIST_KEY = "news_list"
+
+_WHITESPACE = " \t\n\r"
+_NUMBER_CHARS = "0123456789.eE+-"
+
+class SnapshotReader:
+    """최상위 객체를 키 단위로, news_list는 원소 단위로 디코딩하는 증분 JSON 리더"""
+
+    def __init__(self, path: Path, chunk_size: int = READ_CHUNK_SIZE):
+        self.path = path
+        self.chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
+    # --- 버퍼 관리 ---
+    def _open(self):
+        self._file = open(self.path, "r", encoding="utf-8")
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+
+    def _fill(self) -> bool:
+        """버퍼에 다음 청크 추가 (소비한 앞부분은 버림)"""
+        if self._eof:
+            return False
+        chunk = self._file.read(self.chunk_size)
+        if not chunk:
+            self._eof = True
+            return False
+        self._buffer = self._buffer[self._pos:] + chunk
+        self._pos = 0
+        return True
+
+    def _peek(self) -> str:
+        """공백을 건너뛰고 다음 문자 확인"""
+        while True:
+            while self._pos < len(self._buffer) and self._buffer[self._pos] in _WHITESPACE:
+                self._pos += 1
+            if self._pos < len(self._buffer):
+                return self._buffer[self._pos]
+            if not self._fill():
+                raise ValueError(f"스냅샷이 예상보다 일찍 끝났습니다: {self.path}")
+
+    def _expect(self, char: str):
+        if self._peek() != char:
+            raise ValueError(f"'{char}' 위치에 '{self._buffer[self._pos]}' 문자가 있습니다: {self.path}")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        """값 하나 디코딩 - 청크 경계에서 잘렸으면 더 읽고 재시도"""
+        self._peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # 숫자는 뒤따르는 구분 문자를 봐야 끝난 것 - "1." / "1e"처럼 버퍼 끝까지 이어지면 잘렸을 수 있음
+            if isinstance(value, (int, float)) and not self._eof:
+                tail = end
+                while tail < len(self._buffer) and self._buffer[tail] in _NUMBER_CHARS:
+                    tail += 1
+                if tail == len(self._buffer) and self._fill():
+                    continue
+            self._pos = end
+            return value
+
+    def _iter_list(self) -> Iterator[Any]:
+        """현재 위치의 배열을 원소 단위로 디코딩"""
+        self._expect("[")
+        if self._peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self._decode_value()
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("]")
+            return
+
+    def _iter_members(self) -> Iterator[Tuple[str, bool]]:
+        """최상위 키 순회 - (키, news_list 여부). 값은 호출 측이 소비"""
+        self._expect("{")
+        if self._peek() == "}":
+            return
+        while True:
+            key = self._decode_value()
+            self._expect(":")
+            yield key, key == LIST_KEY
+            if self._peek() == ",":
+                self._pos += 1
+                continue
+            self._expect("}")
+            return
+
+    # --- 공개 API ---
+    def read_header(self, keys: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """news_list를 제외한 최상위 필드 - keys를 주면 모두 찾는 즉시 중단"""
+        wanted = set(keys) if keys is not None else None
+        header: Dict[str, Any] = {}
+        self._open()
+        try:
+            for key, is_list in self._iter_members():
+                if is_list:
+                    # 원소 하나씩 디코딩 후 버림 (전체 배열을 만들지 않음)
+                    for _ in self._iter_list():
+                        pass
+                else:
+                    value = self._decode_value()
+                    if wanted is None or key in wanted:
+                        header[key] = value
+                if wanted is not None and wanted.issubset(header):
+                    break
+        finally:
+            self._file.close()
+        return header
+
+    def iter_articles(self) -> Iterator[Dict[str, Any]]:
+        """news_list 기사를 하나씩 반환"""
+        self._open()
+        try:
+            for key, is_list in self._iter_members():
+                if is_list:
+                    yield from self._iter_list()
+                    return
+                self._decode_value()
+        finally:
+            self._file.close()
@@ -38,4 +38,10 @@ if __name__ == "__main__":
     port = int(os.environ.get("PORT", 10000))
     print(f"🌐 서버 시작 - 포트: {port}")
     print(f"🔗 URL: http://0.0.0.0:{port}")
-    uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
+    workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+    if workers > 1:
+        # 워커 여러 개는 import 문자열로만 실행 가능 (리더 워커 하나만 수집)
+        print(f"👥 워커 수: {workers}")
+        uvicorn.run("web.api_server:app", host="0.0.0.0", port=port, workers=workers)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port) 
\ No newline at end of file
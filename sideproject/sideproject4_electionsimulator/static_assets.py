@@ -0,0 +1,225 @@
+"""
+Flutter 웹 번들 정적 파일 매니페스트
+- 서버 시작(lifespan) 시 디렉토리를 한 번 훑어 경로 -> 파일 정보(크기, 수정 시각, 콘텐츠 해시, MIME) 표를 만듦
+  (import 시점에는 만들지 않음 - 파일마다 해시를 계산하므로 워커 시작이 느려짐)
+- 요청마다 stat/exists를 하지 않고 표에서 바로 조회 (표에 없는 경로는 디렉토리 밖으로 나갈 수 없음)
+- 압축 가능한 파일은 gzip/brotli 사본을 미리 만들어 디스크 캐시에 보관 (빌드 시 만든 .gz/.br이 있으면 그대로 사용)
+"""
+
+import os
+import re
+import gzip
+import hashlib
+import logging
+import mimetypes
+import threading
+from pathlib import Path
+from datetime import datetime, timezone
+from typing import Dict, Optional, Tuple
+
+# brotli는 선택 의존성 (없으면 gzip 사본만 생성)
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+logger = logging.getLogger(__name__)
+
+# === 설정 ===
+STATIC_CACHE_DIR = Path(os.getenv("STATIC_CACHE_DIR", str(Path(__file__).parent / "cache" / "static")))
+STATIC_COMPRESS_MIN_BYTES = int(os.getenv("STATIC_COMPRESS_MIN_BYTES", "1024"))
+STATIC_BROTLI_QUALITY = int(os.getenv("STATIC_BROTLI_QUALITY", "11"))
+
+# 파일명에 콘텐츠 해시가 들어간 파일만 immutable (현재 Flutter 빌드는 해시 파일명을 만들지 않음)
+STATIC_IMMUTABLE_PATTERN = re.compile(os.getenv("STATIC_IMMUTABLE_PATTERN", r"\.[0-9a-f]{8,}\.[A-Za-z0-9]+$"))
+STATIC_IMMUTABLE_CACHE_CONTROL = os.getenv("STATIC_IMMUTABLE_CACHE_CONTROL", "public, max-age=31536000, immutable")
+# 해시 없는 파일은 배포 후 바로 바뀌어야 하므로 매번 ETag로 재검증 (변경 없으면 304)
+STATIC_CACHE_CONTROL = os.getenv("STATIC_CACHE_CONTROL", "no-cache")
+
+# 앱 진입점 - 새 배포를 가리키므로 항상 재검증
+ENTRY_POINTS = {
+    "index.html",
+    "flutter_bootstrap.js",
+    "flutter_service_worker.js",
+    "version.json",
+    "manifest.json",
+}
+
+# 표준 mimetypes 표에 없거나 플랫폼마다 다른 확장자
+for _mime_type, _extension in (
+    ("text/javascript", ".js"),
+    ("text/javascript", ".mjs"),
+    ("application/json", ".json"),
+    ("application/wasm", ".wasm"),
+    ("font/otf", ".otf"),
+    ("font/ttf", ".ttf"),
+    ("font/woff2", ".woff2"),
+    ("image/x-icon", ".ico"),
+    ("text/plain", ".symbols"),
+    ("application/octet-stream", ".bin"),
+    ("application/octet-stream", ".frag"),
+):
+    mimetypes.add_type(_mime_type, _extension)
+
+COMPRESSIBLE_TYPES = {
+    "text/javascript",
+    "application/javascript",
+    "application/json",
+    "application/manifest+json",
+    "application/wasm",
+    "application/xml",
+    "image/svg+xml",
+    "font/otf",
+    "font/ttf",
+}
+
+# 압축 결과가 원본의 이 비율보다 크면 사본을 쓰지 않음
+COMPRESSION_MIN_SAVING = 0.9
+
+def guess_media_type(relative_path: str) -> str:
+    media_type = mimetypes.guess_type(relative_path)[0]
+    if media_type is None:
+        # NOTICES 같은 확장자 없는 파일은 텍스트
+        return "text/plain" if "." not in Path(relative_path).name else "application/octet-stream"
+    return media_type
+
+def _is_compressible(media_type: str) -> bool:
+    return media_type.startswith("text/") or media_type in COMPRESSIBLE_TYPES
+
+def _file_digest(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+class StaticAsset:
+    """매니페스트 항목 하나 - 인코딩별 (파일 경로, stat) 보관"""
+
+    def __init__(self, relative_path: str, path: Path, stat: os.stat_result, digest: str):
+        self.relative_path = relative_path
+        self.path = path
+        self.stat = stat
+        self.digest = digest
+        self.media_type = guess_media_type(relative_path)
+        self.compressible = _is_compressible(self.media_type) and stat.st_size >= STATIC_COMPRESS_MIN_BYTES
+        self.last_modified = datetime.fromtimestamp(stat.st_mtime, tz=timezone.utc)
+        # 인코딩 -> (파일 경로, stat) - 압축이 끝나는 대로 추가됨
+        self.variants: Dict[str, Tuple[Path, os.stat_result]] = {}
+
+        name = Path(relative_path).name
+        if relative_path in ENTRY_POINTS:
+            self.cache_control = "no-cache"
+        elif STATIC_IMMUTABLE_PATTERN.search(name):
+            self.cache_control = STATIC_IMMUTABLE_CACHE_CONTROL
+        else:
+            self.cache_control = STATIC_CACHE_CONTROL
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """콘텐츠 해시 기반 강한 ETag (압축본은 바이트가 다르므로 별도 값)"""
+        return f'"{self.digest}-{encoding}"' if encoding else f'"{self.digest}"'
+
+    def select(self, accept_encoding: str) -> Tuple[Optional[str], Path, os.stat_result]:
+        """Accept-Encoding에 맞는 (인코딩, 파일, stat) 선택 - br > gzip > 원본"""
+        if self.variants:
+            accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+            for encoding in ("br", "gzip"):
+                if encoding in self.variants and encoding in accepted:
+                    path, stat = self.variants[encoding]
+                    return encoding, path, stat
+        return None, self.path, self.stat
+
+class StaticAssetManifest:
+    """정적 파일 표 + 백그라운드 사전 압축"""
+
+    def __init__(self, root: Path, cache_dir: Path = STATIC_CACHE_DIR):
+        self.root = root
+        self.cache_dir = cache_dir
+        self.assets: Dict[str, StaticAsset] = {}
+        self.loaded = False
+        self.compressed = 0
+        self._load_lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+
+    def load(self) -> None:
+        """표 생성 (한 번만) - 서버 시작 시 스레드에서 호출, 그 전에 조회되면 그때 생성"""
+        with self._load_lock:
+            if not self.loaded:
+                self.assets = self._build()
+                self.loaded = True
+
+    def _build(self) -> Dict[str, StaticAsset]:
+        assets: Dict[str, StaticAsset] = {}
+        total_bytes = 0
+        for path in sorted(self.root.rglob("*")):
+            relative_path = path.relative_to(self.root).as_posix()
+            # 숨김 파일(.last_build_id 등)과 빌드 시 만든 압축 사본은 직접 서빙하지 않음
+            if any(part.startswith(".") for part in Path(relative_path).parts):
+                continue
+            if path.suffix in (".gz", ".br") or not path.is_file():
+                continue
+            stat = path.stat()
+            assets[relative_path] = StaticAsset(relative_path, path, stat, _file_digest(path))
+            total_bytes += stat.st_size
+        logger.info(f"🗂️ 정적 파일 매니페스트 생성: {len(assets)}개 ({total_bytes / 1024 / 1024:.1f}MB)")
+        return assets
+
+    def get(self, relative_path: str) -> Optional[StaticAsset]:
+        """요청 경로 조회 - 디렉토리 경로는 그 안의 index.html"""
+        if not self.loaded:
+            self.load()
+        relative_path = relative_path.strip("/")
+        asset = self.assets.get(relative_path)
+        if asset is None:
+            asset = self.assets.get(f"{relative_path}/index.html" if relative_path else "index.html")
+        return asset
+
+    # --- 사전 압축 ---
+    def start_precompression(self) -> None:
+        """압축 사본 생성을 백그라운드 스레드로 시작 (끝나기 전까지는 원본으로 응답)"""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self.precompress, name="static-precompress", daemon=True)
+            self._thread.start()
+
+    def precompress(self) -> None:
+        self.load()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for asset in list(self.assets.values()):
+            if not asset.compressible:
+                continue
+            try:
+                self._attach_variant(asset, "gzip", ".gz", lambda body: gzip.compress(body, compresslevel=9, mtime=0))
+                if brotli is not None:
+                    self._attach_variant(asset, "br", ".br",
+                                         lambda body: brotli.compress(body, quality=STATIC_BROTLI_QUALITY))
+            except Exception as e:
+                logger.error(f"❌ 정적 파일 압축 실패 {asset.relative_path}: {str(e)}")
+        logger.info(f"🗜️ 정적 파일 사전 압축 완료: {self.compressed}개 사본")
+
+    def _attach_variant(self, asset: StaticAsset, encoding: str, suffix: str, compress) -> None:
+        # 빌드 단계에서 만든 사본이 원본보다 새로우면 우선 사용
+        prebuilt = asset.path.with_name(asset.path.name + suffix)
+        if prebuilt.is_file() and prebuilt.stat().st_mtime >= asset.stat.st_mtime:
+            target = prebuilt
+        else:
+            # 콘텐츠 해시가 파일명이므로 재시작/다른 워커가 만든 사본을 재사용
+            target = self.cache_dir / f"{asset.digest}{suffix}"
+            if not target.is_file():
+                body = compress(asset.path.read_bytes())
+                if len(body) > asset.stat.st_size * COMPRESSION_MIN_SAVING:
+                    return
+                tmp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+                tmp_path.write_bytes(body)
+                os.replace(tmp_path, target)
+        asset.variants[encoding] = (target, target.stat())
+        self.compressed += 1
+
+    def get_status(self) -> dict:
+        return {
+            "root": str(self.root),
+            "loaded": self.loaded,
+            "files": len(self.assets),
+            "compressed_variants": self.compressed,
+            "precompressing": self._thread is not None and self._thread.is_alive(),
+            "brotli": brotli is not None
+        }
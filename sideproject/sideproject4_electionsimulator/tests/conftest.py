@@ -0,0 +1,20 @@
+"""
+테스트 공통 설정
+- 프로젝트 루트와 web/ 을 import 경로에 추가
+- news_scraper/api_server는 import 시 작업 디렉토리에 cache/, assets/ 를 만들므로 임시 디렉토리에서 실행
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(PROJECT_DIR))
+sys.path.insert(0, str(PROJECT_DIR / "web"))
+
+WORK_DIR = Path(tempfile.mkdtemp(prefix="electionsim-tests-"))
+os.environ.setdefault("HISTORY_DB_PATH", str(WORK_DIR / "trend_history.db"))
+os.environ.setdefault("SHARED_STATE_DIR", str(WORK_DIR / "shared"))
+os.environ.setdefault("STATIC_CACHE_DIR", str(WORK_DIR / "static"))
+os.chdir(WORK_DIR)
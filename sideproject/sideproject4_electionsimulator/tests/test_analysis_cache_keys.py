@@ -0,0 +1,54 @@
+from news_scraper import NewsAnalyzer, NewsArticle, SQLiteCache
+
+def article(title, description, url, source=""):
+    return NewsArticle(title=title, description=description, url=url,
+                       published_date="", source=source, query="대선")
+
+def test_same_content_shares_a_key_across_urls():
+    a = article("[속보] 이재명 후보 공약 발표", "내용", "https://a.example/1", "A일보")
+    b = article("이재명 후보 공약 발표", "내용", "https://b.example/2", "B일보")
+    assert a.content_id == b.content_id
+    assert a.unique_id != b.unique_id
+
+def test_empty_normalized_text_falls_back_to_url_id():
+    a = article("!!!", "", "https://a.example/1")
+    b = article("[속보]", "...", "https://b.example/2")
+    assert a.normalized_text == "" and b.normalized_text == ""
+    assert a.content_id == a.unique_id
+    assert a.content_id != b.content_id
+
+def make_analyzer(tmp_path):
+    analyzer = NewsAnalyzer()
+    analyzer.cache = SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=None)
+    return analyzer
+
+def test_legacy_url_key_is_used_and_promoted(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    item = article("김문수 후보 토론", "토론회 발언", "https://a.example/1")
+    # 업그레이드 전에는 URL 기반 키로 저장됨
+    analyzer.cache.put(item.unique_id, "summary", "기존 요약")
+    analyzer.cache.put(item.unique_id, "sentiment", "부정")
+
+    result = analyzer.analyze_article(item.content_id, item.title, item.description, legacy_id=item.unique_id)
+    assert result == {"summary": "기존 요약", "sentiment": "부정"}
+    # 새 키로 옮겨 저장되어 다음부터는 바로 적중
+    assert analyzer.cache.get(item.content_id, "summary") == "기존 요약"
+
+def test_batch_lookup_uses_legacy_ids(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    items = [article("이준석 후보 지지율", "상승", "https://a.example/1"),
+             article("대선 일정", "안내", "https://a.example/2")]
+    analyzer.cache.put(items[0].unique_id, "sentiment", "긍정")
+    analyzer.cache.put(items[1].content_id, "sentiment", "중립")
+    results = analyzer.analyze_sentiments_batch(
+        [(item.content_id, item.title, item.description) for item in items],
+        legacy_ids=[item.unique_id for item in items]
+    )
+    assert results == ["긍정", "중립"]
+
+def test_new_key_wins_over_legacy_key(tmp_path):
+    analyzer = make_analyzer(tmp_path)
+    item = article("이재명 후보", "유세", "https://a.example/1")
+    analyzer.cache.put(item.unique_id, "summary", "오래된 요약")
+    analyzer.cache.put(item.content_id, "summary", "새 요약")
+    assert analyzer.summarize_news(item.content_id, item.title, item.description, legacy_id=item.unique_id) == "새 요약"
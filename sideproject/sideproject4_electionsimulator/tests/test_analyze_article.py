@@ -0,0 +1,56 @@
+import types
+
+import pytest
+
+import news_scraper
+from news_scraper import NewsAnalyzer, RateLimiter, SQLiteCache
+
+@pytest.fixture
+def analyzer_with_reply(monkeypatch, tmp_path):
+    def build(content):
+        calls = []
+
+        def create(**kwargs):
+            calls.append(kwargs)
+            return types.SimpleNamespace(
+                usage=None,
+                choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))]
+            )
+
+        client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+        monkeypatch.setattr(news_scraper, "openai_client", client)
+        analyzer = NewsAnalyzer()
+        analyzer.cache = SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=None)
+        analyzer.rate_limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100000)
+        analyzer.calls = calls
+        return analyzer
+    return build
+
+def test_combined_reply_fills_both_cache_entries(analyzer_with_reply):
+    analyzer = analyzer_with_reply('{"summary": "공약을 발표했다.", "sentiment": "긍정"}')
+    result = analyzer.analyze_article("a1", "이재명 후보 공약", "새 공약 발표")
+    assert result == {"summary": "공약을 발표했다.", "sentiment": "긍정"}
+    assert len(analyzer.calls) == 1
+    assert analyzer.calls[0]["response_format"] == {"type": "json_object"}
+    assert analyzer.cache.get("a1", "summary") == "공약을 발표했다."
+    assert analyzer.cache.get("a1", "sentiment") == "긍정"
+
+    # 두 항목 모두 캐시에 있으므로 다시 호출하지 않음
+    assert analyzer.analyze_article("a1", "이재명 후보 공약", "새 공약 발표") == result
+    assert len(analyzer.calls) == 1
+
+def test_invalid_sentiment_label_uses_rules_but_keeps_summary(analyzer_with_reply):
+    analyzer = analyzer_with_reply('{"summary": "의혹이 제기됐다.", "sentiment": "모름"}')
+    result = analyzer.analyze_article("a2", "김문수 후보", "의혹 제기와 비판")
+    assert result == {"summary": "의혹이 제기됐다.", "sentiment": "부정"}
+    assert analyzer.cache.get("a2", "sentiment") == "부정"
+
+@pytest.mark.parametrize("content", ["{not json", "요약: 긍정"])
+def test_unparsable_reply_falls_back_to_rules(analyzer_with_reply, content):
+    analyzer = analyzer_with_reply(content)
+    result = analyzer.analyze_article("a3", "김문수 후보 논란", "의혹 제기와 비판")
+    assert result["sentiment"] == analyzer._rule_based_sentiment("김문수 후보 논란", "의혹 제기와 비판") == "부정"
+    assert result["summary"] == analyzer._fallback_summary("의혹 제기와 비판")
+    # 대체 결과는 캐시하지 않아 다음 실행에서 다시 분석
+    assert analyzer.cache.get("a3", "summary") is None
+    assert analyzer.cache.get("a3", "sentiment") is None
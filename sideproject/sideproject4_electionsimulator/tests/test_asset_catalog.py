@@ -0,0 +1,79 @@
+import os
+import types
+from datetime import datetime
+
+import pytest
+
+import api_server
+from api_server import AssetCatalog
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(api_server, "time", types.SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+def touch(directory, name, dir_mtime_ns):
+    (directory / name).write_text("{}", encoding="utf-8")
+    # 파일 시스템 mtime 해상도와 관계없이 디렉토리 변경이 보이도록 지정
+    os.utime(directory, ns=(dir_mtime_ns, dir_mtime_ns))
+
+def test_latest_and_date_lookup(tmp_path, clock):
+    today = datetime.now().strftime("%Y-%m-%d")
+    for name in ("trend_summary_2026-06-02_23-50.json", f"trend_summary_{today}_08-00.json",
+                 f"trend_summary_{today}_09-30.json", "trend_summary_default.json", "other.json"):
+        (tmp_path / name).write_text("{}", encoding="utf-8")
+
+    catalog = AssetCatalog(tmp_path, poll_seconds=10)
+    assert catalog.latest() == tmp_path / f"trend_summary_{today}_09-30.json"
+    assert sorted(path.name for path in catalog.files_for_date(today)) == [
+        f"trend_summary_{today}_08-00.json", f"trend_summary_{today}_09-30.json"]
+    assert [path.name for path in catalog.files_for_date("2026-06-02")] == ["trend_summary_2026-06-02_23-50.json"]
+    assert catalog.files_for_date("2026-01-01") == []
+    assert len(catalog) == 3
+    assert [name for name, _, _ in catalog.snapshots()][0] == "trend_summary_2026-06-02_23-50.json"
+
+def test_new_file_is_seen_after_poll_interval(tmp_path, clock):
+    touch(tmp_path, "trend_summary_2026-06-03_08-00.json", 1_000_000_000)
+    catalog = AssetCatalog(tmp_path, poll_seconds=10)
+    assert catalog.latest().name == "trend_summary_2026-06-03_08-00.json"
+
+    touch(tmp_path, "trend_summary_2026-06-03_09-00.json", 2_000_000_000)
+    clock[0] += 5
+    assert catalog.latest().name == "trend_summary_2026-06-03_08-00.json"  # 폴링 주기 전에는 이전 인덱스
+    clock[0] += 5
+    assert catalog.latest().name == "trend_summary_2026-06-03_09-00.json"
+    assert len(catalog) == 2
+
+def test_unchanged_directory_is_not_rescanned(tmp_path, clock, monkeypatch):
+    touch(tmp_path, "trend_summary_2026-06-03_08-00.json", 1_000_000_000)
+    catalog = AssetCatalog(tmp_path, poll_seconds=10)
+    catalog.refresh()
+
+    def rescan():
+        raise AssertionError("디렉토리가 그대로면 다시 스캔하지 않아야 함")
+
+    monkeypatch.setattr(catalog, "_rebuild", rescan)
+    clock[0] += 60
+    assert catalog.latest().name == "trend_summary_2026-06-03_08-00.json"
+
+def test_deleted_files_drop_out(tmp_path, clock):
+    touch(tmp_path, "trend_summary_2026-06-03_08-00.json", 1_000_000_000)
+    touch(tmp_path, "trend_summary_2026-06-03_09-00.json", 2_000_000_000)
+    catalog = AssetCatalog(tmp_path, poll_seconds=10)
+    assert catalog.latest().name == "trend_summary_2026-06-03_09-00.json"
+
+    (tmp_path / "trend_summary_2026-06-03_09-00.json").unlink()
+    os.utime(tmp_path, ns=(3_000_000_000, 3_000_000_000))
+    clock[0] += 10
+    assert catalog.latest().name == "trend_summary_2026-06-03_08-00.json"
+    assert [path.name for path in catalog.files_for_date("2026-06-03")] == ["trend_summary_2026-06-03_08-00.json"]
+
+    (tmp_path / "trend_summary_2026-06-03_08-00.json").unlink()
+    catalog.refresh(force=True)
+    assert catalog.latest() is None and len(catalog) == 0
+
+def test_missing_directory_is_empty(tmp_path, clock):
+    catalog = AssetCatalog(tmp_path / "missing")
+    assert catalog.latest() is None
+    assert catalog.snapshots() == []
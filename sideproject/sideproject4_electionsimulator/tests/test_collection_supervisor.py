@@ -0,0 +1,101 @@
+import asyncio
+import threading
+
+import pytest
+
+import api_server
+from api_server import CollectionSupervisor
+
+@pytest.fixture
+def collection(monkeypatch):
+    """release될 때까지 멈춰 있는 수집 - result로 반환값 지정"""
+    state = {"calls": 0, "result": True, "release": threading.Event()}
+
+    def force_news_collection():
+        state["calls"] += 1
+        assert state["release"].wait(5)
+        if isinstance(state["result"], Exception):
+            raise state["result"]
+        return state["result"]
+
+    monkeypatch.setattr(api_server, "shared_state", None)
+    monkeypatch.setattr(api_server, "force_news_collection", force_news_collection)
+    return state
+
+def test_requests_attach_to_the_running_collection(collection):
+    async def scenario():
+        supervisor = CollectionSupervisor(debounce_seconds=60)
+        assert supervisor.get_status()["state"] == "idle"
+
+        first = supervisor.trigger("startup")
+        second = supervisor.trigger("manual_refresh")
+        third = supervisor.trigger("stale_cache")
+        assert [first["action"], second["action"], third["action"]] == ["started", "attached", "attached"]
+        assert first["run_id"] == second["run_id"] == third["run_id"] == 1
+        assert first["state"] == "running" and first["reason"] == "startup"
+        assert first["started_at"] is not None and first["finished_at"] is None
+        assert third["attached_requests"] == 2
+
+        collection["release"].set()
+        assert await supervisor.wait(5)
+        return supervisor.get_status()
+
+    status = asyncio.run(scenario())
+    assert collection["calls"] == 1
+    assert status["state"] == "succeeded" and status["reason"] == "startup"
+    assert status["finished_at"] is not None and status["elapsed_seconds"] >= 0
+
+def test_requests_right_after_a_run_are_debounced(collection):
+    collection["release"].set()
+
+    async def scenario(debounce_seconds):
+        supervisor = CollectionSupervisor(debounce_seconds=debounce_seconds)
+        supervisor.trigger("startup")
+        await supervisor.wait(5)
+        handle = supervisor.trigger("manual_refresh")
+        await supervisor.wait(5)
+        return handle
+
+    handle = asyncio.run(scenario(60))
+    assert handle["action"] == "debounced"
+    assert handle["run_id"] == 1 and handle["state"] == "succeeded"
+    assert collection["calls"] == 1
+
+    handle = asyncio.run(scenario(0))
+    assert handle["action"] == "started" and handle["run_id"] == 2
+    assert collection["calls"] == 3
+
+@pytest.mark.parametrize("result, state, error", [
+    (False, "failed", None),
+    (None, "busy", None),
+    (RuntimeError("디스크 가득 참"), "failed", "디스크 가득 참"),
+])
+def test_final_state(collection, result, state, error):
+    collection["result"] = result
+    collection["release"].set()
+
+    async def scenario():
+        supervisor = CollectionSupervisor()
+        supervisor.trigger("startup")
+        await supervisor.wait(5)
+        return supervisor.get_status()
+
+    status = asyncio.run(scenario())
+    assert status["state"] == state
+    assert status["last_error"] == error
+
+def test_held_lock_reports_busy_instead_of_failed(monkeypatch):
+    monkeypatch.setattr(api_server, "shared_state", None)
+
+    async def scenario():
+        supervisor = CollectionSupervisor()
+        # 증분 수집이 실행 중인 상황
+        assert api_server._collection_lock.acquire(blocking=False)
+        try:
+            supervisor.trigger("manual_refresh")
+            await supervisor.wait(5)
+        finally:
+            api_server._collection_lock.release()
+        return supervisor.get_status()
+
+    assert asyncio.run(scenario())["state"] == "busy"
@@ -0,0 +1,157 @@
+import asyncio
+
+from cors_layer import CORSLayer
+
+ALLOWED = "https://app.example"
+
+class App:
+    """호출 여부를 기록하고 Vary: Accept-Encoding 헤더가 있는 200 응답"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": [(b"content-type", b"application/json"), (b"vary", b"Accept-Encoding")]})
+        await send({"type": "http.response.body", "body": b"{}"})
+
+def call(layer, method="GET", origin=None, request_headers=None, request_method=None):
+    headers = []
+    if origin is not None:
+        headers.append((b"origin", origin.encode()))
+    if request_method is not None:
+        headers.append((b"access-control-request-method", request_method.encode()))
+    if request_headers is not None:
+        headers.append((b"access-control-request-headers", request_headers.encode()))
+    scope = {"type": "http", "method": method, "path": "/api/news", "headers": headers}
+    messages = []
+
+    async def receive():
+        return {"type": "http.disconnect"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(layer(scope, receive, send))
+    start = messages[0]
+    return start["status"], {name.decode(): value.decode() for name, value in start["headers"]}
+
+def preflight(layer, origin, request_headers=None, request_method="POST"):
+    return call(layer, "OPTIONS", origin, request_headers, request_method)
+
+def credentialed(app, origins=(ALLOWED,)):
+    return CORSLayer(app, allow_origins=origins, allow_methods=["GET", "POST"], allow_headers=["*"],
+                     expose_headers=["ETag", "Content-Range"], allow_credentials=True, max_age=600)
+
+def test_preflight_is_answered_without_app():
+    app = App()
+    status, headers = preflight(credentialed(app), ALLOWED, "content-type, x-requested-with")
+    assert status == 204 and app.calls == 0
+    assert headers["access-control-allow-origin"] == ALLOWED
+    assert headers["access-control-allow-credentials"] == "true"
+    assert headers["access-control-allow-methods"] == "GET, POST"
+    assert headers["access-control-max-age"] == "600"
+    # 자격 증명 모드에서 '*'는 와일드카드가 아니므로 요청 헤더를 그대로 허용
+    assert headers["access-control-allow-headers"] == "content-type, x-requested-with"
+    assert headers["vary"] == "Origin"
+
+def test_preflight_cache_keeps_request_headers_apart():
+    layer = credentialed(App())
+    _, first = preflight(layer, ALLOWED, "content-type")
+    _, second = preflight(layer, ALLOWED, "authorization")
+    _, again = preflight(layer, ALLOWED, "content-type")
+    assert first["access-control-allow-headers"] == again["access-control-allow-headers"] == "content-type"
+    assert second["access-control-allow-headers"] == "authorization"
+
+def test_preflight_from_unknown_origin_has_no_cors_headers():
+    app = App()
+    status, headers = preflight(credentialed(app), "https://evil.example", "content-type")
+    assert status == 204 and app.calls == 0
+    assert headers == {"allow": "GET, POST", "content-length": "0"}
+
+def test_options_without_preflight_headers_reaches_app():
+    app = App()
+    layer = credentialed(app)
+    status, headers = call(layer, "OPTIONS")
+    assert status == 200 and app.calls == 1
+    assert "access-control-allow-origin" not in headers
+    # Access-Control-Request-Method가 없으면 프리플라이트가 아님
+    status, headers = call(layer, "OPTIONS", ALLOWED)
+    assert status == 200 and app.calls == 2
+    assert headers["access-control-allow-origin"] == ALLOWED
+    assert "access-control-max-age" not in headers
+
+def test_simple_request_echoes_allowed_origin():
+    app = App()
+    status, headers = call(credentialed(app), "GET", ALLOWED)
+    assert status == 200 and app.calls == 1
+    assert headers["access-control-allow-origin"] == ALLOWED
+    assert headers["access-control-allow-credentials"] == "true"
+    assert headers["access-control-expose-headers"] == "ETag, Content-Range"
+    assert headers["vary"] == "Accept-Encoding, Origin"
+
+def test_unknown_origin_still_varies_on_origin():
+    _, headers = call(credentialed(App()), "GET", "https://evil.example")
+    assert "access-control-allow-origin" not in headers
+    assert headers["vary"] == "Accept-Encoding, Origin"
+    _, headers = call(credentialed(App()), "GET")
+    assert headers["vary"] == "Accept-Encoding, Origin"
+
+def test_wildcard_with_credentials_returns_literal_wildcard():
+    layer = credentialed(App(), origins=["*"])
+    _, headers = call(layer, "GET", "https://any.example")
+    assert headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in headers
+    assert headers["access-control-expose-headers"] == "ETag, Content-Range"
+    assert headers["vary"] == "Accept-Encoding"
+
+    _, headers = preflight(layer, "https://any.example", "content-type")
+    assert headers["access-control-allow-origin"] == "*"
+    assert headers["access-control-allow-headers"] == "*"
+    assert "access-control-allow-credentials" not in headers
+
+def test_listed_origins_are_echoed_next_to_wildcard():
+    layer = credentialed(App(), origins=[ALLOWED, "*"])
+    _, headers = call(layer, "GET", ALLOWED)
+    assert headers["access-control-allow-origin"] == ALLOWED
+    assert headers["access-control-allow-credentials"] == "true"
+    assert headers["vary"] == "Accept-Encoding, Origin"
+
+    _, headers = call(layer, "GET", "https://any.example")
+    assert headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in headers
+    assert headers["vary"] == "Accept-Encoding, Origin"
+
+    _, listed = preflight(layer, ALLOWED, "content-type")
+    _, other = preflight(layer, "https://any.example", "content-type")
+    assert listed["access-control-allow-headers"] == "content-type"
+    assert other["access-control-allow-headers"] == "*"
+    assert "access-control-allow-credentials" not in other
+
+def test_wildcard_without_credentials():
+    layer = CORSLayer(App(), allow_origins=["*"], allow_methods=["GET"], allow_headers=["*"])
+    _, headers = call(layer, "GET", "https://any.example")
+    assert headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in headers
+    assert headers["vary"] == "Accept-Encoding"
+
+    _, headers = preflight(layer, "https://any.example", "content-type")
+    assert headers["access-control-allow-origin"] == "*"
+    assert headers["access-control-allow-headers"] == "*"
+    assert "vary" not in headers
+
+def test_explicit_allow_headers():
+    layer = CORSLayer(App(), allow_origins=[ALLOWED], allow_methods=["GET"], allow_headers=["Content-Type", "X-Token"],
+                      allow_credentials=True)
+    _, headers = preflight(layer, ALLOWED, "x-other")
+    assert headers["access-control-allow-headers"] == "Content-Type, X-Token"
+
+def test_non_http_scope_passes_through():
+    seen = []
+
+    async def app(scope, receive, send):
+        seen.append(scope["type"])
+
+    asyncio.run(credentialed(app)({"type": "lifespan"}, None, None))
+    assert seen == ["lifespan"]
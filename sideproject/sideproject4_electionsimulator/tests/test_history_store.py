@@ -0,0 +1,90 @@
+import asyncio
+import os
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from starlette.requests import Request
+
+import api_server
+from history_store import HistoryStore, _to_utc_naive
+
+KST = timezone(timedelta(hours=9))
+
+@pytest.fixture
+def seoul_local_time(monkeypatch):
+    """서버 로컬 시간대를 UTC+9로 고정"""
+    monkeypatch.setenv("TZ", "Asia/Seoul")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+def test_naive_values_are_local_time(seoul_local_time):
+    assert _to_utc_naive(datetime(2026, 6, 3, 9, 0)) == datetime(2026, 6, 3, 0, 0)
+    assert _to_utc_naive(datetime(2026, 6, 3, 9, 0, tzinfo=KST)) == datetime(2026, 6, 3, 0, 0)
+    assert _to_utc_naive(datetime(2026, 6, 3, 0, 0, tzinfo=timezone.utc)) == datetime(2026, 6, 3, 0, 0)
+
+def snapshot():
+    return {
+        "candidate_stats": {"이재명": {"긍정": 1, "부정": 0, "중립": 0}},
+        "total_articles": 2,
+        "time_range": "2026-06-03",
+        "news_list": [
+            # 발행 시각이 있는 기사는 UTC로, 없는 기사는 수집 시각(로컬)으로 적재
+            {"url": "https://news.example/1", "title": "이재명 유세", "sentiment": "긍정",
+             "published_date": "Wed, 03 Jun 2026 01:30:00 GMT"},
+            {"url": "https://news.example/2", "title": "이재명 토론", "sentiment": "부정"},
+        ],
+    }
+
+def test_naive_and_aware_inputs_share_one_timeline(tmp_path, seoul_local_time):
+    store = HistoryStore(tmp_path / "history.db")
+    # 로컬(UTC+9) 12:00 = UTC 03:00
+    assert store.ingest_snapshot("run-1", datetime(2026, 6, 3, 12, 0), snapshot())
+
+    result = store.query(datetime(2026, 6, 3, 0, 0, tzinfo=timezone.utc),
+                         datetime(2026, 6, 3, 4, 0, tzinfo=timezone.utc), bucket="hour")
+    assert [run["collected_at"] for run in result["runs"]] == ["2026-06-03 03:00:00"]
+    assert [entry["bucket"] for entry in result["series"]] == ["2026-06-03T01:00", "2026-06-03T03:00"]
+
+    # 같은 구간을 로컬 naive 값으로 물어도 결과가 같음
+    local = store.query(datetime(2026, 6, 3, 9, 0), datetime(2026, 6, 3, 13, 0), bucket="hour")
+    assert local["series"] == result["series"]
+    assert local["runs"] == result["runs"]
+
+def test_history_endpoint_accepts_offsets_without_to(tmp_path, monkeypatch):
+    store = HistoryStore(tmp_path / "history.db")
+    store.ingest_snapshot("run-1", datetime.now(timezone.utc) - timedelta(hours=1), snapshot())
+    monkeypatch.setattr(api_server, "history_store", store)
+    monkeypatch.setattr(api_server.asset_catalog, "snapshots", lambda: [])
+
+    request = Request({"type": "http", "method": "GET", "path": "/api/history", "headers": []})
+    start = (datetime.now(KST) - timedelta(days=1)).isoformat()
+    response = asyncio.run(api_server.get_history(request, from_=start, to=None, candidate=None, bucket="day"))
+
+    assert response.status_code == 200
+    assert b"run-1" in response.body
+
+def test_mentions_match_trend_aggregator(tmp_path):
+    from news_scraper import TrendAggregator
+
+    published = "Wed, 03 Jun 2026 01:30:00 GMT"
+    news_list = [
+        {"url": "u1", "title": "이재명·김문수 토론", "summary": "", "sentiment": "긍정", "published_date": published},
+        {"url": "u2", "title": "대선 일정", "summary": "이준석 후보 유세", "sentiment": "부정", "published_date": published},
+        {"url": "u3", "title": "여론조사 발표", "summary": "", "sentiment": "중립", "published_date": published},
+    ]
+    aggregator = TrendAggregator(news_list)
+    data = {"candidate_stats": aggregator.candidate_stats(), "total_articles": 3,
+            "time_range": "2026-06-03", "news_list": news_list}
+    store = HistoryStore(tmp_path / "history.db")
+    store.ingest_snapshot("run-1", datetime(2026, 6, 3, 2, 0, tzinfo=timezone.utc), data)
+
+    result = store.query(datetime(2026, 6, 3, tzinfo=timezone.utc), datetime(2026, 6, 4, tzinfo=timezone.utc))
+    (day,) = result["series"]
+    mentions = {name: {s: stats[s] for s in ("긍정", "부정", "중립")} for name, stats in day["candidates"].items()}
+    expected = {name: stats for name, stats in aggregator.candidate_stats().items() if sum(stats.values())}
+    assert mentions == expected == {"이재명": {"긍정": 1, "부정": 0, "중립": 0},
+                                    "김문수": {"긍정": 1, "부정": 0, "중립": 0},
+                                    "이준석": {"긍정": 0, "부정": 1, "중립": 0}}
@@ -0,0 +1,227 @@
+import types
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+
+import news_scraper
+from news_scraper import NewsCollector, NewsPipeline, SEARCH_QUERIES
+
+KST = timezone(timedelta(hours=9))
+
+def rfc2822(value: datetime) -> str:
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+class FakeGNews:
+    """키워드별로 지정한 (url, 발행 시각) 기사를 반환"""
+
+    def __init__(self, results=None):
+        self.results = results or {}
+
+    def get_news(self, query):
+        return [
+            {"title": f"이재명 {url}", "description": "", "url": url,
+             "published date": rfc2822(published) if published else "", "publisher": {"title": "언론사"}}
+            for url, published in self.results.get(query, [])
+        ]
+
+def collector(results):
+    news_collector = NewsCollector(max_workers=1)
+    news_collector.gnews = FakeGNews(results)
+    return news_collector
+
+def test_old_articles_are_skipped_per_query_and_not_counted(monkeypatch):
+    monkeypatch.setattr(news_scraper, "TARGET_ARTICLE_COUNT", 2)
+    mark = datetime(2026, 6, 3, 12, 0, tzinfo=KST)
+    news_collector = collector({
+        # 검색 결과가 발행 시각 순이 아니어도 새 기사는 모두 반환
+        SEARCH_QUERIES[0]: [("old-1", mark - timedelta(hours=1)), ("new-1", mark + timedelta(minutes=1)),
+                            ("old-2", mark), ("undated", None)],
+        SEARCH_QUERIES[1]: [("old-3", mark - timedelta(days=1)), ("new-2", mark + timedelta(hours=2))],
+    })
+
+    urls = [article.url for article in news_collector.iter_all_news(published_after=mark)]
+    assert urls == ["new-1", "undated"]
+    assert news_collector.skipped_old == 2
+
+    monkeypatch.setattr(news_scraper, "TARGET_ARTICLE_COUNT", 10)
+    urls = [article.url for article in news_collector.iter_all_news(published_after=mark)]
+    assert urls == ["new-1", "undated", "new-2"]
+    assert news_collector.skipped_old == 3
+
+def test_naive_mark_is_local_time():
+    mark = datetime(2026, 6, 3, 3, 0, tzinfo=timezone.utc)
+    news_collector = collector({SEARCH_QUERIES[0]: [("a", mark - timedelta(minutes=1)), ("b", mark + timedelta(minutes=1))]})
+    naive_local = mark.astimezone().replace(tzinfo=None)
+    assert [article.url for article in news_collector.iter_all_news(published_after=naive_local)] == ["b"]
+
+@pytest.fixture
+def pipeline(monkeypatch):
+    news_pipeline = NewsPipeline()
+    saved = []
+
+    def process_articles(articles, *args):
+        return [{"url": a.url, "title": a.title, "summary": "", "sentiment": "긍정",
+                 "source": a.source, "published_date": a.published_date} for a in articles]
+
+    summaries = []
+
+    def create_final_summary(batch_summaries, time_range):
+        summaries.append(time_range)
+        return f"요약 {len(summaries)}"
+
+    monkeypatch.setattr(news_pipeline, "process_articles", process_articles)
+    monkeypatch.setattr(news_pipeline.analyzer, "_summarize_news_batch", lambda batch, i, total: f"배치 {i}")
+    monkeypatch.setattr(news_pipeline.analyzer, "_create_final_summary", create_final_summary)
+    monkeypatch.setattr(news_pipeline, "save_trend_summary", saved.append)
+    news_pipeline.saved = saved
+    news_pipeline.summaries = summaries
+    return news_pipeline
+
+def article(url, published):
+    return {"url": url, "title": f"이재명 {url}", "summary": "", "sentiment": "부정",
+            "source": "언론사", "published_date": rfc2822(published)}
+
+def unread(*_):
+    raise AssertionError("윈도우가 있으면 이전 스냅샷을 읽지 않아야 함")
+    yield
+
+def test_window_is_kept_across_runs(pipeline):
+    now = datetime.now(timezone.utc)
+    window = timedelta(hours=6)
+    previous = [article("kept", now - timedelta(hours=1)), article("expiring", now - timedelta(hours=5, minutes=30))]
+
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("kept", now - timedelta(hours=1)), ("new-1", now - timedelta(minutes=30))]})
+    first = pipeline.run_incremental_collection(iter(previous), None, window)
+    assert first["new_articles"] == 1 and first["expired"] == 0
+    assert [a["url"] for a in pipeline.saved[-1]["news_list"]] == ["new-1", "kept", "expiring"]
+    assert datetime.fromisoformat(first["high_water_mark"]) == (now - timedelta(minutes=30)).replace(microsecond=0)
+    assert datetime.fromisoformat(first["high_water_mark"]).utcoffset() == timedelta(0)
+
+    # 두 번째 실행: 이전 스냅샷을 다시 읽지 않고 새 기사 추가 + 만료만 반영
+    aggregator = pipeline._window_aggregator
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("new-1", now - timedelta(minutes=30)),
+                                                        ("new-2", now - timedelta(minutes=5))]})
+    # 윈도우를 줄여 시간이 흐른 것처럼 'expiring'을 윈도우 밖으로 밀어냄
+    second = pipeline.run_incremental_collection(unread(), datetime.fromisoformat(first["high_water_mark"]),
+                                                 timedelta(hours=5))
+    assert pipeline._window_aggregator is aggregator
+    assert second["new_articles"] == 1 and second["skipped_old"] == 1 and second["expired"] == 1
+    assert [a["url"] for a in pipeline.saved[-1]["news_list"]] == ["new-2", "new-1", "kept"]
+    assert pipeline.saved[-1]["candidate_stats"]["이재명"] == {"긍정": 2, "부정": 1, "중립": 0}
+
+def test_run_without_changes_does_not_save(pipeline):
+    now = datetime.now(timezone.utc)
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("a", now - timedelta(hours=1))]})
+    first = pipeline.run_incremental_collection([], None, timedelta(hours=6))
+    second = pipeline.run_incremental_collection(unread(), datetime.fromisoformat(first["high_water_mark"]), timedelta(hours=6))
+    assert second["saved"] is False and second["fetched"] == 1 and second["new_articles"] == 0
+    assert len(pipeline.saved) == 1
+
+def test_failure_resets_window(pipeline, monkeypatch):
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("a", datetime.now(timezone.utc))]})
+
+    def fail(trend_data):
+        raise OSError("디스크 가득 참")
+
+    monkeypatch.setattr(pipeline, "save_trend_summary", fail)
+    with pytest.raises(OSError):
+        pipeline.run_incremental_collection([], None, timedelta(hours=6))
+    assert pipeline._window_aggregator is None
+
+def test_summary_is_reused_until_stats_change_materially(pipeline, monkeypatch):
+    now = datetime.now(timezone.utc)
+    previous = [article(f"old-{i}", now - timedelta(hours=2)) for i in range(20)]
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("new-1", now - timedelta(minutes=30))]})
+    first = pipeline.run_incremental_collection(previous, None, timedelta(hours=6))
+    assert first["summary_refreshed"] and pipeline.saved[-1]["trend_summary"] == "요약 1"
+
+    # 21개 중 1개 변화 - 직전 요약 재사용 (LLM 호출 없음)
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("new-2", now - timedelta(minutes=10))]})
+    second = pipeline.run_incremental_collection(unread(), datetime.fromisoformat(first["high_water_mark"]), timedelta(hours=6))
+    assert second["saved"] and not second["summary_refreshed"]
+    assert pipeline.saved[-1]["trend_summary"] == "요약 1" and len(pipeline.summaries) == 1
+    assert pipeline.saved[-1]["candidate_stats"]["이재명"]["긍정"] == 2
+
+    # 누적 변화가 윈도우의 10%를 넘으면 다시 생성
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [(f"burst-{i}", now - timedelta(minutes=5)) for i in range(3)]})
+    third = pipeline.run_incremental_collection(unread(), datetime.fromisoformat(second["high_water_mark"]), timedelta(hours=6))
+    assert third["summary_refreshed"] and pipeline.saved[-1]["trend_summary"] == "요약 2"
+
+    # 요약이 오래되면 작은 변화에도 다시 생성
+    monkeypatch.setattr(news_scraper, "INCREMENTAL_SUMMARY_MAX_AGE_MINUTES", 0)
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("late", now - timedelta(minutes=1))]})
+    fourth = pipeline.run_incremental_collection(unread(), datetime.fromisoformat(third["high_water_mark"]), timedelta(hours=6))
+    assert fourth["summary_refreshed"] and len(pipeline.summaries) == 3
+
+def test_trend_summary_calls_count_against_the_daily_budget(monkeypatch):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        message = types.SimpleNamespace(content="요약")
+        return types.SimpleNamespace(usage=None, choices=[types.SimpleNamespace(message=message)])
+
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    monkeypatch.setattr(news_scraper, "openai_client", client)
+    analyzer = news_scraper.NewsAnalyzer()
+    analyzer.rate_limiter = news_scraper.RateLimiter(requests_per_minute=1000, tokens_per_minute=100000)
+    news = [article(f"u{i}", datetime.now(timezone.utc)) for i in range(20)]
+
+    analyzer.analyze_trends(news, "오늘")
+    assert len(calls) == 3 and analyzer.api_usage_count == 3  # 배치 2개 + 최종 요약
+
+    analyzer.daily_limit = analyzer.api_usage_count + 1
+    result = analyzer.analyze_trends(news, "오늘")
+    assert len(calls) == 3
+    assert result["trend_summary"] == "오늘 기간 동안의 대선 관련 뉴스를 분석했습니다."
+
+def test_undated_articles_expire_by_first_seen_time(pipeline):
+    now = datetime.now(timezone.utc)
+    stale = {**article("stale-undated", now), "published_date": "",
+             "first_seen_at": (now - timedelta(hours=7)).isoformat()}
+    recent = {**article("recent-undated", now), "published_date": "",
+              "first_seen_at": (now - timedelta(hours=1)).isoformat()}
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("fresh-undated", None)]})
+
+    metrics = pipeline.run_incremental_collection([stale, recent], None, timedelta(hours=6))
+    assert metrics["expired"] == 1
+    saved = pipeline.saved[-1]["news_list"]
+    assert [a["url"] for a in saved] == ["fresh-undated", "recent-undated"]
+    # 새로 수집한 날짜 없는 기사에는 처음 본 시각을 남겨 재시작 후에도 같은 기준으로 만료
+    assert datetime.fromisoformat(saved[0]["first_seen_at"]) >= now.replace(microsecond=0)
+
+def test_high_water_mark_is_saved_in_the_snapshot(pipeline):
+    now = datetime.now(timezone.utc)
+    pipeline.collector = collector({SEARCH_QUERIES[0]: [("a", now - timedelta(minutes=30))]})
+    metrics = pipeline.run_incremental_collection([], None, timedelta(hours=6))
+    saved = pipeline.saved[-1]
+    assert saved["high_water_mark"] == metrics["high_water_mark"]
+    # 헤더만 읽어도 찾도록 news_list보다 앞에 저장
+    assert list(saved).index("high_water_mark") < list(saved).index("news_list")
+
+def test_restart_resumes_from_stored_high_water_mark(tmp_path, monkeypatch):
+    import json
+    import api_server
+
+    mark = datetime(2026, 6, 3, 3, 0, tzinfo=timezone.utc)
+    snapshot = tmp_path / "trend_summary_2026-06-03_12-00.json"
+    snapshot.write_text(json.dumps({"high_water_mark": mark.isoformat(), "trend_summary": "요약",
+                                    "news_list": [article("kept", mark)]}, ensure_ascii=False), encoding="utf-8")
+    calls = []
+
+    def run_incremental_collection(previous_articles, high_water_mark, window):
+        calls.append(([a["url"] for a in previous_articles], high_water_mark))
+        return {"saved": False}
+
+    monkeypatch.setattr(api_server.file_manager, "find_latest_news_file", lambda: snapshot)
+    monkeypatch.setattr(api_server.news_cache.pipeline, "run_incremental_collection", run_incremental_collection)
+    api_server.incremental_news_collection(None, timedelta(hours=6))
+    assert calls == [(["kept"], mark)]
+
+    # 최종 수집 스냅샷(필드 없음)이면 기준 없이 시작, 스케줄러가 가진 값은 그대로 사용
+    snapshot.write_text(json.dumps({"trend_summary": "요약", "news_list": []}), encoding="utf-8")
+    api_server.incremental_news_collection(None, timedelta(hours=6))
+    later = mark + timedelta(hours=1)
+    api_server.incremental_news_collection(later, timedelta(hours=6))
+    assert calls[1:] == [([], None), ([], later)]
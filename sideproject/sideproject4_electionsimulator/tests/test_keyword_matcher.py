@@ -0,0 +1,76 @@
+import random
+
+import pytest
+
+import news_scraper
+from news_scraper import (
+    CANDIDATES, IMPORTANT_KEYWORDS, NEGATIVE_KEYWORDS, POSITIVE_KEYWORDS,
+    KeywordMatcher, NewsAnalyzer, keyword_matcher
+)
+
+GROUPS = {
+    "candidate": CANDIDATES,
+    "important": IMPORTANT_KEYWORDS,
+    "positive": POSITIVE_KEYWORDS,
+    "negative": NEGATIVE_KEYWORDS,
+}
+
+def substring_hits(groups, text):
+    """기존 방식: 키워드마다 `in` 검사"""
+    text = text.lower()
+    hits = {}
+    for group, keywords in groups.items():
+        found = {keyword.lower() for keyword in keywords if keyword.lower() in text}
+        if found:
+            hits[group] = found
+    return hits
+
+def random_texts(count, seed=7):
+    """키워드 조각과 겹치는 키워드(지지/지지율, 부정/부정적 등)를 섞은 임의 문장"""
+    rng = random.Random(seed)
+    fragments = [keyword for keywords in GROUPS.values() for keyword in keywords]
+    fragments += [keyword[:1] for keyword in fragments] + [keyword[1:] for keyword in fragments]
+    fragments += ["지지율", "부정적", "여론", "조사", " ", "\n", "A", "b", "후", "보"]
+    for _ in range(count):
+        yield "".join(rng.choice(fragments) for _ in range(rng.randint(0, 30)))
+
+def test_find_matches_substring_search():
+    for text in random_texts(2000):
+        assert keyword_matcher.find(text) == substring_hits(GROUPS, text), text
+
+def test_overlapping_and_nested_keywords():
+    matcher = KeywordMatcher({"a": ["he", "she", "his", "hers"], "b": ["ushe", "Sh"]})
+    for text in ["ushers", "USHERS", "hishe", "sh", "h", ""]:
+        assert matcher.find(text) == substring_hits({"a": ["he", "she", "his", "hers"], "b": ["ushe", "Sh"]}, text)
+
+def old_rule_based_sentiment(title, description):
+    """키워드 매처 도입 전 룰 베이스 감성 분석"""
+    text = (title + " " + description).lower()
+    positive_score = sum(1 for keyword in POSITIVE_KEYWORDS if keyword in text)
+    negative_score = sum(1 for keyword in NEGATIVE_KEYWORDS if keyword in text)
+    if positive_score > negative_score:
+        return "긍정"
+    if negative_score > positive_score:
+        return "부정"
+    if len(title) > 20 and any(candidate in text for candidate in CANDIDATES):
+        return random.choice(["긍정", "부정"])
+    return "중립"
+
+def test_rule_based_sentiment_matches_substring_counts(monkeypatch):
+    # 동점 + 후보 언급 시의 무작위 선택을 고정
+    monkeypatch.setattr(random, "choice", lambda options: options[0])
+    analyzer = NewsAnalyzer()
+    texts = list(random_texts(1000, seed=11))
+    for title, description in zip(texts[::2], texts[1::2]):
+        assert analyzer._rule_based_sentiment(title, description) == old_rule_based_sentiment(title, description)
+
+@pytest.mark.parametrize("title, expected", [
+    # '폭로'는 부정 목록에 두 번 있어 긍정 키워드 하나보다 무거움
+    ("폭로 이후 지지", "부정"),
+    ("성과 성공 폭로", "중립"),
+    ("성과 성공 개선 폭로", "긍정"),
+])
+def test_duplicate_keywords_count_twice(title, expected):
+    assert NewsAnalyzer()._rule_based_sentiment(title, "") == expected
+    assert old_rule_based_sentiment(title, "") == expected
+    assert news_scraper._NEGATIVE_WEIGHTS["폭로"] == 2
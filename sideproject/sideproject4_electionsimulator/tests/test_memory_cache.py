@@ -0,0 +1,86 @@
+import types
+from datetime import timedelta
+
+import pytest
+
+import news_scraper
+from news_scraper import MemoryCacheTier, SQLiteCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1_000_000.0]
+    monkeypatch.setattr(news_scraper, "time", types.SimpleNamespace(time=lambda: now[0]))
+    return now
+
+@pytest.fixture
+def sqlite(tmp_path, clock):
+    return SQLiteCache(db_path=tmp_path / "cache.db", ttl=timedelta(hours=1), legacy_dir=None)
+
+def test_lru_evicts_by_entry_count(sqlite):
+    tier = MemoryCacheTier(sqlite, max_entries=2, max_bytes=10_000, ttl=timedelta(hours=1))
+    tier.put_many({"a": "1", "b": "2"}, "summary")
+    assert tier.get("a", "summary") == "1"  # a를 최근 사용으로
+    tier.put("c", "summary", "3")
+
+    assert set(tier._entries) == {("summary", "a"), ("summary", "c")}
+    assert tier.stats()["evictions"] == 1
+    # 메모리에서 밀려나도 SQLite에서 다시 읽어 채움
+    assert tier.get("b", "summary") == "2"
+    assert tier.stats()["misses"] == 1
+
+def test_lru_evicts_by_byte_budget(sqlite):
+    size = MemoryCacheTier._entry_size(("summary", "a"), "가" * 10)
+    tier = MemoryCacheTier(sqlite, max_entries=100, max_bytes=size * 2, ttl=timedelta(hours=1))
+    tier.put_many({"a": "가" * 10, "b": "가" * 10}, "summary")
+    assert tier.stats()["bytes"] == size * 2
+    tier.put("c", "summary", "가" * 10)
+    assert set(tier._entries) == {("summary", "b"), ("summary", "c")}
+    assert tier.stats()["bytes"] == size * 2
+
+    # 상한보다 큰 항목은 메모리에 두지 않고 SQLite에만 저장
+    tier.put("big", "summary", "가" * 100)
+    assert ("summary", "big") not in tier._entries
+    assert sqlite.get("big", "summary") == "가" * 100
+    assert tier.stats()["entries"] == 2
+
+def test_ttl_expires_memory_and_sqlite_entries(sqlite, clock):
+    tier = MemoryCacheTier(sqlite, max_entries=10, max_bytes=10_000, ttl=timedelta(hours=1))
+    tier.put("a", "sentiment", "긍정")
+    clock[0] += 3599
+    assert tier.get("a", "sentiment") == "긍정"
+    clock[0] += 2
+    assert tier.get("a", "sentiment") is None
+    assert tier.stats()["entries"] == 0
+
+def test_ttl_counts_from_sqlite_creation_time(sqlite, clock):
+    sqlite.put("a", "sentiment", "부정")
+    clock[0] += 3000
+    tier = MemoryCacheTier(sqlite, max_entries=10, max_bytes=10_000, ttl=timedelta(hours=1))
+    assert tier.get("a", "sentiment") == "부정"
+    # 메모리에 올린 시각이 아니라 원래 저장 시각 기준으로 만료
+    clock[0] += 601
+    assert tier.get("a", "sentiment") is None
+
+def test_writes_go_through_to_sqlite(sqlite):
+    tier = MemoryCacheTier(sqlite, max_entries=10, max_bytes=10_000, ttl=timedelta(hours=1))
+    tier.put("a", "summary", "첫 요약")
+    assert sqlite.get("a", "summary") == "첫 요약"
+    tier.put("a", "summary", "새 요약")
+    assert sqlite.get("a", "summary") == "새 요약"
+    assert tier.get("a", "summary") == "새 요약"
+    assert tier.stats()["hits"] == 1
+
+def test_failed_write_invalidates_memory_entry(sqlite):
+    tier = MemoryCacheTier(sqlite, max_entries=10, max_bytes=10_000, ttl=timedelta(hours=1))
+    tier.put("a", "summary", "이전 요약")
+
+    def fail(results, analysis_type):
+        raise OSError("디스크 가득 참")
+
+    sqlite.put_many = fail
+    with pytest.raises(OSError):
+        tier.put("a", "summary", "새 요약")
+    # 메모리에 예전 값이 남아 SQLite와 어긋나지 않도록 비워 둠
+    assert ("summary", "a") not in tier._entries
+    del sqlite.put_many
+    assert tier.get("a", "summary") == "이전 요약"
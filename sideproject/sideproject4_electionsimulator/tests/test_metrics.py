@@ -0,0 +1,151 @@
+import asyncio
+import math
+import re
+
+import pytest
+
+import api_server  # noqa: F401 - 서버/파이프라인 지표 등록
+from metrics import Counter, Gauge, Histogram, MetricsMiddleware, Registry, REGISTRY, HTTP_REQUESTS
+
+NAME = r"[a-zA-Z_:][a-zA-Z0-9_:]*"
+SAMPLE = re.compile(rf"^({NAME})(?:\{{(.*)\}})? (\S+)$")
+LABEL = re.compile(r'([a-zA-Z_][a-zA-Z0-9_]*)="((?:[^"\\]|\\.)*)"(,|$)')
+
+def unescape(value):
+    return re.sub(r"\\(.)", lambda m: "\n" if m.group(1) == "n" else m.group(1), value)
+
+def parse_labels(text):
+    labels, pos = {}, 0
+    while pos < len(text):
+        match = LABEL.match(text, pos)
+        assert match, f"잘못된 라벨: {text[pos:]}"
+        labels[match.group(1)] = unescape(match.group(2))
+        pos = match.end()
+    return labels
+
+def parse(exposition: bytes):
+    """텍스트 형식 0.0.4 파서 - 형식 위반이면 AssertionError"""
+    text = exposition.decode("utf-8")
+    assert text.endswith("\n")
+    families, samples, current = {}, [], None
+    for line in text.splitlines():
+        if line.startswith("# HELP "):
+            name = line.split(" ")[2]
+            assert name not in families, f"중복 지표: {name}"
+            families[name] = {"help": line.split(" ", 3)[3] if line.count(" ") >= 3 else ""}
+            current = name
+        elif line.startswith("# TYPE "):
+            _, _, name, kind = line.split(" ")
+            assert name == current and kind in ("counter", "gauge", "histogram")
+            families[name]["type"] = kind
+        else:
+            match = SAMPLE.match(line)
+            assert match, f"잘못된 샘플 줄: {line!r}"
+            name, labels, value = match.group(1), parse_labels(match.group(2) or ""), float(match.group(3))
+            suffixes = ("_bucket", "_sum", "_count") if families[current]["type"] == "histogram" else ("",)
+            assert name in {current + suffix for suffix in suffixes}, f"{name}은 {current}에 속하지 않음"
+            samples.append((current, name, labels, value))
+    keys = [(name, tuple(sorted(labels.items()))) for _, name, labels, _ in samples]
+    assert len(keys) == len(set(keys)), "중복 샘플"
+    return families, samples
+
+def check_histograms(families, samples):
+    for family, info in families.items():
+        if info["type"] != "histogram":
+            continue
+        series = {}
+        for _, name, labels, value in samples:
+            if name.startswith(family):
+                key = tuple(sorted((k, v) for k, v in labels.items() if k != "le"))
+                series.setdefault(key, {"buckets": []})
+                if name.endswith("_bucket"):
+                    series[key]["buckets"].append((float(labels["le"]), value))
+                else:
+                    series[key][name[len(family):]] = value
+        for data in series.values():
+            bounds = [bound for bound, _ in data["buckets"]]
+            counts = [count for _, count in data["buckets"]]
+            assert bounds == sorted(bounds) and bounds[-1] == math.inf
+            assert counts == sorted(counts)
+            assert counts[-1] == data["_count"]
+
+def test_registry_output_is_valid_exposition_format():
+    HTTP_REQUESTS.labels("GET", '/api/"quoted"\\path\n', 200).inc()
+    families, samples = parse(REGISTRY.render())
+    assert "http_requests_total" in families and "llm_request_seconds" in families
+    check_histograms(families, samples)
+    assert any(labels.get("route") == '/api/"quoted"\\path\n' for _, _, labels, _ in samples)
+
+def test_counter_and_gauge_rendering():
+    registry = Registry()
+    requests = registry.register(Counter("jobs_total", '작업 수 "따옴표" \\ 역슬래시\n줄바꿈', ("kind",)))
+    requests.labels("b").inc(2)
+    requests.labels("a").inc(0.5)
+    temperature = registry.register(Gauge("temperature", "온도"))
+    temperature.set(-3.25)
+    broken = registry.register(Gauge("broken", "값을 읽지 못하는 게이지"))
+    broken.set_function(lambda: 1 / 0)
+    registry.register(Counter("unused_total", "아직 기록 없음", ("kind",)))
+
+    text = registry.render().decode("utf-8")
+    assert text.splitlines() == [
+        '# HELP jobs_total 작업 수 "따옴표" \\\\ 역슬래시\\n줄바꿈',
+        "# TYPE jobs_total counter",
+        'jobs_total{kind="a"} 0.5',
+        'jobs_total{kind="b"} 2',
+        "# HELP temperature 온도",
+        "# TYPE temperature gauge",
+        "temperature -3.25",
+        "# HELP broken 값을 읽지 못하는 게이지",
+        "# TYPE broken gauge",
+        "broken NaN",
+        "# HELP unused_total 아직 기록 없음",
+        "# TYPE unused_total counter",
+    ]
+    parse(registry.render())
+
+def test_histogram_buckets_are_cumulative():
+    registry = Registry()
+    latency = registry.register(Histogram("latency_seconds", "지연", ("route",), buckets=(1.0, 0.1, 5)))
+    for value in (0.05, 0.1, 0.5, 2, 100):
+        latency.labels("/api").observe(value)
+
+    lines = [line for line in registry.render().decode("utf-8").splitlines() if not line.startswith("#")]
+    assert lines == [
+        'latency_seconds_bucket{route="/api",le="0.1"} 2',
+        'latency_seconds_bucket{route="/api",le="1"} 3',
+        'latency_seconds_bucket{route="/api",le="5"} 4',
+        'latency_seconds_bucket{route="/api",le="+Inf"} 5',
+        'latency_seconds_sum{route="/api"} 102.65',
+        'latency_seconds_count{route="/api"} 5',
+    ]
+    families, samples = parse(registry.render())
+    check_histograms(families, samples)
+
+def test_label_arity_is_checked():
+    counter = Counter("events_total", "이벤트", ("a", "b"))
+    with pytest.raises(ValueError):
+        counter.labels("only-one")
+
+def test_registering_same_name_returns_first_metric():
+    registry = Registry()
+    first = registry.register(Counter("dup_total", "처음"))
+    assert registry.register(Counter("dup_total", "두 번째")) is first
+
+def test_middleware_labels_by_route_template():
+    class Route:
+        path = "/api/news/{news_id}"
+
+    async def app(scope, receive, send):
+        scope["route"] = Route()
+        await send({"type": "http.response.start", "status": 404, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    async def send(message):
+        pass
+
+    before = HTTP_REQUESTS.labels("GET", "/api/news/{news_id}", 404).get()
+    scope = {"type": "http", "method": "GET", "path": "/api/news/123", "headers": []}
+    asyncio.run(MetricsMiddleware(app)(scope, None, send))
+    assert HTTP_REQUESTS.labels("GET", "/api/news/{news_id}", 404).get() == before + 1
+    assert ("GET", "/api/news/123", "404") not in HTTP_REQUESTS._children
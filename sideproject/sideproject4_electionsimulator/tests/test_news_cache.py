@@ -0,0 +1,73 @@
+import pytest
+
+from api_server import NewsCache
+
+def trend_data(urls, stats, time_range="2026-06-03"):
+    return {
+        "trend_summary": "요약",
+        "candidate_stats": stats,
+        "total_articles": len(urls),
+        "time_range": time_range,
+        "news_list": [{"title": f"기사 {url}", "url": url, "summary": "", "sentiment": "중립"} for url in urls],
+    }
+
+@pytest.fixture
+def cache():
+    news_cache = NewsCache(history_size=3)
+    notified = []
+    news_cache.listeners.append(lambda snapshot: notified.append(snapshot.version))
+    news_cache.notified = notified
+    return news_cache
+
+def test_rollback_to_previous_and_to_version(cache):
+    for i in range(1, 4):
+        cache.update(trend_data([f"u{i}"], {"이재명": {"긍정": i}}))
+    assert cache.snapshot.version == 3
+    assert [snap.version for snap in cache.history] == [1, 2]
+
+    restored = cache.rollback()
+    assert restored is cache.snapshot and restored.version == 2
+    # 롤백 전 스냅샷은 이력으로 이동해 다시 되돌릴 수 있음
+    assert [snap.version for snap in cache.history] == [1, 3]
+    assert cache.rollback(3).version == 3
+    assert cache.rollback(1).data["news_list"][0]["url"] == "u1"
+    assert [snap.version for snap in cache.history] == [2, 3]
+    assert cache.notified == [1, 2, 3, 2, 3, 1]
+    assert cache.snapshot.activated_at >= cache.snapshot.created_at
+
+def test_rollback_unknown_version_or_empty_history(cache):
+    assert cache.rollback() is None
+    cache.update(trend_data(["u1"], {}))
+    assert cache.rollback() is None
+    assert cache.rollback(99) is None
+    assert cache.snapshot.version == 1
+
+def test_history_is_bounded_and_find_covers_current(cache):
+    for i in range(1, 6):
+        cache.update(trend_data([f"u{i}"], {}))
+    assert [snap.version for snap in cache.history] == [2, 3, 4]
+    assert cache.find(5) is cache.snapshot
+    assert cache.find(2).version == 2
+    assert cache.find(1) is None
+    assert [(s["version"], s["current"]) for s in cache.list_snapshots()] == [(2, False), (3, False), (4, False), (5, True)]
+
+def test_diff(cache):
+    cache.update(trend_data(["a", "b"], {"이재명": {"긍정": 3, "부정": 1}, "김문수": {"긍정": 2}}))
+    cache.update(trend_data(["b", "c", "d"], {"이재명": {"긍정": 5, "중립": 1}, "이준석": {"부정": 2}}))
+    old, new = cache.find(1), cache.find(2)
+
+    diff = NewsCache.diff(old, new)
+    assert diff["from"]["version"] == 1 and diff["to"]["version"] == 2
+    assert diff["total_articles_delta"] == 1
+    assert diff["candidate_stats_delta"] == {
+        "이재명": {"긍정": 2, "부정": -1, "중립": 1},
+        "김문수": {"긍정": -2},
+        "이준석": {"부정": 2},
+    }
+    assert [a["url"] for a in diff["added"]] == ["c", "d"]
+    assert [a["url"] for a in diff["removed"]] == ["a"]
+
+    reverse = NewsCache.diff(new, old)
+    assert reverse["total_articles_delta"] == -1
+    assert [a["url"] for a in reverse["added"]] == ["a"]
+    assert NewsCache.diff(old, old)["added"] == [] and NewsCache.diff(old, old)["removed"] == []
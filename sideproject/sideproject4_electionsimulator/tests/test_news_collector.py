@@ -0,0 +1,50 @@
+import random
+import time
+
+import news_scraper
+from news_scraper import NewsCollector, SEARCH_QUERIES
+
+class FakeGNews:
+    """키워드마다 정해진 기사를 임의 지연 후 반환 (키워드 간 URL 일부 중복)"""
+
+    def __init__(self, per_query: int = 20, max_delay: float = 0.02):
+        self.per_query = per_query
+        self.max_delay = max_delay
+
+    def get_news(self, query):
+        time.sleep(random.uniform(0, self.max_delay))
+        index = SEARCH_QUERIES.index(query)
+        return [
+            {
+                "title": f"{query} {i}",
+                "description": "",
+                # 앞 키워드와 URL이 겹치는 기사 포함
+                "url": f"https://news.example/{(index * self.per_query + i) // 2}",
+                "published date": "",
+                "publisher": {"title": "언론사"},
+            }
+            for i in range(self.per_query)
+        ]
+
+def collect(max_workers: int, **kwargs):
+    collector = NewsCollector(max_workers=max_workers)
+    collector.gnews = FakeGNews(**kwargs)
+    return [(article.url, article.query) for article in collector.iter_all_news()]
+
+def test_concurrent_collection_matches_sequential():
+    sequential = collect(max_workers=1)
+    concurrent = collect(max_workers=6)
+    assert concurrent == sequential
+    assert len(sequential) == min(news_scraper.TARGET_ARTICLE_COUNT, len({url for url, _ in sequential}))
+
+def test_collection_stops_at_target(monkeypatch):
+    monkeypatch.setattr(news_scraper, "TARGET_ARTICLE_COUNT", 15)
+    assert len(collect(max_workers=4)) == 15
+    assert collect(max_workers=4) == collect(max_workers=1)
+
+def test_seen_urls_are_skipped():
+    collector = NewsCollector(max_workers=3)
+    collector.gnews = FakeGNews()
+    first = next(iter(collector.iter_all_news()))
+    rest = list(collector.iter_all_news(seen_urls=[first.url]))
+    assert first.url not in {article.url for article in rest}
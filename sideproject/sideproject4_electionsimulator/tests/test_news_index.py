@@ -0,0 +1,98 @@
+import asyncio
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+import api_server
+from api_server import NEWS_ARTICLE_FIELDS, NewsCache, NewsIndex
+from news_scraper import TrendAggregator
+
+NEWS = [
+    {"title": "이재명 후보 공약 발표", "summary": "", "url": "u0", "sentiment": "긍정", "source": "A일보"},
+    {"title": "대선 토론회", "summary": "김문수 후보와 이재명 후보 공방", "url": "u1", "sentiment": "부정", "source": "B일보"},
+    {"title": "이준석 유세", "summary": "", "url": "u2", "sentiment": "중립", "source": "A일보"},
+    {"title": "여론조사 결과", "summary": "", "url": "u3", "sentiment": "중립", "source": "C일보"},
+    {"title": "김문수 정책", "summary": "", "url": "u4", "sentiment": "긍정", "source": "B일보"},
+]
+
+def urls(index, positions):
+    return [index.news_list[position]["url"] for position in positions]
+
+def test_candidate_filter_agrees_with_candidate_stats():
+    stats = TrendAggregator(NEWS).candidate_stats()
+    index = NewsIndex(NEWS, stats)
+    for candidate, counts in stats.items():
+        assert len(index.filter(candidate=candidate)) == sum(counts.values())
+    assert urls(index, index.filter(candidate="이재명")) == ["u0", "u1"]
+    assert index.filter(candidate="없는 후보") == []
+
+def test_filters_intersect_in_importance_order():
+    index = NewsIndex(NEWS, ["이재명", "김문수", "이준석"])
+    assert urls(index, index.filter(sentiment="긍정", source="B일보")) == ["u4"]
+    assert urls(index, index.filter(candidate="김문수", source="B일보")) == ["u1", "u4"]
+    assert list(index.filter()) == [0, 1, 2, 3, 4]
+
+def test_page_slices_and_projects_fields():
+    index = NewsIndex(NEWS, [])
+    positions = index.filter()
+    assert [a["url"] for a in index.page(positions, 3, 10)] == ["u3", "u4"]
+    assert index.page(positions, 10, 5) == []
+    # 기사에 없는 필드는 None으로 채움
+    assert index.page(positions, 0, 2, ["url", "importance_score"]) == [
+        {"url": "u0", "importance_score": None}, {"url": "u1", "importance_score": None}]
+
+@pytest.fixture
+def server_cache(monkeypatch):
+    news_cache = NewsCache()
+    triggered = []
+    monkeypatch.setattr(api_server, "news_cache", news_cache)
+    monkeypatch.setattr(api_server, "update_news_cache", lambda: None)
+    monkeypatch.setattr(api_server.collection_supervisor, "trigger",
+                        lambda reason: triggered.append(reason) or {"action": "started"})
+    news_cache.triggered = triggered
+    return news_cache
+
+def get_news(offset=0, limit=20, candidate=None, sentiment=None, source=None, fields=None, headers=()):
+    request = Request({"type": "http", "method": "GET", "path": "/api/news", "headers": list(headers)})
+    return asyncio.run(api_server.get_news_page(request, offset=offset, limit=limit, candidate=candidate,
+                                                sentiment=sentiment, source=source, fields=fields))
+
+def body(response):
+    return api_server.json.loads(response.body)
+
+def fill(news_cache, news=NEWS):
+    news_cache.update({"trend_summary": "요약", "candidate_stats": TrendAggregator(news).candidate_stats(),
+                       "total_articles": len(news), "time_range": datetime.now().strftime("%Y-%m-%d"),
+                       "news_list": news})
+
+def test_empty_cache_returns_empty_page(server_cache):
+    assert get_news(fields="title") == {"total": 0, "offset": 0, "limit": 20, "items": []}
+    assert server_cache.triggered == ["empty_cache"]
+
+def test_unknown_field_is_rejected_even_when_cache_is_empty(server_cache):
+    with pytest.raises(api_server.HTTPException) as error:
+        get_news(fields="title,password")
+    assert error.value.status_code == 400
+    assert "password" in error.value.detail
+
+def test_known_fields_missing_from_articles_are_allowed(server_cache):
+    fill(server_cache, [{"url": "u0", "title": "이재명 유세"}])
+    page = body(get_news(fields="title, importance_score"))
+    assert page["items"] == [{"title": "이재명 유세", "importance_score": None}]
+    assert set(NEWS_ARTICLE_FIELDS) >= {"title", "summary", "url", "sentiment", "source", "published_date"}
+
+def test_paging_with_filters(server_cache):
+    fill(server_cache)
+    page = body(get_news(offset=1, limit=1, candidate="김문수", fields="url,sentiment"))
+    assert page == {"total": 2, "offset": 1, "limit": 1, "items": [{"url": "u4", "sentiment": "긍정"}]}
+
+    everything = body(get_news(limit=2))
+    assert everything["total"] == 5
+    assert everything["items"] == NEWS[:2]
+
+def test_etag_depends_on_query(server_cache):
+    fill(server_cache)
+    first = get_news(candidate="이재명")
+    assert get_news(candidate="이재명", headers=[(b"if-none-match", first.headers["etag"].encode())]).status_code == 304
+    assert get_news(candidate="김문수").headers["etag"] != first.headers["etag"]
@@ -0,0 +1,68 @@
+import copy
+import random
+
+import pytest
+
+from news_scraper import RankingWeights, rank_news_by_importance, select_top_news
+
+def old_rank_news_by_importance(news_data, limit=100):
+    """부분 선택 도입 전: 기사마다 점수를 매기고 전체 정렬"""
+    for article in news_data:
+        score = 0
+        title = article.get('title', '').lower()
+        summary = article.get('summary', '').lower()
+        for candidate in ['이재명', '김문수', '이준석']:
+            if candidate in title or candidate in summary:
+                score += 10
+        for keyword in ['대선', '선거', '후보', '정치', '여론조사', '지지율']:
+            if keyword in title:
+                score += 5
+            if keyword in summary:
+                score += 3
+        if article.get('sentiment', '중립') in ['긍정', '부정']:
+            score += 3
+        if 10 <= len(article.get('title', '')) <= 50:
+            score += 2
+        article['importance_score'] = score
+    sorted_news = sorted(news_data, key=lambda x: x.get('importance_score', 0), reverse=True)
+    return sorted_news[:limit]
+
+def random_articles(count, seed):
+    """점수 종류가 적어 동점이 많이 생기는 기사 목록"""
+    rng = random.Random(seed)
+    words = ['이재명', '김문수', '이준석', '대선', '선거', '후보', '정치', '여론조사', '지지율', '지지', '뉴스', '속보']
+    articles = []
+    for i in range(count):
+        title = " ".join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+        summary = " ".join(rng.choice(words) for _ in range(rng.randint(0, 6)))
+        article = {"id": i, "title": title, "summary": summary, "sentiment": rng.choice(["긍정", "부정", "중립"])}
+        if rng.random() < 0.1:
+            del article["sentiment"]
+        articles.append(article)
+    return articles
+
+def ranked(result):
+    return [(article["id"], article["importance_score"]) for article in result]
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("limit", [0, 1, 10, 100, 500])
+def test_top_n_matches_full_sort(seed, limit):
+    articles = random_articles(300, seed)
+    expected = ranked(old_rank_news_by_importance(copy.deepcopy(articles), limit))
+    assert ranked(rank_news_by_importance(copy.deepcopy(articles), limit)) == expected
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 64, 1000])
+@pytest.mark.parametrize("limit", [1, 25, 400])
+def test_streaming_selection_matches_batch(chunk_size, limit):
+    articles = random_articles(300, seed=42)
+    expected = ranked(rank_news_by_importance(copy.deepcopy(articles), limit))
+    streamed = select_top_news(iter(copy.deepcopy(articles)), limit, chunk_size=chunk_size)
+    assert ranked(streamed) == expected
+
+def test_custom_weights():
+    articles = random_articles(50, seed=3)
+    weights = RankingWeights(candidate=0, title_keyword=0, summary_keyword=0, sentiment=1, title_length=0)
+    result = rank_news_by_importance(copy.deepcopy(articles), 10, weights)
+    scores = [article["importance_score"] for article in result]
+    assert scores == sorted(scores, reverse=True)
+    assert all(score == (article.get("sentiment") in ("긍정", "부정")) for article, score in zip(result, scores))
@@ -0,0 +1,109 @@
+import types
+
+import openai
+import pytest
+
+import news_scraper
+from news_scraper import RateLimiter, NewsAnalyzer, is_permanent_llm_error
+
+class FakeClock:
+    """time.monotonic/time.sleep 대체 - sleep은 시계만 앞으로 돌림"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(news_scraper.time, "monotonic", fake.monotonic)
+    monkeypatch.setattr(news_scraper.time, "sleep", fake.sleep)
+    return fake
+
+def test_requests_within_budget_do_not_wait(clock):
+    limiter = RateLimiter(requests_per_minute=3, tokens_per_minute=1000)
+    for _ in range(3):
+        limiter.acquire(100)
+    assert clock.slept == []
+
+def test_request_budget_refills_at_rpm(clock):
+    limiter = RateLimiter(requests_per_minute=60, tokens_per_minute=100000)
+    for _ in range(60):
+        limiter.acquire(1)
+    limiter.acquire(1)
+    # 분당 60건이면 1건 예산이 생기는 데 1초
+    assert sum(clock.slept) == pytest.approx(1.0)
+
+def test_token_budget_limits_large_requests(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=600)
+    limiter.acquire(600)
+    limiter.acquire(300)
+    # 분당 600토큰이면 300토큰은 30초
+    assert sum(clock.slept) == pytest.approx(30.0)
+
+def test_requests_larger_than_tpm_are_capped(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100)
+    limiter.acquire(10000)
+    assert clock.slept == []
+
+def test_settle_returns_unused_tokens(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=600)
+    limiter.acquire(600)
+    limiter.settle(estimated_tokens=600, actual_tokens=100)
+    limiter.acquire(500)
+    assert clock.slept == []
+
+def test_pause_blocks_all_callers(clock):
+    limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100000)
+    limiter.pause(5)
+    limiter.acquire(1)
+    assert sum(clock.slept) == pytest.approx(5.0)
+
+# === 재시도 대상 오류 ===
+def status_error(error_class, status_code):
+    response = types.SimpleNamespace(status_code=status_code, headers={}, request=object())
+    return error_class("error", response=response, body=None)
+
+def test_permanent_errors_are_not_retried():
+    assert is_permanent_llm_error(status_error(openai.AuthenticationError, 401))
+    assert is_permanent_llm_error(status_error(openai.BadRequestError, 400))
+    assert not is_permanent_llm_error(status_error(openai.RateLimitError, 429))
+    assert not is_permanent_llm_error(status_error(openai.InternalServerError, 500))
+    assert not is_permanent_llm_error(openai.APITimeoutError(request=object()))
+    assert not is_permanent_llm_error(openai.APIConnectionError(request=object()))
+
+def make_analyzer(monkeypatch, error):
+    calls = []
+
+    def create(**kwargs):
+        calls.append(kwargs)
+        raise error
+
+    fake_client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+    monkeypatch.setattr(news_scraper, "openai_client", fake_client)
+    analyzer = NewsAnalyzer()
+    analyzer.rate_limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100000)
+    pauses = []
+    monkeypatch.setattr(news_scraper.llm_rate_limiter, "pause", pauses.append)
+    return analyzer, calls, pauses
+
+def test_authentication_error_fails_fast(monkeypatch):
+    analyzer, calls, pauses = make_analyzer(monkeypatch, status_error(openai.AuthenticationError, 401))
+    with pytest.raises(openai.AuthenticationError):
+        analyzer._chat_completion("prompt", max_tokens=10, temperature=0)
+    assert len(calls) == 1
+    assert pauses == []
+
+def test_connection_errors_are_retried(monkeypatch):
+    analyzer, calls, pauses = make_analyzer(monkeypatch, openai.APIConnectionError(request=object()))
+    with pytest.raises(openai.APIConnectionError):
+        analyzer._chat_completion("prompt", max_tokens=10, temperature=0)
+    assert len(calls) == 3
+    assert len(pauses) == 2
@@ -0,0 +1,73 @@
+import gzip
+import types
+import zlib
+
+import pytest
+from starlette.requests import Request
+
+import api_server
+from api_server import RenderedPayload, payload_response
+
+DATA = {"trend_summary": "요약 " * 50, "news_list": [{"title": "이재명 후보 공약", "url": "https://a.example/1"}] * 20}
+
+def request(accept_encoding=None, if_none_match=None):
+    headers = []
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode()))
+    return Request({"type": "http", "method": "GET", "path": "/api/trend-summary", "headers": headers})
+
+@pytest.fixture
+def fake_brotli(monkeypatch):
+    """brotli가 없는 환경에서도 br 선택을 검사할 수 있도록 되돌릴 수 있는 압축기로 대체"""
+    module = types.SimpleNamespace(compress=lambda body, quality: zlib.compress(body), decompress=zlib.decompress)
+    monkeypatch.setattr(api_server, "brotli", module)
+    return module
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("br, gzip", "br"),
+    ("gzip, deflate, br;q=0.9", "br"),
+    ("gzip", "gzip"),
+    ("GZIP;q=1.0, identity", "gzip"),
+    ("identity", None),
+    ("", None),
+    (None, None),
+])
+def test_encoding_preference(fake_brotli, accept_encoding, expected):
+    response = payload_response(request(accept_encoding), RenderedPayload(DATA))
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["vary"] == "Accept-Encoding"
+
+def test_without_brotli_br_clients_get_gzip(monkeypatch):
+    monkeypatch.setattr(api_server, "brotli", None)
+    payload = RenderedPayload(DATA)
+    assert payload.br_body is None
+    response = payload_response(request("br, gzip"), payload)
+    assert response.headers["content-encoding"] == "gzip"
+    assert payload_response(request("br"), payload).headers.get("content-encoding") is None
+
+def test_encoded_bodies_decode_to_identity(fake_brotli):
+    payload = RenderedPayload(DATA)
+    identity = payload_response(request(), payload).body
+    assert identity == payload.body
+    assert gzip.decompress(payload_response(request("gzip"), payload).body) == identity
+    assert fake_brotli.decompress(payload_response(request("br"), payload).body) == identity
+    assert len(payload.gzip_body) < len(identity)
+
+def test_real_brotli_round_trip(monkeypatch):
+    brotli = pytest.importorskip("brotli")
+    monkeypatch.setattr(api_server, "brotli", brotli)
+    payload = RenderedPayload(DATA)
+    assert brotli.decompress(payload_response(request("br"), payload).body) == payload.body
+
+def test_each_encoding_has_its_own_etag(fake_brotli):
+    payload = RenderedPayload(DATA)
+    etags = {payload_response(request(accept), payload).headers["etag"] for accept in ("br", "gzip", "")}
+    assert len(etags) == 3
+
+    gzip_etag = payload_response(request("gzip"), payload).headers["etag"]
+    not_modified = payload_response(request("gzip", gzip_etag), payload)
+    assert not_modified.status_code == 304
+    assert not_modified.headers["vary"] == "Accept-Encoding"
+    assert payload_response(request("br", gzip_etag), payload).status_code == 200
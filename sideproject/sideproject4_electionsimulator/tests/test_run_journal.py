@@ -0,0 +1,126 @@
+import json
+
+import pytest
+
+from news_scraper import NewsPipeline, RunJournal, TrendAggregator
+
+RUN_DATE = "2026-06-03"
+
+def records(start: int, stop: int):
+    return [{"url": f"https://news.example/{i}", "title": f"기사 {i}"} for i in range(start, stop)]
+
+def test_round_trip(tmp_path):
+    journal = RunJournal(tmp_path / "journal.jsonl")
+    assert journal.load(RUN_DATE) == []
+
+    journal.open(RUN_DATE, resume=False)
+    journal.append(records(0, 3))
+    journal.append(records(3, 5))
+    journal.close()
+
+    assert journal.load(RUN_DATE) == records(0, 5)
+
+def test_resume_appends_without_new_header(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.open(RUN_DATE, resume=False)
+    journal.append(records(0, 2))
+    journal.close()
+
+    resumed = RunJournal(path)
+    assert resumed.load(RUN_DATE) == records(0, 2)
+    resumed.open(RUN_DATE, resume=True)
+    resumed.append(records(2, 4))
+    resumed.close()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    assert json.loads(lines[0])["run_date"] == RUN_DATE
+    assert sum("run_date" in json.loads(line) for line in lines) == 1
+    assert RunJournal(path).load(RUN_DATE) == records(0, 4)
+
+def test_other_date_is_discarded(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.open("2026-06-02", resume=False)
+    journal.append(records(0, 2))
+    journal.close()
+
+    assert journal.load(RUN_DATE) == []
+    assert not path.exists()
+
+@pytest.mark.parametrize("torn", ['{"url": "https://news.exa', '{"url": "https://news.example/9"}'])
+def test_torn_last_line_is_dropped_and_overwritten(tmp_path, torn):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.open(RUN_DATE, resume=False)
+    journal.append(records(0, 2))
+    journal.close()
+    # 줄바꿈 전에 중단된 쓰기
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(torn)
+
+    resumed = RunJournal(path)
+    assert resumed.load(RUN_DATE) == records(0, 2)
+    resumed.open(RUN_DATE, resume=True)
+    resumed.append(records(2, 4))
+    resumed.close()
+
+    assert RunJournal(path).load(RUN_DATE) == records(0, 4)
+
+def test_discard_removes_file(tmp_path):
+    path = tmp_path / "journal.jsonl"
+    journal = RunJournal(path)
+    journal.open(RUN_DATE, resume=False)
+    journal.discard()
+    assert not path.exists()
+    journal.discard()
+
+class FakeCollector:
+    def __init__(self, urls):
+        self.urls = urls
+        self.seen_urls = None
+
+    def iter_all_news(self, seen_urls=None, start_count=0):
+        self.seen_urls = list(seen_urls or [])
+        for url in self.urls:
+            if url not in self.seen_urls:
+                yield url
+
+def test_pipeline_resumes_only_unprocessed_articles(tmp_path, monkeypatch):
+    urls = [record["url"] for record in records(0, 6)]
+    pipeline = NewsPipeline()
+    pipeline.journal = RunJournal(tmp_path / "journal.jsonl")
+    pipeline.chunk_size = 2
+    pipeline.collector = FakeCollector(urls)
+
+    processed_batches = []
+
+    def process_articles(chunk, *args):
+        processed_batches.append(list(chunk))
+        if len(processed_batches) == 2:
+            raise RuntimeError("중단")
+        return [{"url": url, "title": url} for url in chunk]
+
+    monkeypatch.setattr(pipeline, "process_articles", process_articles)
+
+    # 첫 실행은 두 번째 묶음에서 중단
+    pipeline.journal.open(RUN_DATE, resume=False)
+    with pytest.raises(RuntimeError):
+        pipeline._stream_articles([], TrendAggregator())
+    pipeline.journal.close()
+
+    # 재시작: 저널의 기사는 건너뛰고 나머지만 처리
+    processed_batches.clear()
+    monkeypatch.setattr(pipeline, "process_articles",
+                        lambda chunk, *args: processed_batches.append(list(chunk)) or
+                        [{"url": url, "title": url} for url in chunk])
+    previous = pipeline.journal.load(RUN_DATE)
+    assert [article["url"] for article in previous] == urls[:2]
+    pipeline.journal.open(RUN_DATE, resume=True)
+    result = pipeline._stream_articles(previous, TrendAggregator(previous))
+    pipeline.journal.close()
+
+    assert pipeline.collector.seen_urls == urls[:2]
+    assert processed_batches == [urls[2:4], urls[4:6]]
+    assert [article["url"] for article in result] == urls
+    assert [article["url"] for article in pipeline.journal.load(RUN_DATE)] == urls
@@ -0,0 +1,46 @@
+import types
+
+import pytest
+
+import news_scraper
+from news_scraper import NewsAnalyzer, RateLimiter
+
+ARTICLES = [
+    ("a1", "이재명 후보 정책 발표", "새로운 공약 발표"),
+    ("a2", "김문수 후보 논란", "의혹 제기와 비판"),
+    ("a3", "대선 일정", "토론회 일정 안내"),
+]
+
+@pytest.fixture
+def analyzer_with_reply(monkeypatch):
+    def build(content):
+        response = types.SimpleNamespace(
+            usage=None,
+            choices=[types.SimpleNamespace(message=types.SimpleNamespace(content=content))]
+        )
+        create = lambda **kwargs: response
+        client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=types.SimpleNamespace(create=create)))
+        monkeypatch.setattr(news_scraper, "openai_client", client)
+        analyzer = NewsAnalyzer()
+        analyzer.cache_enabled = False
+        analyzer.rate_limiter = RateLimiter(requests_per_minute=1000, tokens_per_minute=100000)
+        return analyzer
+    return build
+
+def test_valid_reply_is_used(analyzer_with_reply):
+    analyzer = analyzer_with_reply('{"1": "긍정", "2": "부정", "3": "중립"}')
+    assert analyzer.analyze_sentiments_batch(ARTICLES, batch_size=3) == ["긍정", "부정", "중립"]
+
+@pytest.mark.parametrize("content", ['["긍정", "부정"]', '"긍정"', "3", "null"])
+def test_non_object_json_falls_back_to_rules(analyzer_with_reply, content):
+    analyzer = analyzer_with_reply(content)
+    assert analyzer._classify_sentiment_batch(ARTICLES) == {}
+    expected = [analyzer._rule_based_sentiment(title, description) for _, title, description in ARTICLES]
+    assert analyzer.analyze_sentiments_batch(ARTICLES, batch_size=3) == expected
+
+def test_invalid_labels_fall_back_per_article(analyzer_with_reply):
+    # 재요청 배치에서도 같은 응답 - 1번은 없고 2번은 잘못된 라벨
+    analyzer = analyzer_with_reply('{"2": "모름", "3": "중립"}')
+    results = analyzer.analyze_sentiments_batch(ARTICLES, batch_size=3)
+    assert results[2] == "중립"
+    assert results[1] == analyzer._rule_based_sentiment(*ARTICLES[1][1:])
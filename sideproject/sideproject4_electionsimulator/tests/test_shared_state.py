@@ -0,0 +1,222 @@
+import asyncio
+import json
+import os
+import threading
+
+import pytest
+
+import api_server
+from shared_state import LeaderLock, SharedSnapshotFile, SharedStateCoordinator
+
+def test_snapshot_round_trip(tmp_path):
+    writer = SharedSnapshotFile(tmp_path / "snapshot.bin")
+    reader = SharedSnapshotFile(tmp_path / "snapshot.bin")
+    assert reader.read() is None
+    assert not reader.changed()
+
+    body = json.dumps({"trend_summary": "요약", "news_list": []}, ensure_ascii=False).encode("utf-8")
+    generation = writer.publish(body, version=3)
+    assert not writer.changed()
+    assert reader.changed()
+    assert reader.read() == (generation, 3, body)
+    assert not reader.changed()
+
+    second = writer.publish(b"")
+    assert second > generation
+    assert reader.changed()
+    assert reader.read() == (second, 0, b"")
+
+def test_corrupt_snapshot_is_ignored(tmp_path):
+    path = tmp_path / "snapshot.bin"
+    snapshot_file = SharedSnapshotFile(path)
+    snapshot_file.publish(b'{"a": 1}')
+
+    data = path.read_bytes()
+    path.write_bytes(data[:-1])  # 길이보다 짧은 본문
+    assert snapshot_file.read() is None
+    path.write_bytes(b"NOTSNAP!" + data[8:])
+    assert snapshot_file.read() is None
+    path.write_bytes(b"ELEC")
+    assert snapshot_file.read() is None
+
+def test_leader_lock_is_exclusive(tmp_path):
+    first, second = LeaderLock(tmp_path / "leader.lock"), LeaderLock(tmp_path / "leader.lock")
+    assert first.try_acquire()
+    assert not second.try_acquire()
+    first.release()
+    assert second.try_acquire()
+    second.release()
+
+def test_collection_request_is_taken_once(tmp_path):
+    follower = SharedStateCoordinator(tmp_path)
+    leader = SharedStateCoordinator(tmp_path)
+    assert leader.take_collection_request() is None
+
+    follower.request_collection("manual_refresh")
+    follower.request_collection("force_today")  # 가져가기 전 요청은 하나로 합쳐짐
+    request = leader.take_collection_request()
+    assert request["reason"] == "force_today" and request["pid"] == os.getpid()
+    assert leader.take_collection_request() is None
+    assert list(tmp_path.iterdir()) == []
+
+def test_completion_marker_is_scoped_to_server_run(tmp_path):
+    leader = SharedStateCoordinator(tmp_path)
+    follower = SharedStateCoordinator(tmp_path)
+    assert not follower.final_collection_completed()
+    leader.mark_final_collection_completed()
+    assert follower.final_collection_completed()
+
+    # 다른 서버 실행(다른 부모 프로세스)이 남긴 표시는 무시
+    marker = json.loads(leader.completion_path.read_text(encoding="utf-8"))
+    leader.completion_path.write_text(json.dumps({**marker, "ppid": -1}), encoding="utf-8")
+    assert not follower.final_collection_completed()
+
+def test_promoted_follower_handles_forwarded_requests(tmp_path):
+    async def scenario():
+        leader = SharedStateCoordinator(tmp_path, poll_seconds=0.01)
+        follower = SharedStateCoordinator(tmp_path, poll_seconds=0.01)
+        assert leader.try_become_leader()
+
+        snapshots, promoted, requests = [], [], []
+
+        async def on_leader():
+            promoted.append(True)
+
+        def on_snapshot(body, version):
+            snapshots.append((body, version, threading.current_thread()))
+
+        follower.start(on_snapshot, on_leader, requests.append)
+        leader.publish(b'{"v": 1}', 7)
+        await asyncio.sleep(0.1)
+        assert [(body, version) for body, version, _ in snapshots] == [(b'{"v": 1}', 7)] and not promoted
+        # 역직렬화/압축이 이벤트 루프를 막지 않도록 스레드에서 반영
+        assert snapshots[0][2] is not threading.current_thread()
+
+        # 리더가 사라지면 팔로워가 승계하고 전달된 요청을 처리
+        await leader.stop()
+        await asyncio.sleep(0.1)
+        assert promoted == [True] and follower.is_leader
+        leader.request_collection("stale_cache")
+        await asyncio.sleep(0.1)
+        await follower.stop()
+        return requests
+
+    requests = asyncio.run(scenario())
+    assert [(request["kind"], request["reason"]) for request in requests] == [("collection", "stale_cache")]
+
+def test_leader_status_is_shared_with_followers(tmp_path):
+    leader = SharedStateCoordinator(tmp_path)
+    follower = SharedStateCoordinator(tmp_path)
+    assert follower.read_leader_status() is None
+
+    follower.publish_status({"state": "running"})  # 팔로워는 기록하지 않음
+    assert follower.read_leader_status() is None
+
+    assert leader.try_become_leader()
+    leader.publish_status({"state": "running"})
+    assert follower.read_leader_status() == {"state": "running", "leader_pid": os.getpid()}
+    leader.lock.release()
+
+@pytest.fixture
+def follower_server(tmp_path, monkeypatch):
+    """다른 워커가 리더 락을 잡고 있는 팔로워 워커"""
+    leader = SharedStateCoordinator(tmp_path)
+    assert leader.try_become_leader()
+    follower = SharedStateCoordinator(tmp_path)
+    monkeypatch.setattr(api_server, "shared_state", follower)
+    monkeypatch.setattr(api_server.news_cache, "final_collection_completed", False)
+    yield leader, follower
+    leader.lock.release()
+
+def test_follower_trigger_forwards_to_leader(follower_server):
+    leader, _ = follower_server
+    supervisor = api_server.CollectionSupervisor()
+    handle = supervisor.trigger("manual_refresh")
+    assert handle["action"] == "forwarded_to_leader"
+    assert not supervisor.is_running()
+    assert leader.take_collection_request()["reason"] == "manual_refresh"
+
+def test_follower_trigger_reports_unavailable_leader(follower_server, monkeypatch):
+    _, follower = follower_server
+
+    def fail(reason):
+        raise OSError("읽기 전용 파일 시스템")
+
+    monkeypatch.setattr(follower, "request_collection", fail)
+    with pytest.raises(api_server.HTTPException) as error:
+        api_server.trigger_collection("manual_refresh")
+    assert error.value.status_code == 503
+
+def test_follower_reports_leader_collection_status(follower_server, monkeypatch):
+    leader, _ = follower_server
+    monkeypatch.setattr(api_server, "shared_state", leader)
+    leader_status = {
+        "collection_task": {**api_server.collection_supervisor.get_status(), "state": "running", "run_id": 4},
+        "collection_progress": {"stage": "analyzing", "processed": 12},
+        "scheduler": {"enabled": True, "interval_minutes": 30}
+    }
+    leader.publish_status(leader_status)
+
+    monkeypatch.setattr(api_server, "shared_state", follower_server[1])
+    collection = asyncio.run(api_server.get_collection_status())
+    assert collection["state"] == "running" and collection["run_id"] == 4
+    assert collection["progress"] == {"stage": "analyzing", "processed": 12}
+    status = api_server.build_status()
+    assert status["collection_task"]["state"] == "running"
+    assert status["scheduler"] == {"enabled": True, "interval_minutes": 30}
+
+def test_follower_rollback_is_forwarded_and_republished(follower_server, monkeypatch):
+    leader, follower = follower_server
+    leader_cache, follower_cache = api_server.NewsCache(), api_server.NewsCache()
+    leader_cache.listeners.append(lambda snapshot: leader.publish(snapshot.rendered["trend_summary"].body,
+                                                                  snapshot.version))
+
+    def sync_follower():
+        monkeypatch.setattr(api_server, "news_cache", follower_cache)
+        api_server.apply_shared_snapshot(*follower.read_latest())
+
+    for summary in ("첫 요약", "둘째 요약"):
+        leader_cache.update({"trend_summary": summary, "news_list": []})
+        sync_follower()
+    # 팔로워는 리더의 버전 번호를 그대로 사용
+    assert follower_cache.snapshot.version == leader_cache.snapshot.version == 2
+    assert [snapshot.version for snapshot in follower_cache.history] == [1]
+
+    response = asyncio.run(api_server.rollback_cache(version=1))
+    assert response.status_code == 202
+    assert json.loads(response.body) == {"status": "forwarded_to_leader", "version": 1}
+    assert follower_cache.snapshot.version == 2  # 받은 워커만 따로 되돌리지 않음
+
+    # 리더가 요청을 처리하고 되돌린 스냅샷을 게시
+    monkeypatch.setattr(api_server, "news_cache", leader_cache)
+    for request in leader.take_requests():
+        api_server.handle_forwarded_request(request)
+    assert leader_cache.snapshot.version == 1
+    sync_follower()
+    assert follower_cache.snapshot.version == 1
+    assert follower_cache.latest_data["trend_summary"] == "첫 요약"
+
+    # 이후 리더의 새 스냅샷도 같은 번호로 반영
+    monkeypatch.setattr(api_server, "news_cache", leader_cache)
+    leader_cache.update({"trend_summary": "셋째 요약", "news_list": []})
+    sync_follower()
+    assert follower_cache.snapshot.version == leader_cache.snapshot.version == 3
+
+def test_promoted_leader_skips_completed_final_collection(follower_server, monkeypatch):
+    leader, follower = follower_server
+    triggered = []
+    monkeypatch.setattr(api_server.collection_supervisor, "trigger", triggered.append)
+    monkeypatch.setattr(api_server.incremental_scheduler, "interval", 0)
+
+    # 이전 리더가 최종 수집을 마치고 종료
+    monkeypatch.setattr(api_server, "shared_state", leader)
+    api_server.mark_final_collection_completed()
+    monkeypatch.setattr(api_server.news_cache, "final_collection_completed", False)
+    leader.lock.release()
+
+    monkeypatch.setattr(api_server, "shared_state", follower)
+    assert follower.try_become_leader()
+    asyncio.run(api_server.start_collection_duties())
+    assert triggered == []
+    assert api_server.news_cache.final_collection_completed
+    follower.lock.release()
@@ -0,0 +1,87 @@
+import json
+import random
+
+import pytest
+
+from snapshot_reader import SnapshotReader
+
+SCALARS = [
+    0, -1, 7, 123456789, 10 ** 30, 1.5, -0.25, 1.5e-7, 2e100, 1e-300,
+    True, False, None, "", "이재명", "따옴표 \" 역슬래시 \\ 줄바꿈 \n 탭 \t", "\u0000\u001f", "😀 이모지", "/슬래시/",
+]
+
+def random_value(rng, depth=0):
+    roll = rng.random()
+    if depth < 3 and roll < 0.2:
+        return [random_value(rng, depth + 1) for _ in range(rng.randint(0, 4))]
+    if depth < 3 and roll < 0.4:
+        return {rng.choice(["a", "키", "b\"c", ""]) + str(i): random_value(rng, depth + 1) for i in range(rng.randint(0, 4))}
+    return rng.choice(SCALARS)
+
+def random_snapshot(rng):
+    snapshot = {
+        "trend_summary": rng.choice(SCALARS),
+        "candidate_stats": random_value(rng),
+        "total_articles": rng.choice([0, 7, 200, 1.5e3]),
+        "news_list": [
+            {"title": rng.choice(SCALARS), "score": rng.choice(SCALARS), "extra": random_value(rng)}
+            for _ in range(rng.randint(0, 6))
+        ],
+        "time_range": rng.choice(SCALARS),
+    }
+    # news_list 위치도 바꿔 봄
+    keys = list(snapshot)
+    rng.shuffle(keys)
+    return {key: snapshot[key] for key in keys}
+
+def dump(snapshot, rng):
+    return json.dumps(snapshot, ensure_ascii=rng.random() < 0.5, indent=rng.choice([None, 1, 2]))
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 5, 7, 11, 100])
+def test_matches_json_load(tmp_path, chunk_size):
+    rng = random.Random(chunk_size)
+    path = tmp_path / "snapshot.json"
+    for _ in range(40):
+        snapshot = random_snapshot(rng)
+        path.write_text(dump(snapshot, rng), encoding="utf-8")
+        expected = json.loads(path.read_text(encoding="utf-8"))
+
+        reader = SnapshotReader(path, chunk_size=chunk_size)
+        assert reader.read_header() == {k: v for k, v in expected.items() if k != "news_list"}
+        assert list(reader.iter_articles()) == expected["news_list"]
+
+@pytest.mark.parametrize("text", ["1.5", "1e5", "-2.5E-3", "10", "true", "null", '"a\\u00e9b"', '"\\ud83d\\ude00"'])
+def test_values_split_at_every_position(tmp_path, text):
+    """숫자 소수부/지수부, 리터럴, 이스케이프가 청크 끝에서 잘려도 같은 값"""
+    path = tmp_path / "snapshot.json"
+    body = f'{{"total_articles": {text}, "news_list": [{text}, {text}], "time_range": {text}}}'
+    path.write_text(body, encoding="utf-8")
+    expected = json.loads(body)
+    for offset in range(len(body)):
+        # 앞에 공백을 덧붙여 값이 청크 경계에 걸리는 위치를 바꿈
+        padded = " " * offset + body
+        path.write_text(padded, encoding="utf-8")
+        reader = SnapshotReader(path, chunk_size=len(body) // 3 or 1)
+        assert reader.read_header() == {k: v for k, v in expected.items() if k != "news_list"}
+        assert list(reader.iter_articles()) == expected["news_list"]
+
+def test_read_header_with_keys_stops_early(tmp_path):
+    path = tmp_path / "snapshot.json"
+    # 찾는 키를 모두 읽은 뒤의 내용은 읽지 않으므로 깨져 있어도 됨
+    path.write_text('{"total_articles": 3, "time_range": "오늘", "news_list": [{"title": ', encoding="utf-8")
+    reader = SnapshotReader(path, chunk_size=4)
+    assert reader.read_header(("total_articles", "time_range")) == {"total_articles": 3, "time_range": "오늘"}
+
+def test_missing_and_empty_news_list(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"total_articles": 0}', encoding="utf-8")
+    assert list(SnapshotReader(path).iter_articles()) == []
+    path.write_text('{"news_list": [ ], "total_articles": 0}', encoding="utf-8")
+    assert list(SnapshotReader(path, chunk_size=1).iter_articles()) == []
+    assert SnapshotReader(path, chunk_size=1).read_header() == {"total_articles": 0}
+
+def test_truncated_file_raises(tmp_path):
+    path = tmp_path / "snapshot.json"
+    path.write_text('{"news_list": [{"title": "a"}, {"title": "b"', encoding="utf-8")
+    with pytest.raises(ValueError):
+        list(SnapshotReader(path, chunk_size=3).iter_articles())
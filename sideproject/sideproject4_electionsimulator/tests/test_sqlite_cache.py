@@ -0,0 +1,66 @@
+import json
+import time
+from datetime import datetime, timedelta
+
+from news_scraper import SQLiteCache
+
+def write_json(path, result, timestamp=None):
+    path.write_text(json.dumps({
+        "timestamp": timestamp or datetime.now().isoformat(),
+        "result": result
+    }, ensure_ascii=False), encoding="utf-8")
+
+def test_migration_moves_known_files_and_keeps_the_rest(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    write_json(legacy / "summary_abc.json", "요약")            # 현재 형식 {type}_{id}
+    write_json(legacy / "def_sentiment.json", "긍정")          # 이전 형식 {id}_{type}
+    (legacy / "sentiment_bad.json").write_text("{not json", encoding="utf-8")  # 손상된 파일
+    write_json(legacy / "trend_summary_2025.json", "다른 데이터")  # 캐시가 아닌 JSON
+    (legacy / "summary_norm.json").write_text(json.dumps({"timestamp": datetime.now().isoformat()}), encoding="utf-8")
+
+    cache = SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=legacy)
+
+    assert cache.get("abc", "summary") == "요약"
+    assert cache.get("def", "sentiment") == "긍정"
+    assert not (legacy / "summary_abc.json").exists()
+    assert not (legacy / "def_sentiment.json").exists()
+    # 읽지 못했거나 이름을 모르는 파일은 그대로
+    assert (legacy / "sentiment_bad.json").exists()
+    assert (legacy / "summary_norm.json").exists()
+    assert (legacy / "trend_summary_2025.json").exists()
+
+def test_migration_runs_once(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=legacy)
+    write_json(legacy / "summary_late.json", "나중에 생긴 파일")
+    cache = SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=legacy)
+    assert cache.get("late", "summary") is None
+    assert (legacy / "summary_late.json").exists()
+
+def test_migration_keeps_original_timestamp_and_drops_expired(tmp_path):
+    legacy = tmp_path / "legacy"
+    legacy.mkdir()
+    write_json(legacy / "summary_old.json", "오래된 요약", (datetime.now() - timedelta(hours=30)).isoformat())
+    write_json(legacy / "summary_new.json", "새 요약", (datetime.now() - timedelta(hours=1)).isoformat())
+    cache = SQLiteCache(db_path=tmp_path / "cache.db", ttl=timedelta(hours=24), legacy_dir=legacy)
+    assert cache.get("old", "summary") is None
+    assert cache.get("new", "summary") == "새 요약"
+
+def test_ttl_applies_on_read_and_purge(tmp_path, monkeypatch):
+    cache = SQLiteCache(db_path=tmp_path / "cache.db", ttl=timedelta(seconds=60), legacy_dir=None)
+    cache.put_many({"a": "요약 A", "b": "요약 B"}, "summary")
+    assert cache.get_many(["a", "b", "c"], "summary") == {"a": "요약 A", "b": "요약 B"}
+
+    later = time.time() + 120
+    monkeypatch.setattr("news_scraper.time.time", lambda: later)
+    assert cache.get_many(["a", "b"], "summary") == {}
+    assert cache.purge_expired() == 2
+
+def test_types_are_separate_keys(tmp_path):
+    cache = SQLiteCache(db_path=tmp_path / "cache.db", legacy_dir=None)
+    cache.put("x", "summary", "요약")
+    cache.put("x", "sentiment", "부정")
+    assert cache.get("x", "summary") == "요약"
+    assert cache.get("x", "sentiment") == "부정"
@@ -0,0 +1,93 @@
+import asyncio
+import json
+import threading
+from datetime import datetime
+
+import pytest
+from starlette.requests import Request
+
+import api_server
+
+def write_snapshot(directory, stamp, summary, urls):
+    path = directory / f"trend_summary_{stamp}.json"
+    path.write_text(json.dumps({
+        "trend_summary": summary,
+        "candidate_stats": {"이재명": {"긍정": len(urls), "부정": 0, "중립": 0}},
+        "total_articles": len(urls),
+        "time_range": datetime.now().strftime("%Y-%m-%d"),
+        "news_list": [{"title": f"이재명 {url}", "url": url, "summary": "", "sentiment": "긍정"} for url in urls],
+    }, ensure_ascii=False), encoding="utf-8")
+    return path
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """저장된 스냅샷 하나가 있고 수집은 release될 때까지 멈춰 있는 서버"""
+    catalog = api_server.AssetCatalog(tmp_path, poll_seconds=0)
+    news_cache = api_server.NewsCache()
+    release, entered = threading.Event(), threading.Event()
+
+    def run_daily_collection(force=False):
+        entered.set()
+        assert release.wait(5)
+        write_snapshot(tmp_path, datetime.now().strftime("%Y-%m-%d_%H-%M"), "새 요약", ["new-1", "new-2"])
+
+    monkeypatch.setattr(news_cache.pipeline, "run_daily_collection", run_daily_collection)
+    monkeypatch.setattr(api_server, "asset_catalog", catalog)
+    monkeypatch.setattr(api_server, "news_cache", news_cache)
+    monkeypatch.setattr(api_server, "shared_state", None)
+    monkeypatch.setattr(api_server, "collection_supervisor", api_server.CollectionSupervisor())
+    monkeypatch.setattr(api_server.incremental_scheduler, "interval", 0)
+    monkeypatch.setattr(api_server, "NEWS_SCRAPER_AVAILABLE", True)
+    monkeypatch.setattr(api_server, "STARTUP_COLLECTION_MODE", "background")
+    write_snapshot(tmp_path, "2026-06-02_23-50", "저장된 요약", ["old-1"])
+    return news_cache, release, entered
+
+def trend_summary():
+    request = Request({"type": "http", "method": "GET", "path": "/api/trend-summary", "headers": []})
+    return api_server.get_news_data(request)
+
+def test_startup_serves_stored_snapshot_and_swaps_after_collection(server):
+    news_cache, release, entered = server
+
+    async def scenario():
+        await asyncio.wait_for(api_server.start_news_service(), timeout=2)
+        # 수집이 아직 진행 중이어도 저장된 스냅샷으로 바로 응답
+        assert await asyncio.to_thread(entered.wait, 2)
+        assert api_server.collection_supervisor.is_running()
+        first = json.loads((await trend_summary()).body)
+        assert first["trend_summary"] == "저장된 요약"
+        version = news_cache.snapshot.version
+
+        release.set()
+        assert await api_server.collection_supervisor.wait(5)
+        second = json.loads((await trend_summary()).body)
+        assert second["trend_summary"] == "새 요약"
+        assert [a["url"] for a in second["news_list"]] == ["new-1", "new-2"]
+        assert news_cache.snapshot.version > version
+        assert [snapshot.version for snapshot in news_cache.history] == [version]
+        return api_server.collection_supervisor.get_status()
+
+    status = asyncio.run(scenario())
+    assert status["state"] == "succeeded"
+    assert news_cache.final_collection_completed
+
+def test_empty_cache_is_filled_off_the_event_loop(server, monkeypatch):
+    news_cache, release, _ = server
+    release.set()
+    loop_threads = []
+    update = api_server.update_news_cache
+
+    def record_thread():
+        loop_threads.append(threading.current_thread())
+        update()
+
+    monkeypatch.setattr(api_server, "update_news_cache", record_thread)
+
+    async def scenario():
+        monkeypatch.setattr(api_server, "final_collection_done", lambda: True)
+        snapshot = await api_server.current_snapshot()
+        return snapshot, threading.current_thread()
+
+    snapshot, loop_thread = asyncio.run(scenario())
+    assert snapshot.data["trend_summary"] == "저장된 요약"
+    assert loop_threads and loop_threads[0] is not loop_thread
@@ -0,0 +1,123 @@
+import asyncio
+import gzip
+import os
+import types
+import zlib
+
+import pytest
+from starlette.requests import Request
+
+import api_server
+import static_assets
+from static_assets import STATIC_IMMUTABLE_CACHE_CONTROL, StaticAssetManifest
+
+BUNDLE = "console.log('이재명 김문수 이준석');\n" * 200
+
+def request(path="/", accept_encoding=None, **extra):
+    headers = [(name.replace("_", "-").encode(), value.encode()) for name, value in extra.items()]
+    if accept_encoding is not None:
+        headers.append((b"accept-encoding", accept_encoding.encode()))
+    return Request({"type": "http", "method": "GET", "path": path, "headers": headers})
+
+@pytest.fixture
+def web_dir(tmp_path):
+    root = tmp_path / "web"
+    (root / "assets" / "fonts").mkdir(parents=True)
+    (root / "index.html").write_text("<html>선거 시뮬레이터</html>", encoding="utf-8")
+    (root / "main.dart.js").write_text(BUNDLE, encoding="utf-8")
+    (root / "main.3f2a9c1d7e.js").write_text(BUNDLE, encoding="utf-8")
+    (root / "assets" / "logo.0a1b2c3d4e.png").write_bytes(b"\x89PNG" + os.urandom(2048))
+    (root / "assets" / "fonts" / "small.ttf").write_bytes(b"font")
+    (root / ".last_build_id").write_text("abc", encoding="utf-8")
+    return root
+
+@pytest.fixture
+def manifest(web_dir, tmp_path):
+    return StaticAssetManifest(web_dir, cache_dir=tmp_path / "cache")
+
+@pytest.fixture
+def fake_brotli(monkeypatch):
+    """brotli가 없는 환경에서도 br 사본을 검사할 수 있도록 zlib으로 대체"""
+    module = types.SimpleNamespace(compress=lambda body, quality: zlib.compress(body), decompress=zlib.decompress)
+    monkeypatch.setattr(static_assets, "brotli", module)
+    return module
+
+def test_manifest_is_built_on_first_use(manifest):
+    assert not manifest.loaded and manifest.assets == {}
+    assert manifest.get_status()["files"] == 0
+
+    assert manifest.get("/index.html").relative_path == "index.html"
+    assert manifest.loaded
+    assert sorted(manifest.assets) == ["assets/fonts/small.ttf", "assets/logo.0a1b2c3d4e.png",
+                                       "index.html", "main.3f2a9c1d7e.js", "main.dart.js"]
+    assert manifest.get("") is manifest.get("index.html")
+    assert manifest.get("missing.js") is None
+
+def test_hashed_names_are_immutable(manifest):
+    assert manifest.get("main.3f2a9c1d7e.js").cache_control == STATIC_IMMUTABLE_CACHE_CONTROL
+    assert manifest.get("assets/logo.0a1b2c3d4e.png").cache_control == STATIC_IMMUTABLE_CACHE_CONTROL
+    # 해시 없는 파일과 진입점은 매번 재검증
+    assert manifest.get("main.dart.js").cache_control == static_assets.STATIC_CACHE_CONTROL
+    assert manifest.get("index.html").cache_control == "no-cache"
+
+    response = api_server.static_response(request("/main.3f2a9c1d7e.js"), manifest.get("main.3f2a9c1d7e.js"))
+    assert response.headers["cache-control"] == STATIC_IMMUTABLE_CACHE_CONTROL
+    assert response.media_type == "text/javascript"
+
+@pytest.mark.parametrize("accept_encoding, expected", [
+    ("br, gzip", "br"),
+    ("gzip, deflate", "gzip"),
+    ("identity", None),
+    (None, None),
+])
+def test_precompressed_variant_selection(manifest, fake_brotli, accept_encoding, expected):
+    manifest.precompress()
+    asset = manifest.get("main.dart.js")
+    assert set(asset.variants) == {"br", "gzip"}
+
+    response = api_server.static_response(request("/main.dart.js", accept_encoding), asset)
+    assert response.headers.get("content-encoding") == expected
+    assert response.headers["vary"] == "Accept-Encoding"
+    assert response.headers["etag"] == asset.etag(expected)
+    expected_path = asset.variants[expected][0] if expected else asset.path
+    assert response.path == str(expected_path)
+
+def test_range_requests_use_the_original(manifest, fake_brotli):
+    manifest.precompress()
+    asset = manifest.get("main.dart.js")
+    response = api_server.static_response(request("/main.dart.js", "br, gzip", range="bytes=0-9"), asset)
+    assert "content-encoding" not in response.headers
+    assert response.path == str(asset.path)
+
+def test_variants_skip_small_files_and_prefer_prebuilt_copies(manifest, web_dir, monkeypatch):
+    monkeypatch.setattr(static_assets, "brotli", None)
+    prebuilt = web_dir / "main.dart.js.gz"
+    prebuilt.write_bytes(gzip.compress(BUNDLE.encode("utf-8")))
+    manifest.precompress()
+
+    assert manifest.get("main.dart.js").variants["gzip"][0] == prebuilt
+    assert manifest.get("main.3f2a9c1d7e.js").variants["gzip"][0].parent == manifest.cache_dir
+    assert manifest.get("assets/fonts/small.ttf").variants == {}
+    # 빌드 시 만든 사본은 따로 서빙하지 않음
+    assert manifest.get("main.dart.js.gz") is None
+
+def test_not_modified(manifest):
+    asset = manifest.get("main.dart.js")
+    response = api_server.static_response(request("/main.dart.js", if_none_match=asset.etag()), asset)
+    assert response.status_code == 304
+    assert response.headers["cache-control"] == asset.cache_control
+
+def test_missing_bundle_files_404_and_app_routes_fall_back_to_index(manifest, monkeypatch):
+    monkeypatch.setattr(api_server, "static_manifest", manifest)
+    index_path = str(manifest.get("index.html").path)
+
+    def serve(path):
+        return asyncio.run(api_server.serve_flutter_web(request(f"/{path}"), path))
+
+    for path in ("assets/missing.png", "canvaskit/canvaskit.wasm", "icons/Icon-512.png"):
+        with pytest.raises(api_server.HTTPException) as error:
+            serve(path)
+        assert error.value.status_code == 404
+
+    assert serve("candidates/lee").path == index_path
+    assert serve("main.dart.js").path == str(manifest.get("main.dart.js").path)
@@ -0,0 +1,44 @@
+import copy
+
+from starlette.requests import Request
+
+import api_server
+from api_server import STATUS_VOLATILE_KEYS, json_response
+
+STATUS = {
+    "status": "healthy",
+    "server_time": "2026-06-03T12:00:00",
+    "collection_task": {"state": "running", "started_at": "2026-06-03T11:59:00", "elapsed_seconds": 60.0},
+    "collection_progress": {"stage": "analyzing", "collected": 40, "processed": 20},
+}
+
+def request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode("latin-1"))] if if_none_match else []
+    return Request({"type": "http", "method": "GET", "path": "/api/status", "headers": headers})
+
+def respond(data, if_none_match=None):
+    return json_response(request(if_none_match), data, "no-cache", volatile_keys=STATUS_VOLATILE_KEYS)
+
+def test_time_derived_values_do_not_change_validator():
+    first = respond(STATUS)
+    later = copy.deepcopy(STATUS)
+    later["server_time"] = "2026-06-03T12:00:05"
+    later["collection_task"]["elapsed_seconds"] = 65.0
+
+    assert respond(later).headers["ETag"] == first.headers["ETag"]
+    assert respond(later, first.headers["ETag"]).status_code == 304
+    # 검증자 계산이 원본 데이터를 건드리지 않음
+    assert later["collection_task"]["elapsed_seconds"] == 65.0
+
+def test_progress_changes_validator():
+    first = respond(STATUS)
+    progressed = copy.deepcopy(STATUS)
+    progressed["collection_progress"]["processed"] = 21
+
+    response = respond(progressed, first.headers["ETag"])
+    assert response.status_code == 200
+    assert response.headers["ETag"] != first.headers["ETag"]
+
+def test_missing_nested_parent_is_ignored():
+    data = {"status": "healthy", "collection_task": None}
+    assert api_server._without_keys(data, STATUS_VOLATILE_KEYS) == data
@@ -0,0 +1,84 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+from news_scraper import TrendAggregator, empty_candidate_stats, parse_published_date
+
+BASE = datetime(2026, 6, 3, 12, 0, tzinfo=timezone.utc)
+
+def article(url, sentiment="긍정", source="A일보", published=BASE, title="이재명 김문수 토론"):
+    return {"url": url, "title": title, "summary": "", "sentiment": sentiment, "source": source,
+            "published_date": format_datetime(published, usegmt=True) if published else ""}
+
+def hour_of(published):
+    return parse_published_date(format_datetime(published, usegmt=True)).strftime('%Y-%m-%dT%H:00')
+
+def assert_empty(aggregator):
+    assert len(aggregator) == 0
+    assert aggregator.candidate_stats() == empty_candidate_stats()
+    snapshot = aggregator.snapshot()
+    assert snapshot["source_stats"] == {} and snapshot["hourly_stats"] == {}
+    assert set(snapshot["sentiment_stats"].values()) == {0}
+
+def test_add_then_remove_returns_counters_to_zero():
+    aggregator = TrendAggregator()
+    items = [article("a"), article("b", "부정", "B일보", BASE + timedelta(hours=2)), article("c", "중립", "", None)]
+    aggregator.add_many(items)
+
+    snapshot = aggregator.snapshot()
+    assert snapshot["total_articles"] == 3
+    assert snapshot["candidate_stats"]["이재명"] == {"긍정": 1, "부정": 1, "중립": 1}
+    assert snapshot["source_stats"] == {"A일보": 1, "B일보": 1}
+    assert snapshot["hourly_stats"] == {hour_of(BASE): 1, hour_of(BASE + timedelta(hours=2)): 1}
+
+    for item in items:
+        assert aggregator.remove(item)
+    assert not aggregator.remove(items[0])
+    assert_empty(aggregator)
+
+def test_re_adding_replaces_previous_contribution():
+    aggregator = TrendAggregator([article("a", "긍정", "A일보")])
+    aggregator.add(article("a", "부정", "B일보", BASE + timedelta(hours=1), title="이준석 발언"))
+    snapshot = aggregator.snapshot()
+    assert snapshot["total_articles"] == 1
+    assert snapshot["candidate_stats"]["이재명"] == {"긍정": 0, "부정": 0, "중립": 0}
+    assert snapshot["candidate_stats"]["이준석"]["부정"] == 1
+    assert snapshot["source_stats"] == {"B일보": 1}
+    assert snapshot["hourly_stats"] == {hour_of(BASE + timedelta(hours=1)): 1}
+
+def test_expiry_decrements_source_and_hour_counters():
+    aggregator = TrendAggregator([article("old", source="A일보"),
+                                  article("new", source="B일보", published=BASE + timedelta(hours=3))])
+    assert aggregator.expire_before(BASE + timedelta(hours=1)) == 1
+    snapshot = aggregator.snapshot()
+    assert snapshot["source_stats"] == {"B일보": 1}
+    assert snapshot["hourly_stats"] == {hour_of(BASE + timedelta(hours=3)): 1}
+    assert aggregator.source_counts["A일보"] == 0 and aggregator.hourly_counts[hour_of(BASE)] == 0
+
+def test_expiry_skips_removed_and_re_added_entries():
+    aggregator = TrendAggregator()
+    removed, moved = article("removed"), article("moved")
+    aggregator.add_many([removed, moved])
+    aggregator.remove(removed)
+    # 같은 URL이 더 늦은 발행 시각으로 다시 들어오면 이전 힙 항목은 무시
+    aggregator.add(article("moved", published=BASE + timedelta(hours=5)))
+
+    assert aggregator.expire_before(BASE + timedelta(hours=1)) == 0
+    assert len(aggregator) == 1 and article("moved") in aggregator
+    assert aggregator.expire_before(BASE + timedelta(hours=6)) == 1
+    assert_empty(aggregator)
+    assert aggregator._expiry_heap == []
+
+def test_undated_articles_expire_by_first_seen_time():
+    seen = {**article("seen", published=None), "first_seen_at": BASE.isoformat()}
+    unseen = article("unseen", published=None)  # 기록이 없으면 지금 본 것으로 취급
+    aggregator = TrendAggregator([seen, unseen])
+    assert aggregator.expire_before(BASE - timedelta(hours=1)) == 0
+    assert aggregator.expire_before(BASE + timedelta(hours=1)) == 1
+    assert unseen in aggregator and seen not in aggregator
+
+    # 다시 들어와도 처음 본 시각을 유지
+    first_expiry = aggregator._expiry_times[TrendAggregator._article_key(unseen)]
+    aggregator.add({**unseen, "sentiment": "부정"})
+    assert aggregator._expiry_times[TrendAggregator._article_key(unseen)] == first_expiry
+    assert aggregator.expire_before(datetime.now(timezone.utc) + timedelta(seconds=1)) == 1
+    assert_empty(aggregator)
@@ -7,14 +7,22 @@
 
 import os
 import sys
+import gzip
+import asyncio
 import json
 import time
 import shutil
+import random
+import hashlib
 import threading
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Dict, Any, Optional, List
+from collections import deque
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from itertools import islice
+from typing import Dict, Any, Optional, List, Iterable, Callable
 from contextlib import asynccontextmanager
+from dataclasses import dataclass, replace
 
 # 상위 디렉토리를 Python 경로에 추가
 current_dir = Path(__file__).parent
@@ -22,13 +30,22 @@ parent_dir = current_dir.parent
 sys.path.insert(0, str(parent_dir))
 
 import uvicorn
-from fastapi import FastAPI, BackgroundTasks, HTTPException, Request, Response
-from fastapi.staticfiles import StaticFiles
+from fastapi import FastAPI, BackgroundTasks, HTTPException, Request, Response, Query
 from fastapi.responses import FileResponse, JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
 
 import logging
 
+# 빠른 JSON 인코더 / brotli 압축 (없으면 표준 라이브러리로 대체)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
 # 로깅 설정
 logging.basicConfig(
     level=logging.INFO,
@@ -38,7 +55,7 @@ logger = logging.getLogger(__name__)
 
 # news_scraper 모듈 import (오류 처리 포함)
 try:
-    from news_scraper import NewsPipeline, rank_news_by_importance
+    from news_scraper import NewsPipeline, rank_news_by_importance, select_top_news, keyword_matcher
     NEWS_SCRAPER_AVAILABLE = True
     logger.info("✅ news_scraper 모듈 로드 성공")
 except ImportError as e:
@@ -49,11 +66,26 @@ except ImportError as e:
     class NewsPipeline:
         def __init__(self):
             pass
-        def run_daily_collection(self):
+        def run_daily_collection(self, force=False):
             logger.warning("⚠️ 뉴스 수집 기능이 비활성화되었습니다.")
+        def get_progress(self):
+            return {"stage": "disabled"}
     
-    def rank_news_by_importance(news_data, limit=30):
+    def rank_news_by_importance(news_data, limit=30, weights=None):
         return news_data[:limit]
+    
+    def select_top_news(articles, limit=100, chunk_size=500, weights=None):
+        return list(islice(articles, limit))
+    
+    from keyword_matcher import KeywordMatcher
+    keyword_matcher = KeywordMatcher({"candidate": ["이재명", "김문수", "이준석"]})
+
+from history_store import HistoryStore, HISTORY_DB_PATH, BUCKET_FORMATS
+from snapshot_reader import SnapshotReader
+from shared_state import SharedStateCoordinator, shared_state_supported
+from static_assets import StaticAssetManifest
+from cors_layer import CORSLayer
+from metrics import REGISTRY, CONTENT_TYPE as METRICS_CONTENT_TYPE, MetricsMiddleware, gauge
 
 # === 상수 및 설정 ===
 ASSETS_DIR = parent_dir / "assets"
@@ -61,6 +93,29 @@ ASSETS_DIR.mkdir(parents=True, exist_ok=True)
 
 DEFAULT_DATA_FILE = ASSETS_DIR / "trend_summary_default.json"
 
+# 시작 시 수집 방식 ('background': 바로 서비스 시작, 'blocking': 수집 완료까지 최대 STARTUP_COLLECTION_TIMEOUT초 대기)
+STARTUP_COLLECTION_MODE = os.getenv("STARTUP_COLLECTION_MODE", "background")
+STARTUP_COLLECTION_TIMEOUT = int(os.getenv("STARTUP_COLLECTION_TIMEOUT", "600"))
+
+# 수집 종료 후 이 시간(초) 안에 들어온 수집 요청은 새로 시작하지 않음
+COLLECTION_DEBOUNCE_SECONDS = int(os.getenv("COLLECTION_DEBOUNCE_SECONDS", "60"))
+
+# 주기적 증분 수집 (0이면 비활성화 - 기존 최종 1회 수집 모드)
+COLLECTION_INTERVAL_MINUTES = float(os.getenv("COLLECTION_INTERVAL_MINUTES", "0"))
+COLLECTION_JITTER_SECONDS = float(os.getenv("COLLECTION_JITTER_SECONDS", "60"))
+INCREMENTAL_WINDOW_HOURS = float(os.getenv("INCREMENTAL_WINDOW_HOURS", "24"))
+SCHEDULER_HISTORY_SIZE = int(os.getenv("SCHEDULER_HISTORY_SIZE", "20"))
+
+# 멀티 워커 공유 상태 ('auto': WEB_CONCURRENCY > 1이면 사용, 'true'/'false'로 강제)
+SHARED_STATE = os.getenv("SHARED_STATE", "auto").lower()
+WEB_CONCURRENCY = int(os.getenv("WEB_CONCURRENCY", "1"))
+
+# 캐시에 보관할 중요도 상위 기사 수 (스냅샷 전체를 메모리에 올리지 않음)
+NEWS_LIST_LIMIT = int(os.getenv("NEWS_LIST_LIMIT", "100"))
+
+# 에셋 카탈로그 디렉토리 변경 확인 주기 (초)
+ASSET_CATALOG_POLL_SECONDS = float(os.getenv("ASSET_CATALOG_POLL_SECONDS", "2"))
+
 # Render.com 영구 저장소 설정
 PERSISTENT_DIR = None
 if os.environ.get('RENDER') == 'true':
@@ -68,6 +123,12 @@ if os.environ.get('RENDER') == 'true':
     PERSISTENT_DIR.mkdir(parents=True, exist_ok=True)
     logger.info(f"📂 Render.com 영구 저장소 설정: {PERSISTENT_DIR}")
 
+# 히스토리 DB는 영구 저장소가 있으면 그쪽에 보관
+if PERSISTENT_DIR and not os.getenv("HISTORY_DB_PATH"):
+    HISTORY_DB_PATH = PERSISTENT_DIR / "trend_history.db"
+HISTORY_DEFAULT_DAYS = int(os.getenv("HISTORY_DEFAULT_DAYS", "7"))
+HISTORY_CACHE_CONTROL = os.getenv("HISTORY_CACHE_CONTROL", "public, max-age=300")
+
 # Flutter 웹 앱 경로
 FLUTTER_WEB_DIR = parent_dir / "flutter_ui/web"
 logger.info(f"📂 Flutter 웹 디렉토리 경로: {FLUTTER_WEB_DIR}")
@@ -91,108 +152,554 @@ else:
             FLUTTER_WEB_DIR = alt_path
             break
 
+# 정적 파일 매니페스트 (요청마다 파일 시스템을 조회하지 않음) - 표는 lifespan에서 생성
+static_manifest = StaticAssetManifest(FLUTTER_WEB_DIR) if FLUTTER_WEB_DIR.exists() else None
+
+# 매니페스트에 없을 때 index.html 대신 404를 돌려줄 경로 (번들 파일 디렉토리)
+STATIC_NOT_FOUND_PREFIXES = ("assets/", "canvaskit/", "icons/")
+
+# 엔드포인트별 Cache-Control (클라이언트 폴링 주기에 맞춰 조정)
+TREND_CACHE_CONTROL = os.getenv("TREND_CACHE_CONTROL", "public, max-age=60, must-revalidate")
+PREDICTION_CACHE_CONTROL = os.getenv("PREDICTION_CACHE_CONTROL", "public, max-age=60, must-revalidate")
+STATUS_CACHE_CONTROL = os.getenv("STATUS_CACHE_CONTROL", "no-cache")
+
+# === 응답 사전 렌더링 ===
+class RenderedPayload:
+    """미리 직렬화/압축해 둔 JSON 응답"""
+
+    def __init__(self, data: Any):
+        if orjson is not None:
+            self.body = orjson.dumps(data)
+        else:
+            self.body = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        self.etag_value = hashlib.blake2b(self.body, digest_size=16).hexdigest()
+        self.gzip_body = gzip.compress(self.body, compresslevel=9)
+        self.br_body = brotli.compress(self.body, quality=11) if brotli is not None else None
+
+    def etag(self, encoding: Optional[str] = None) -> str:
+        """인코딩별 강한 ETag (압축본은 바이트가 다르므로 별도 값)"""
+        return f'"{self.etag_value}-{encoding}"' if encoding else f'"{self.etag_value}"'
+
+    def select(self, accept_encoding: str):
+        """Accept-Encoding에 맞는 (인코딩, 본문) 선택 - br > gzip > 원본"""
+        accepted = {part.split(";")[0].strip() for part in accept_encoding.lower().split(",")}
+        if self.br_body is not None and "br" in accepted:
+            return "br", self.br_body
+        if "gzip" in accepted:
+            return "gzip", self.gzip_body
+        return None, self.body
+
+# === 조건부 요청 (ETag / Last-Modified) ===
+def _strip_weak(tag: str) -> str:
+    return tag[2:] if tag.startswith("W/") else tag
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """If-None-Match / If-Modified-Since 검사 - If-None-Match가 있으면 그것만 사용"""
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        # If-None-Match는 약한 비교
+        target = _strip_weak(etag)
+        return any(_strip_weak(tag.strip()) == target for tag in if_none_match.split(","))
+    
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP 날짜는 초 단위
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+def http_date(value: Optional[datetime]) -> Optional[datetime]:
+    """로컬 naive datetime을 UTC aware datetime으로 변환"""
+    if value is None:
+        return None
+    return value.astimezone(timezone.utc)
+
+def validator_headers(etag: str, cache_control: str, last_modified: Optional[datetime] = None) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+def payload_response(request: Request, payload: RenderedPayload, cache_control: str = "no-cache",
+                     last_modified: Optional[datetime] = None) -> Response:
+    """사전 렌더링된 바이트를 그대로 응답 (변경 없으면 304)"""
+    encoding, body = payload.select(request.headers.get("accept-encoding", ""))
+    last_modified = http_date(last_modified)
+    headers = validator_headers(payload.etag(encoding), cache_control, last_modified)
+    
+    if is_not_modified(request, headers["ETag"], last_modified):
+        return Response(status_code=304, headers=headers)
+    
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _without_keys(data: Dict[str, Any], keys: tuple) -> Dict[str, Any]:
+    """점으로 구분한 경로(예: "collection_task.elapsed_seconds")의 값을 뺀 사본"""
+    stable = dict(data)
+    for key in keys:
+        parent = stable
+        *path, leaf = key.split(".")
+        for name in path:
+            child = parent.get(name)
+            if not isinstance(child, dict):
+                break
+            parent[name] = child = dict(child)
+            parent = child
+        else:
+            parent.pop(leaf, None)
+    return stable
+
+def json_response(request: Request, data: Dict[str, Any], cache_control: str,
+                  volatile_keys: tuple = (), last_modified: Optional[datetime] = None) -> Response:
+    """매 요청 생성되는 작은 JSON 응답 - volatile_keys를 제외한 내용으로 약한 ETag 생성
+    
+    volatile_keys에는 시각에서 계산되는 값(현재 시각, 경과 시간)만 넣음 - 304를 받은 클라이언트는 이전 값을 보게 됨
+    """
+    stable = _without_keys(data, volatile_keys)
+    digest = hashlib.blake2b(json.dumps(stable, sort_keys=True, default=str).encode("utf-8"), digest_size=16).hexdigest()
+    last_modified = http_date(last_modified)
+    headers = validator_headers(f'W/"{digest}"', cache_control, last_modified)
+    
+    if is_not_modified(request, headers["ETag"], last_modified):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=data, headers=headers)
+
+def build_prediction_data(data: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """감성 통계 기반 예측 데이터 생성"""
+    # 기본 예측 데이터 생성
+    if not data:
+        return {
+            "predictions": {
+                "이재명": 35.0,
+                "김문수": 30.0,
+                "이준석": 25.0
+            },
+            "analysis": "데이터를 수집 중입니다. 잠시 후 다시 확인해주세요.",
+            "total_articles": 0,
+            "time_range": "데이터 수집 중"
+        }
+    
+    # 뉴스 데이터를 기반으로 예측 생성
+    candidate_stats = data.get("candidate_stats", {})
+    total_articles = data.get("total_articles", 0)
+    
+    # 간단한 예측 알고리즘 (감성 분석 기반)
+    predictions = {}
+    base_score = 30.0  # 기본 점수
+    
+    for candidate, stats in candidate_stats.items():
+        positive = stats.get("긍정", 0)
+        negative = stats.get("부정", 0)
+        neutral = stats.get("중립", 0)
+        total = positive + negative + neutral
+        
+        if total > 0:
+            sentiment_score = (positive - negative) / total * 10
+            predictions[candidate] = max(10.0, min(50.0, base_score + sentiment_score))
+        else:
+            predictions[candidate] = base_score
+    
+    # 정규화 (총합 100%)
+    total_pred = sum(predictions.values())
+    if total_pred > 0:
+        predictions = {k: (v / total_pred) * 100 for k, v in predictions.items()}
+    
+    return {
+        "predictions": predictions,
+        "analysis": data.get("trend_summary", "분석 중..."),
+        "total_articles": total_articles,
+        "time_range": data.get("time_range", "")
+    }
+
+# === 뉴스 목록 인덱스 ===
+NEWS_PAGE_DEFAULT_LIMIT = int(os.getenv("NEWS_PAGE_DEFAULT_LIMIT", "20"))
+NEWS_PAGE_MAX_LIMIT = int(os.getenv("NEWS_PAGE_MAX_LIMIT", "100"))
+NEWS_CACHE_CONTROL = os.getenv("NEWS_CACHE_CONTROL", "public, max-age=60, must-revalidate")
+
+# fields 파라미터로 고를 수 있는 기사 필드 (수집 파이프라인이 만드는 기사 형식)
+NEWS_ARTICLE_FIELDS = ("title", "summary", "url", "published_date", "source", "sentiment", "query",
+                       "importance_score", "first_seen_at")
+
+class NewsIndex:
+    """news_list 보조 인덱스 - 후보/감성/언론사별 기사 위치 목록"""
+
+    def __init__(self, news_list: List[Dict[str, Any]], candidates: Iterable[str]):
+        self.news_list = news_list
+        self.by_candidate: Dict[str, List[int]] = {candidate: [] for candidate in candidates}
+        self.by_sentiment: Dict[str, List[int]] = {}
+        self.by_source: Dict[str, List[int]] = {}
+        
+        for position, article in enumerate(news_list):
+            # 수집기 집계(candidate_stats)와 같은 매칭 규칙으로 후보 언급 판정
+            mentioned = keyword_matcher.find(article.get("title", "") + "\n" + article.get("summary", "")).get("candidate", ())
+            for candidate, positions in self.by_candidate.items():
+                if candidate in mentioned:
+                    positions.append(position)
+            self.by_sentiment.setdefault(article.get("sentiment", "중립"), []).append(position)
+            self.by_source.setdefault(article.get("source", ""), []).append(position)
+
+    def filter(self, candidate: Optional[str] = None, sentiment: Optional[str] = None,
+               source: Optional[str] = None) -> List[int]:
+        """조건에 맞는 기사 위치 (중요도 순서 유지)"""
+        lists = []
+        if candidate is not None:
+            lists.append(self.by_candidate.get(candidate, []))
+        if sentiment is not None:
+            lists.append(self.by_sentiment.get(sentiment, []))
+        if source is not None:
+            lists.append(self.by_source.get(source, []))
+        if not lists:
+            return range(len(self.news_list))
+        
+        # 가장 짧은 목록을 기준으로 나머지와 교집합
+        lists.sort(key=len)
+        positions = lists[0]
+        for other in lists[1:]:
+            other_set = set(other)
+            positions = [position for position in positions if position in other_set]
+        return positions
+
+    def page(self, positions, offset: int, limit: int, fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+        """요청 구간의 기사만 꺼내고 필요한 필드만 남김"""
+        articles = [self.news_list[position] for position in positions[offset:offset + limit]]
+        if fields:
+            articles = [{field: article.get(field) for field in fields} for article in articles]
+        return articles
+
 # === 뉴스 캐시 관리 클래스 ===
+# 롤백/비교용으로 보관할 이전 스냅샷 수
+CACHE_HISTORY_SIZE = int(os.getenv("CACHE_HISTORY_SIZE", "5"))
+
+@dataclass(frozen=True)
+class CacheSnapshot:
+    """캐시 내용 한 벌 - 만든 뒤에는 바꾸지 않음 (data도 읽기 전용으로 취급)"""
+    version: int
+    data: Dict[str, Any]
+    rendered: Dict[str, RenderedPayload]
+    index: NewsIndex
+    created_at: datetime
+    activated_at: Optional[datetime] = None  # 현재 스냅샷이 된 시각 (롤백 시 갱신)
+
+    @classmethod
+    def build(cls, version: int, data: Dict[str, Any]) -> "CacheSnapshot":
+        return cls(
+            version=version,
+            data=data,
+            rendered={
+                "trend_summary": RenderedPayload(data),
+                "prediction": RenderedPayload(build_prediction_data(data))
+            },
+            index=NewsIndex(data.get("news_list", []), data.get("candidate_stats", {})),
+            created_at=datetime.now()
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "created_at": self.created_at.isoformat(),
+            "time_range": self.data.get("time_range", ""),
+            "total_articles": self.data.get("total_articles", 0),
+            "etag": self.rendered["trend_summary"].etag()
+        }
+
+@dataclass(frozen=True)
+class CacheHealth:
+    update_count: int = 0
+    error_count: int = 0
+    last_error: Optional[str] = None
+
 class NewsCache:
-    """뉴스 데이터 캐시 관리"""
+    """뉴스 데이터 캐시 관리
     
-    def __init__(self):
-        self.latest_data: Optional[Dict[str, Any]] = None
-        self.last_update: Optional[datetime] = None
-        self.update_count: int = 0
-        self.error_count: int = 0
-        self.last_error: Optional[str] = None
+    읽기: self.snapshot 참조 하나만 읽으므로 락 없이 항상 일관된 한 벌을 봄
+    쓰기: 새 스냅샷을 락 밖에서 만든 뒤 _write_lock 안에서 참조만 교체
+    """
+    
+    def __init__(self, history_size: int = CACHE_HISTORY_SIZE):
+        self.snapshot: Optional[CacheSnapshot] = None
+        self.health = CacheHealth()
+        self.history: deque = deque(maxlen=history_size)  # 이전 스냅샷 (오래된 것부터)
+        self._write_lock = threading.Lock()
+        self._next_version = 1
+        self.listeners: List[Callable[[CacheSnapshot], None]] = []  # 스냅샷 교체 후 호출
         self.pipeline = NewsPipeline()
         self.initial_fetch_done = False
         self.final_collection_completed = False  # 최종 수집 완료 플래그
 
-    def update(self, data: Dict[str, Any]) -> None:
-        """캐시 데이터 업데이트"""
-        self.latest_data = data
-        self.last_update = datetime.now()
-        self.update_count += 1
-        self.error_count = 0
-        self.last_error = None
-        logger.info(f"✅ 캐시 업데이트 완료 (#{self.update_count})")
+    # --- 읽기 (현재 스냅샷 기준) ---
+    @property
+    def latest_data(self) -> Optional[Dict[str, Any]]:
+        snapshot = self.snapshot
+        return snapshot.data if snapshot else None
+
+    @property
+    def last_update(self) -> Optional[datetime]:
+        snapshot = self.snapshot
+        return snapshot.activated_at if snapshot else None
+
+    @property
+    def update_count(self) -> int:
+        return self.health.update_count
+
+    # --- 쓰기 ---
+    def _swap(self, snapshot: CacheSnapshot) -> None:
+        """현재 스냅샷 교체 (호출 측이 _write_lock 보유)"""
+        if self.snapshot is not None:
+            self.history.append(self.snapshot)
+        self.snapshot = replace(snapshot, activated_at=datetime.now())
+        self.health = CacheHealth(update_count=self.health.update_count + 1)
+
+    def update(self, data: Dict[str, Any], version: Optional[int] = None) -> None:
+        """캐시 데이터 업데이트 - 응답 본문/인덱스를 모두 만든 뒤 참조 하나만 교체
+        
+        version: 리더가 게시한 스냅샷을 반영할 때 리더의 번호 (순서는 리더가 정했으므로 항상 교체)
+        """
+        mirrored = version is not None
+        with self._write_lock:
+            if mirrored:
+                self._next_version = max(self._next_version, version + 1)
+            else:
+                version = self._next_version
+                self._next_version += 1
+        # 직렬화/압축은 락 밖에서
+        snapshot = CacheSnapshot.build(version, data)
+        with self._write_lock:
+            # 더 늦게 시작한 쓰기가 먼저 끝났으면 오래된 스냅샷은 이력에만 남김
+            if not mirrored and self.snapshot is not None and self.snapshot.version > version:
+                self.history.append(snapshot)
+                return
+            self._swap(snapshot)
+            current = self.snapshot
+        logger.info(f"✅ 캐시 업데이트 완료 (#{self.update_count}, 버전 {version})")
+        self._notify(current)
+
+    def rollback(self, version: Optional[int] = None) -> Optional[CacheSnapshot]:
+        """이전 스냅샷으로 되돌리기 - version이 없으면 직전 스냅샷"""
+        with self._write_lock:
+            if not self.history:
+                return None
+            if version is None:
+                target = self.history[-1]
+            else:
+                target = next((snap for snap in self.history if snap.version == version), None)
+                if target is None:
+                    return None
+            self.history.remove(target)
+            self._swap(target)
+            restored = self.snapshot
+        logger.warning(f"⏪ 캐시 롤백: 버전 {target.version}")
+        self._notify(restored)
+        return restored
+
+    def _notify(self, snapshot: CacheSnapshot) -> None:
+        for listener in self.listeners:
+            try:
+                listener(snapshot)
+            except Exception as e:
+                logger.error(f"❌ 캐시 변경 알림 실패: {str(e)}")
 
     def record_error(self, error: str) -> None:
         """오류 기록"""
-        self.error_count += 1
-        self.last_error = error
-        logger.error(f"❌ 캐시 오류 #{self.error_count}: {error}")
+        with self._write_lock:
+            health = self.health
+            self.health = CacheHealth(health.update_count, health.error_count + 1, error)
+        logger.error(f"❌ 캐시 오류 #{self.health.error_count}: {error}")
+
+    # --- 조회/비교 ---
+    def find(self, version: int) -> Optional[CacheSnapshot]:
+        current = self.snapshot
+        if current is not None and current.version == version:
+            return current
+        return next((snap for snap in list(self.history) if snap.version == version), None)
+
+    def list_snapshots(self) -> List[Dict[str, Any]]:
+        current = self.snapshot
+        snapshots = [{**snap.summary(), "current": False} for snap in list(self.history)]
+        if current is not None:
+            snapshots.append({**current.summary(), "current": True})
+        return snapshots
+
+    @staticmethod
+    def diff(old: CacheSnapshot, new: CacheSnapshot) -> Dict[str, Any]:
+        """두 스냅샷 차이 - 후보별 감성 증감, 추가/제거된 기사"""
+        old_stats = old.data.get("candidate_stats", {})
+        new_stats = new.data.get("candidate_stats", {})
+        stats_delta = {}
+        for candidate in set(old_stats) | set(new_stats):
+            before, after = old_stats.get(candidate, {}), new_stats.get(candidate, {})
+            stats_delta[candidate] = {
+                sentiment: after.get(sentiment, 0) - before.get(sentiment, 0)
+                for sentiment in set(before) | set(after)
+            }
+        
+        old_articles = {article.get("url"): article for article in old.data.get("news_list", [])}
+        new_articles = {article.get("url"): article for article in new.data.get("news_list", [])}
+        return {
+            "from": old.summary(),
+            "to": new.summary(),
+            "total_articles_delta": new.data.get("total_articles", 0) - old.data.get("total_articles", 0),
+            "candidate_stats_delta": stats_delta,
+            "added": [{"title": a.get("title"), "url": url} for url, a in new_articles.items() if url not in old_articles],
+            "removed": [{"title": a.get("title"), "url": url} for url, a in old_articles.items() if url not in new_articles]
+        }
 
     def get_status(self) -> Dict[str, Any]:
         """캐시 상태 반환"""
+        snapshot, health = self.snapshot, self.health
         return {
-            "last_update": self.last_update.isoformat() if self.last_update else None,
-            "update_count": self.update_count,
-            "error_count": self.error_count,
-            "last_error": self.last_error,
-            "is_healthy": self.error_count < 3 and self.last_update is not None,
+            "last_update": snapshot.activated_at.isoformat() if snapshot else None,
+            "version": snapshot.version if snapshot else None,
+            "update_count": health.update_count,
+            "error_count": health.error_count,
+            "last_error": health.last_error,
+            "is_healthy": health.error_count < 3 and snapshot is not None,
+            "history_size": len(self.history),
             "initial_fetch_done": self.initial_fetch_done,
             "final_collection_completed": self.final_collection_completed
         }
 
     def is_today_data(self) -> bool:
         """현재 캐시 데이터가 오늘 것인지 확인"""
-        if not self.latest_data:
+        data = self.latest_data
+        if not data:
             return False
         
         today = datetime.now().strftime("%Y-%m-%d")
-        time_range = self.latest_data.get("time_range", "")
+        time_range = data.get("time_range", "")
         return today in time_range
 
 # === 파일 관리 유틸리티 ===
+def extract_datetime_from_filename(filepath: Path) -> datetime:
+    """파일명에서 날짜시간 추출"""
+    try:
+        # trend_summary_2025-05-26_13-03.json 형식에서 날짜시간 추출
+        parts = filepath.stem.split('_')
+        if len(parts) >= 3:
+            date_str = parts[2]  # 2025-05-26
+            time_str = parts[3] if len(parts) > 3 else "00-00"  # 13-03
+            datetime_str = f"{date_str} {time_str.replace('-', ':')}"
+            return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
+    except Exception:
+        pass
+    # 파싱 실패 시 파일 수정 시간 사용
+    return datetime.fromtimestamp(filepath.stat().st_mtime)
+
+class AssetCatalog:
+    """trend_summary 스냅샷 인덱스 - 디렉토리 mtime이 바뀔 때만 다시 스캔"""
+    
+    def __init__(self, directory: Path, poll_seconds: float = ASSET_CATALOG_POLL_SECONDS):
+        self.directory = directory
+        self.poll_seconds = poll_seconds
+        self._lock = threading.Lock()
+        self._timestamps: Dict[str, datetime] = {}  # 파일명 -> 시각 (파싱 결과 재사용)
+        self._by_date: Dict[str, List[Path]] = {}
+        self._latest: Optional[Path] = None
+        self._dir_mtime_ns: Optional[int] = None
+        self._last_check = 0.0
+
+    def refresh(self, force: bool = False) -> None:
+        """디렉토리가 바뀌었으면 인덱스 재구성"""
+        now = time.monotonic()
+        if not force and now - self._last_check < self.poll_seconds:
+            return
+        
+        with self._lock:
+            self._last_check = now
+            try:
+                dir_mtime_ns = self.directory.stat().st_mtime_ns
+            except FileNotFoundError:
+                dir_mtime_ns = None
+            if not force and dir_mtime_ns == self._dir_mtime_ns:
+                return
+            self._rebuild()
+            self._dir_mtime_ns = dir_mtime_ns
+
+    def _rebuild(self) -> None:
+        timestamps: Dict[str, datetime] = {}
+        by_date: Dict[str, List[Path]] = {}
+        latest: Optional[Path] = None
+        latest_time: Optional[datetime] = None
+        
+        try:
+            entries = list(os.scandir(self.directory))
+        except FileNotFoundError:
+            entries = []
+        
+        for entry in entries:
+            name = entry.name
+            # 기본 파일 제외하고 날짜가 포함된 파일들만 인덱싱
+            if not (name.startswith("trend_summary_") and name.endswith(".json")) or name == DEFAULT_DATA_FILE.name:
+                continue
+            path = self.directory / name
+            stamp = self._timestamps.get(name)
+            if stamp is None:
+                try:
+                    stamp = extract_datetime_from_filename(path)
+                except OSError:
+                    continue
+            timestamps[name] = stamp
+            
+            # get_today_files 기존 동작과 같이 파일명의 날짜로 묶음
+            parts = path.stem.split('_')
+            if len(parts) >= 4:
+                by_date.setdefault(parts[2], []).append(path)
+            
+            if latest_time is None or stamp > latest_time:
+                latest, latest_time = path, stamp
+        
+        self._timestamps = timestamps
+        self._by_date = by_date
+        if latest != self._latest and latest is not None:
+            logger.info(f"📂 최신 날짜 파일 발견: {latest}")
+        self._latest = latest
+
+    def latest(self) -> Optional[Path]:
+        """가장 최신 스냅샷"""
+        self.refresh()
+        return self._latest
+
+    def snapshots(self) -> List[tuple]:
+        """전체 스냅샷 (파일명, 시각, 경로) - 시각순"""
+        self.refresh()
+        return sorted(
+            ((name, stamp, self.directory / name) for name, stamp in self._timestamps.items()),
+            key=lambda item: item[1]
+        )
+
+    def files_for_date(self, date_str: str) -> List[Path]:
+        """해당 날짜(YYYY-MM-DD) 스냅샷 목록"""
+        self.refresh()
+        return list(self._by_date.get(date_str, ()))
+
+    def __len__(self) -> int:
+        self.refresh()
+        return len(self._timestamps)
+
+asset_catalog = AssetCatalog(ASSETS_DIR)
+history_store = HistoryStore(HISTORY_DB_PATH)
+
 class FileManager:
     """파일 관리 유틸리티"""
     
-    @staticmethod
-    def extract_datetime_from_filename(filepath: Path) -> datetime:
-        """파일명에서 날짜시간 추출"""
-        try:
-            # trend_summary_2025-05-26_13-03.json 형식에서 날짜시간 추출
-            parts = filepath.stem.split('_')
-            if len(parts) >= 3:
-                date_str = parts[2]  # 2025-05-26
-                time_str = parts[3] if len(parts) > 3 else "00-00"  # 13-03
-                datetime_str = f"{date_str} {time_str.replace('-', ':')}"
-                return datetime.strptime(datetime_str, "%Y-%m-%d %H:%M")
-        except Exception:
-            pass
-        # 파싱 실패 시 파일 수정 시간 사용
-        return datetime.fromtimestamp(filepath.stat().st_mtime)
+    extract_datetime_from_filename = staticmethod(extract_datetime_from_filename)
 
     @staticmethod
     def find_latest_news_file() -> Optional[Path]:
         """최신 뉴스 데이터 파일 찾기"""
-        # 기본 파일 제외하고 날짜가 포함된 파일들만 찾기
-        news_files = [
-            f for f in ASSETS_DIR.glob("trend_summary_*.json")
-            if f.name != "trend_summary_default.json"
-        ]
-        
-        if not news_files:
-            return None
-            
-        try:
-            # 날짜시간 기준으로 정렬하여 가장 최신 파일 선택
-            latest_file = sorted(
-                news_files,
-                key=FileManager.extract_datetime_from_filename,
-                reverse=True
-            )[0]
-            logger.info(f"📂 최신 날짜 파일 발견: {latest_file}")
-            return latest_file
-        except Exception as e:
-            # 정렬 실패 시 수정 시간 기준으로 폴백
-            latest_file = sorted(news_files, key=lambda p: p.stat().st_mtime, reverse=True)[0]
-            logger.warning(f"⚠️ 날짜 기준 정렬 실패, 수정 시간 기준 사용: {str(e)}")
-            return latest_file
+        return asset_catalog.latest()
 
     @staticmethod
     def get_today_files() -> List[Path]:
         """오늘 날짜의 파일들 반환"""
-        today = datetime.now().strftime("%Y-%m-%d")
-        return list(ASSETS_DIR.glob(f"trend_summary_{today}_*.json"))
+        return asset_catalog.files_for_date(datetime.now().strftime("%Y-%m-%d"))
 
     @staticmethod
     def load_json_file(filepath: Path) -> Optional[Dict[str, Any]]:
@@ -225,27 +732,29 @@ class DataProcessor:
         }
 
     @staticmethod
-    def process_news_data(data: Dict[str, Any]) -> Dict[str, Any]:
-        """뉴스 데이터 처리 및 정규화"""
+    def process_snapshot(header: Dict[str, Any], articles: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """헤더 필드 + 기사 스트림을 캐시용 데이터로 정규화 (기사는 중요도 상위 NEWS_LIST_LIMIT개만 유지)"""
         processed_data = {
-            "trend_summary": data.get("trend_summary", "데이터를 수집 중입니다..."),
-            "candidate_stats": data.get("candidate_stats", DataProcessor.create_default_data()["candidate_stats"]),
-            "total_articles": data.get("total_articles", 0),
-            "time_range": data.get("time_range", "데이터 수집 중"),
-            "news_list": data.get("news_list", [])
+            "trend_summary": header.get("trend_summary", "데이터를 수집 중입니다..."),
+            "candidate_stats": header.get("candidate_stats", DataProcessor.create_default_data()["candidate_stats"]),
+            "total_articles": header.get("total_articles", 0),
+            "time_range": header.get("time_range", "데이터 수집 중"),
+            "news_list": []
         }
         
-        # 뉴스 데이터가 있으면 중요도 기준으로 정렬
-        if processed_data["news_list"]:
-            try:
-                sorted_news = rank_news_by_importance(processed_data["news_list"], limit=100)
-                processed_data["news_list"] = sorted_news
-                logger.info(f"✅ 뉴스 데이터 중요도 정렬 완료: {len(sorted_news)}개")
-            except Exception as e:
-                logger.error(f"❌ 뉴스 정렬 오류: {str(e)}")
+        try:
+            processed_data["news_list"] = select_top_news(articles, limit=NEWS_LIST_LIMIT)
+            logger.info(f"✅ 뉴스 데이터 중요도 정렬 완료: {len(processed_data['news_list'])}개")
+        except Exception as e:
+            logger.error(f"❌ 뉴스 정렬 오류: {str(e)}")
         
         return processed_data
 
+    @staticmethod
+    def process_news_data(data: Dict[str, Any]) -> Dict[str, Any]:
+        """뉴스 데이터 처리 및 정규화"""
+        return DataProcessor.process_snapshot(data, data.get("news_list", []))
+
 # === 전역 인스턴스 ===
 news_cache = NewsCache()
 file_manager = FileManager()
@@ -268,6 +777,7 @@ def update_news_cache() -> None:
                 # 영구 저장소의 파일을 assets에 복사
                 dest_file = ASSETS_DIR / f"trend_summary_{datetime.now().strftime('%Y-%m-%d_%H-%M')}.json"
                 shutil.copy(latest_file, dest_file)
+                asset_catalog.refresh(force=True)
                 logger.info(f"📋 영구 저장소의 파일을 assets에 복사: {dest_file.name}")
                 latest_file = dest_file
         
@@ -276,11 +786,19 @@ def update_news_cache() -> None:
             latest_file = DEFAULT_DATA_FILE
             logger.warning("⚠️ 날짜가 포함된 뉴스 데이터 파일을 찾을 수 없어 기본 데이터를 사용합니다.")
         
-        # 파일 처리
+        # 파일 처리 - 헤더만 읽고 기사는 스트리밍으로 상위 N개 선별
         if latest_file:
-            data = file_manager.load_json_file(latest_file)
-            if data:
-                processed_data = data_processor.process_news_data(data)
+            try:
+                reader = SnapshotReader(latest_file)
+                header = reader.read_header(("trend_summary", "candidate_stats", "total_articles", "time_range"))
+                processed_data = data_processor.process_snapshot(header, reader.iter_articles())
+            except Exception as e:
+                logger.error(f"❌ 파일 로드 실패 {latest_file}: {str(e)}")
+                processed_data = None
+            
+            if processed_data:
+                if latest_file.parent == ASSETS_DIR and latest_file != DEFAULT_DATA_FILE:
+                    history_store.sync([(latest_file.name, extract_datetime_from_filename(latest_file), latest_file)])
                 news_cache.update(processed_data)
                 logger.info(f"✅ 뉴스 캐시 업데이트 완료: {latest_file.name}")
             else:
@@ -293,32 +811,38 @@ def update_news_cache() -> None:
         logger.error(f"❌ 캐시 업데이트 실패: {str(e)}")
 
 # === 뉴스 수집 함수 ===
-def force_news_collection() -> bool:
-    """최종 뉴스 수집 (한 번만 실행)"""
+_collection_lock = threading.Lock()
+
+def force_news_collection() -> Optional[bool]:
+    """최종 뉴스 수집 (한 번만 실행) - 성공 여부, 다른 수집(증분 등)이 실행 중이면 바로 None"""
+    if not _collection_lock.acquire(blocking=False):
+        logger.warning("⏳ 뉴스 수집이 이미 실행 중입니다.")
+        return None
+    try:
+        return _run_news_collection()
+    finally:
+        _collection_lock.release()
+
+def _run_news_collection() -> bool:
     if not NEWS_SCRAPER_AVAILABLE:
         logger.warning("⚠️ 뉴스 수집 기능이 비활성화되어 있습니다.")
         return False
         
-    if news_cache.final_collection_completed:
+    if final_collection_done():
         logger.info("🚫 최종 뉴스 수집이 이미 완료되었습니다.")
         return True
         
     try:
         logger.info("🔥 최종 뉴스 수집을 시작합니다... (200개 기사 목표)")
         
-        # 강제 실행 모드 활성화
-        os.environ['FORCE_NEWS_COLLECTION'] = 'true'
-        
         # 상태 초기화
         news_cache.initial_fetch_done = False
         
-        # 뉴스 수집 실행
-        news_cache.pipeline.run_daily_collection()
-        
-        # 환경변수 해제
-        os.environ.pop('FORCE_NEWS_COLLECTION', None)
+        # 뉴스 수집 실행 (강제 실행은 프로세스 환경변수 대신 인자로 전달)
+        news_cache.pipeline.run_daily_collection(force=True)
         
         # 수집 후 캐시 업데이트
+        asset_catalog.refresh(force=True)
         today_files = file_manager.get_today_files()
         if today_files:
             newest_file = sorted(today_files, key=lambda p: p.stat().st_mtime, reverse=True)[0]
@@ -328,68 +852,411 @@ def force_news_collection() -> bool:
         
         # 상태 업데이트
         news_cache.initial_fetch_done = True
-        news_cache.final_collection_completed = True
+        mark_final_collection_completed()
         
         logger.info("✅ 최종 뉴스 수집 완료 - 더 이상 수집하지 않습니다.")
         return True
         
     except Exception as e:
         logger.error(f"❌ 최종 뉴스 수집 실패: {str(e)}")
-        os.environ.pop('FORCE_NEWS_COLLECTION', None)
-        news_cache.final_collection_completed = True  # 실패해도 다시 시도하지 않음
+        mark_final_collection_completed()  # 실패해도 다시 시도하지 않음
         return False
 
-# === 서버 시작 이벤트를 lifespan으로 변경 ===
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    """서버 시작 시 초기화 - 딱 한번만 뉴스 수집"""
-    try:
-        logger.info("🚀 서버 시작 - 최종 뉴스 수집 초기화 중...")
-        
-        # 뉴스 수집 기능 상태 확인
-        if not NEWS_SCRAPER_AVAILABLE:
-            logger.warning("⚠️ 뉴스 수집 기능이 비활성화되었습니다. 기본 데이터만 제공됩니다.")
-            # 기본 데이터로 캐시 초기화
-            default_data = data_processor.create_default_data("뉴스 수집 기능이 일시적으로 비활성화되었습니다.")
-            news_cache.update(default_data)
-            yield
-            return
-        
-        # 캐시 초기 업데이트
-        update_news_cache()
-        logger.info("✅ 초기 캐시 업데이트 완료")
+class CollectionSupervisor:
+    """백그라운드 수집 작업 감독 - 이벤트 루프를 막지 않고 스레드에서 실행, 상태/오류 기록
+    
+    수집은 항상 하나만 실행 (single-flight): 실행 중에 들어온 요청은 진행 중인 실행에 합류하고,
+    종료 직후 debounce_seconds 안에 들어온 요청은 새로 시작하지 않음
+    """
+    
+    def __init__(self, debounce_seconds: float = COLLECTION_DEBOUNCE_SECONDS):
+        self.debounce_seconds = debounce_seconds
+        self.task: Optional[asyncio.Task] = None
+        self.run_id = 0
+        self.attached = 0  # 현재 실행에 합류한 요청 수
+        self.state = "idle"  # idle / running / succeeded / failed / busy / cancelled
+        self.reason: Optional[str] = None
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+    def is_running(self) -> bool:
+        return self.task is not None and not self.task.done()
+
+    def start(self, reason: str) -> bool:
+        """수집 시작 - 이미 실행 중이면 False"""
+        if self.is_running():
+            return False
+        self.run_id += 1
+        self.attached = 0
+        self.state = "running"
+        self.reason = reason
+        self.started_at = datetime.now()
+        self.finished_at = None
+        self.last_error = None
+        self.task = asyncio.get_running_loop().create_task(self._run(reason))
+        return True
+
+    def trigger(self, reason: str) -> Dict[str, Any]:
+        """수집 요청 - 실행 중이면 합류, 방금 끝났으면 무시, 아니면 새로 시작. 상태 핸들 반환"""
+        # 멀티 워커 모드에서는 리더 워커만 수집 - 팔로워는 요청 파일로 리더에게 전달
+        if not is_collection_leader():
+            try:
+                shared_state.request_collection(reason)
+            except OSError as e:
+                logger.error(f"❌ 리더 워커에 수집 요청 전달 실패: {str(e)}")
+                return {**self.get_status(), "action": "unavailable"}
+            logger.info(f"📨 수집 요청을 리더 워커에 전달했습니다 ({reason})")
+            return {**self.get_status(), "action": "forwarded_to_leader"}
         
-        # 스케줄러 관련 코드 모두 제거
-        # 대신 서버 시작시 딱 한번만 뉴스 수집 실행
+        if self.is_running():
+            self.attached += 1
+            return {**self.get_status(), "action": "attached"}
         
-        today = datetime.now().strftime("%Y-%m-%d")
-        today_files = file_manager.get_today_files()
+        if self.finished_at and (datetime.now() - self.finished_at).total_seconds() < self.debounce_seconds:
+            return {**self.get_status(), "action": "debounced"}
         
-        logger.info(f"📅 오늘 날짜: {today}")
-        logger.info(f"📂 오늘 생성된 파일 개수: {len(today_files)}")
+        self.start(reason)
+        return {**self.get_status(), "action": "started"}
+
+    async def _run(self, reason: str) -> None:
+        logger.info(f"🔄 백그라운드 뉴스 수집 시작 ({reason})")
+        try:
+            success = await asyncio.to_thread(force_news_collection)
+            if success is None:
+                # 증분 수집이 락을 잡고 있어 이번 요청은 건너뜀 (실패 아님)
+                self.state = "busy"
+                logger.info("⏭️ 다른 수집이 실행 중이라 이번 수집 요청은 건너뜁니다.")
+            else:
+                self.state = "succeeded" if success else "failed"
+                logger.info(f"{'✅' if success else '⚠️'} 백그라운드 뉴스 수집 종료: {self.state}")
+        except asyncio.CancelledError:
+            # 스레드는 계속 돌 수 있지만 run_daily_collection은 저널로 이어서 실행 가능
+            self.state = "cancelled"
+            raise
+        except Exception as e:
+            self.state = "failed"
+            self.last_error = str(e)
+            logger.error(f"❌ 백그라운드 뉴스 수집 실패: {str(e)}")
+        finally:
+            self.finished_at = datetime.now()
+
+    async def wait(self, timeout: float) -> bool:
+        """완료까지 최대 timeout초 대기 - 완료됐으면 True"""
+        if not self.is_running():
+            return True
+        done, _ = await asyncio.wait({self.task}, timeout=timeout)
+        return bool(done)
+
+    async def stop(self) -> None:
+        if self.is_running():
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    def get_status(self) -> Dict[str, Any]:
+        end = self.finished_at or datetime.now()
+        return {
+            "run_id": self.run_id,
+            "state": self.state,
+            "reason": self.reason,
+            "attached_requests": self.attached,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "elapsed_seconds": round((end - self.started_at).total_seconds(), 1) if self.started_at else None,
+            "last_error": self.last_error
+        }
+
+collection_supervisor = CollectionSupervisor()
+
+def stored_high_water_mark(reader: SnapshotReader) -> Optional[datetime]:
+    """증분 수집 스냅샷에 저장된 high_water_mark (최종 수집 스냅샷이거나 읽을 수 없으면 None)"""
+    try:
+        value = reader.read_header(("high_water_mark",)).get("high_water_mark")
+        return datetime.fromisoformat(value) if value else None
+    except (OSError, ValueError, TypeError) as e:
+        logger.warning(f"⚠️ 저장된 high_water_mark 읽기 실패: {str(e)}")
+        return None
+
+def incremental_news_collection(high_water_mark: Optional[datetime], window: timedelta) -> Optional[Dict[str, Any]]:
+    """증분 수집 1회 - 첫 실행은 최신 스냅샷의 기사와 high_water_mark를 이어받음. 다른 수집이 실행 중이면 None"""
+    if not _collection_lock.acquire(blocking=False):
+        return None
+    try:
+        # 파이프라인이 윈도우를 유지하므로 스냅샷 파일은 윈도우가 비었을 때만 읽힘 (지연 이터레이터)
+        latest_file = file_manager.find_latest_news_file()
+        reader = SnapshotReader(latest_file) if latest_file else None
+        if high_water_mark is None and reader is not None:
+            # 재시작 후 첫 실행 - 마지막 증분 스냅샷의 기준 시각부터 이어서 수집
+            high_water_mark = stored_high_water_mark(reader)
+        previous_articles = reader.iter_articles() if reader is not None else ()
+        metrics = news_cache.pipeline.run_incremental_collection(previous_articles, high_water_mark, window)
+        if metrics and metrics["saved"]:
+            asset_catalog.refresh(force=True)
+            update_news_cache()
+        return metrics
+    finally:
+        _collection_lock.release()
+
+class IncrementalScheduler:
+    """주기적 증분 수집 스케줄러
+    
+    - 실행이 끝난 뒤 interval ± jitter 만큼 쉬고 다음 실행 (실행이 길어지면 자연히 뒤로 밀림)
+    - 다른 수집이 실행 중인 주기는 건너뜀
+    - 실행별 지표를 최근 history_size개 보관
+    """
+    
+    def __init__(self, interval_minutes: float = COLLECTION_INTERVAL_MINUTES,
+                 jitter_seconds: float = COLLECTION_JITTER_SECONDS,
+                 window_hours: float = INCREMENTAL_WINDOW_HOURS,
+                 history_size: int = SCHEDULER_HISTORY_SIZE):
+        self.interval = interval_minutes * 60
+        self.jitter = max(0.0, jitter_seconds)
+        self.window = timedelta(hours=window_hours)
+        self.task: Optional[asyncio.Task] = None
+        self.high_water_mark: Optional[datetime] = None
+        self.history = deque(maxlen=history_size)
+        self.running = False
+        self.next_run_at: Optional[datetime] = None
+        self.skipped_runs = 0
+        self.overruns = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.interval > 0 and NEWS_SCRAPER_AVAILABLE
+
+    def start(self) -> None:
+        if self.enabled and self.task is None:
+            self.task = asyncio.get_running_loop().create_task(self._loop())
+            logger.info(f"⏰ 증분 수집 스케줄러 시작: {self.interval / 60:g}분 간격 (±{self.jitter:g}초)")
+
+    async def stop(self) -> None:
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
+
+    async def _loop(self) -> None:
+        while True:
+            delay = max(0.0, self.interval + random.uniform(-self.jitter, self.jitter))
+            self.next_run_at = datetime.now() + timedelta(seconds=delay)
+            await asyncio.sleep(delay)
+            await self.run_once()
+
+    async def run_once(self) -> Dict[str, Any]:
+        """증분 수집 1회 실행 후 지표 기록"""
+        if self.running or collection_supervisor.is_running():
+            self.skipped_runs += 1
+            record = {"started_at": datetime.now().isoformat(), "status": "skipped", "reason": "collection_in_progress"}
+            self.history.append(record)
+            logger.info("⏭️ 다른 수집이 실행 중이라 이번 증분 수집은 건너뜁니다.")
+            return record
         
-        # 최종 수집이 완료되지 않았다면 실행
-        if not news_cache.final_collection_completed:
-            logger.info("🔄 최종 뉴스 수집 시작 (200개 기사 목표)")
-            collection_thread = threading.Thread(target=force_news_collection, daemon=False)
-            collection_thread.start()
-            
-            # 수집이 완료될 때까지 최대 10분 대기
-            logger.info("⏳ 뉴스 수집 완료를 기다리는 중... (최대 10분)")
-            collection_thread.join(timeout=600)  # 10분 대기
-            
-            if collection_thread.is_alive():
-                logger.warning("⚠️ 뉴스 수집이 10분 내에 완료되지 않았습니다.")
+        self.running = True
+        started = time.monotonic()
+        try:
+            metrics = await asyncio.to_thread(incremental_news_collection, self.high_water_mark, self.window)
+            if metrics is None:
+                self.skipped_runs += 1
+                record = {"started_at": datetime.now().isoformat(), "status": "skipped", "reason": "collection_in_progress"}
             else:
-                logger.info("✅ 뉴스 수집이 완료되었습니다.")
+                record = {"status": "succeeded", **metrics}
+                if metrics.get("high_water_mark"):
+                    self.high_water_mark = datetime.fromisoformat(metrics["high_water_mark"])
+        except Exception as e:
+            logger.error(f"❌ 증분 수집 실패: {str(e)}")
+            record = {"started_at": datetime.now().isoformat(), "status": "failed", "error": str(e)}
+        finally:
+            self.running = False
+        
+        elapsed = time.monotonic() - started
+        if elapsed > self.interval > 0:
+            self.overruns += 1
+            logger.warning(f"⚠️ 증분 수집이 주기보다 오래 걸렸습니다: {elapsed:.0f}초 > {self.interval:.0f}초")
+        self.history.append(record)
+        return record
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "enabled": self.enabled,
+            "interval_minutes": self.interval / 60,
+            "jitter_seconds": self.jitter,
+            "window_hours": self.window.total_seconds() / 3600,
+            "running": self.running,
+            "next_run_at": self.next_run_at.isoformat() if self.next_run_at and self.task else None,
+            "high_water_mark": self.high_water_mark.isoformat() if self.high_water_mark else None,
+            "skipped_runs": self.skipped_runs,
+            "overruns": self.overruns,
+            "last_run": self.history[-1] if self.history else None,
+            "recent_runs": list(self.history)
+        }
+
+incremental_scheduler = IncrementalScheduler()
+
+# === 멀티 워커 공유 상태 ===
+def _shared_state_enabled() -> bool:
+    if SHARED_STATE == "auto":
+        return WEB_CONCURRENCY > 1
+    return SHARED_STATE == "true"
+
+shared_state: Optional[SharedStateCoordinator] = None
+if _shared_state_enabled():
+    if shared_state_supported():
+        shared_state = SharedStateCoordinator()
+    else:
+        logger.warning("⚠️ 파일 락을 지원하지 않는 플랫폼이라 공유 상태 모드를 사용할 수 없습니다.")
+
+def is_collection_leader() -> bool:
+    """이 프로세스가 수집을 담당하는지 (공유 모드가 아니면 항상 True)"""
+    return shared_state is None or shared_state.is_leader
+
+def final_collection_done() -> bool:
+    """최종 수집 완료 여부 - 공유 모드에서는 다른 워커(이전 리더)가 남긴 완료 표시도 확인"""
+    if not news_cache.final_collection_completed and shared_state is not None \
+            and shared_state.final_collection_completed():
+        news_cache.final_collection_completed = True
+    return news_cache.final_collection_completed
+
+def mark_final_collection_completed() -> None:
+    """최종 수집 완료 기록 - 리더를 넘겨받은 워커가 다시 수집하지 않도록 공유 디렉토리에도 남김"""
+    news_cache.final_collection_completed = True
+    if shared_state is not None:
+        try:
+            shared_state.mark_final_collection_completed()
+        except OSError as e:
+            logger.error(f"❌ 최종 수집 완료 표시 기록 실패: {str(e)}")
+
+def handle_forwarded_request(request: Dict[str, Any]) -> None:
+    """팔로워가 전달한 요청을 리더에서 실행 - 수집(실행 중이면 합류) 또는 캐시 롤백(리스너가 다시 게시)"""
+    if request.get("kind") == "rollback":
+        restored = news_cache.rollback(request.get("version"))
+        result = f"버전 {restored.version}" if restored else "되돌릴 스냅샷 없음"
+        logger.info(f"📬 워커 {request.get('pid')}의 롤백 요청 처리: {result}")
+        return
+    handle = collection_supervisor.trigger(f"forwarded:{request.get('reason', 'unknown')}")
+    logger.info(f"📬 워커 {request.get('pid')}의 수집 요청 처리: {handle['action']}")
+
+def collection_status() -> Dict[str, Any]:
+    """수집 작업/진행/스케줄러 상태 - 팔로워는 리더가 공유한 상태 (아직 없으면 자기 상태)"""
+    if not is_collection_leader():
+        shared = shared_state.read_leader_status()
+        if shared is not None:
+            return shared
+    return {
+        "collection_task": collection_supervisor.get_status(),
+        "collection_progress": news_cache.pipeline.get_progress(),
+        "scheduler": incremental_scheduler.get_status()
+    }
+
+def publish_snapshot(snapshot: CacheSnapshot) -> None:
+    """리더의 캐시 교체를 다른 워커에 게시 (이미 직렬화된 본문 재사용)"""
+    if shared_state is not None:
+        shared_state.publish(snapshot.rendered["trend_summary"].body, snapshot.version)
+
+def _same_snapshot(snapshot: Optional[CacheSnapshot], version: int, body: bytes) -> bool:
+    return snapshot is not None and snapshot.version == version and snapshot.rendered["trend_summary"].body == body
+
+def apply_shared_snapshot(body: bytes, version: int) -> None:
+    """리더가 게시한 스냅샷을 이 워커의 캐시에 반영 (역직렬화/압축이 있으므로 스레드에서 호출)"""
+    if _same_snapshot(news_cache.snapshot, version, body):
+        return
+    if _same_snapshot(news_cache.find(version), version, body):
+        # 리더가 롤백한 경우 - 이력의 스냅샷으로 되돌려 다시 만들지 않음
+        news_cache.rollback(version)
+        return
+    data = orjson.loads(body) if orjson is not None else json.loads(body)
+    news_cache.update(data, version=version)
+
+if shared_state is not None:
+    news_cache.listeners.append(publish_snapshot)
+
+# === 서버 시작 이벤트를 lifespan으로 변경 ===
+async def start_news_service() -> None:
+    """저장된 스냅샷으로 캐시를 채우고 수집은 백그라운드에서 한 번만 실행"""
+    logger.info("🚀 서버 시작 - 최종 뉴스 수집 초기화 중...")
+    
+    # 뉴스 수집 기능 상태 확인
+    if not NEWS_SCRAPER_AVAILABLE:
+        logger.warning("⚠️ 뉴스 수집 기능이 비활성화되었습니다. 기본 데이터만 제공됩니다.")
+        # 기본 데이터로 캐시 초기화
+        default_data = data_processor.create_default_data("뉴스 수집 기능이 일시적으로 비활성화되었습니다.")
+        news_cache.update(default_data)
+        return
+    
+    # 팔로워 워커는 리더가 게시한 스냅샷으로 시작하고 수집은 하지 않음
+    if shared_state is not None and not shared_state.try_become_leader():
+        latest = shared_state.read_latest()
+        if latest is not None:
+            await asyncio.to_thread(apply_shared_snapshot, *latest)
         else:
-            logger.info("🏁 최종 수집이 이미 완료되었습니다.")
+            await asyncio.to_thread(update_news_cache)
+        if not news_cache.latest_data:
+            news_cache.update(data_processor.create_default_data())
+        shared_state.start(apply_shared_snapshot, start_collection_duties, handle_forwarded_request, collection_status)
+        logger.info(f"👥 팔로워 워커로 시작 (pid {os.getpid()}) - 수집은 리더 워커가 담당합니다.")
+        return
+    
+    # 캐시 초기 업데이트 - 마지막으로 저장된 스냅샷 (없으면 기본 데이터)
+    await asyncio.to_thread(update_news_cache)
+    if not news_cache.latest_data:
+        news_cache.update(data_processor.create_default_data())
+    logger.info("✅ 초기 캐시 업데이트 완료")
+    
+    await start_collection_duties()
+    if shared_state is not None:
+        # 리더로 시작해도 팔로워가 전달한 수집 요청을 받아야 함
+        shared_state.start(apply_shared_snapshot, start_collection_duties, handle_forwarded_request, collection_status)
+
+async def start_collection_duties() -> None:
+    """수집 담당 프로세스의 작업 시작 - 최종 수집(미완료 시)과 증분 스케줄러"""
+    if shared_state is not None and news_cache.snapshot is not None:
+        # 리더를 넘겨받은 경우에도 현재 스냅샷을 다시 게시
+        publish_snapshot(news_cache.snapshot)
+    
+    # 스케줄러 관련 코드 모두 제거
+    # 대신 서버 시작시 딱 한번만 뉴스 수집 실행
+    
+    today = datetime.now().strftime("%Y-%m-%d")
+    today_files = file_manager.get_today_files()
+    
+    logger.info(f"📅 오늘 날짜: {today}")
+    logger.info(f"📂 오늘 생성된 파일 개수: {len(today_files)}")
+    
+    # 최종 수집이 완료되지 않았다면 백그라운드에서 실행 (진행 상황은 /api/status)
+    # 리더를 넘겨받은 경우 이전 리더가 남긴 완료 표시를 확인해 다시 수집하지 않음
+    if not final_collection_done():
+        logger.info("🔄 최종 뉴스 수집 시작 (200개 기사 목표)")
+        collection_supervisor.trigger("startup")
         
-        logger.info("✅ 서버 시작 이벤트 완료")
+        if STARTUP_COLLECTION_MODE == "blocking":
+            logger.info(f"⏳ 뉴스 수집 완료를 기다리는 중... (최대 {STARTUP_COLLECTION_TIMEOUT}초)")
+            if await collection_supervisor.wait(STARTUP_COLLECTION_TIMEOUT):
+                logger.info("✅ 뉴스 수집이 완료되었습니다.")
+            else:
+                logger.warning(f"⚠️ 뉴스 수집이 {STARTUP_COLLECTION_TIMEOUT}초 내에 완료되지 않았습니다.")
+    else:
+        logger.info("🏁 최종 수집이 이미 완료되었습니다.")
+    
+    logger.info("✅ 서버 시작 이벤트 완료")
+    if incremental_scheduler.enabled:
+        incremental_scheduler.start()
+    else:
         logger.info("🚫 스케줄러는 비활성화되었습니다. 더 이상 자동 수집하지 않습니다.")
-        
-        yield  # 서버 실행
-        
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """서버 시작 시 초기화 - 수집을 기다리지 않고 바로 요청 처리 시작"""
+    if static_manifest is not None:
+        # 파일마다 해시를 계산하므로 이벤트 루프 밖에서 생성
+        await asyncio.to_thread(static_manifest.load)
+        static_manifest.start_precompression()
+    try:
+        await start_news_service()
     except Exception as e:
         logger.error(f"❌ 서버 시작 이벤트 실패: {str(e)}")
         # 오류 발생 시에도 기본 데이터로 초기화
@@ -400,8 +1267,13 @@ async def lifespan(app: FastAPI):
             logger.info("🔄 기본 데이터로 초기화 완료")
         except Exception as e2:
             logger.error(f"❌ 기본 데이터 초기화도 실패: {str(e2)}")
-        
-        yield  # 서버 실행
+    
+    yield  # 서버 실행
+    
+    await incremental_scheduler.stop()
+    await collection_supervisor.stop()
+    if shared_state is not None:
+        await shared_state.stop()
 
 # === FastAPI 앱 설정 ===
 app = FastAPI(
@@ -420,163 +1292,290 @@ allowed_origins = [
     "*"  # 모든 도메인 허용 (개발용)
 ]
 
+# 자격 증명 모드에서는 '*'가 무시되므로 브라우저가 읽어야 하는 헤더를 명시
+CORS_EXPOSE_HEADERS = [header.strip() for header in os.getenv(
+    "CORS_EXPOSE_HEADERS", "ETag, Last-Modified, Cache-Control, Content-Length, Content-Range"
+).split(",") if header.strip()]
+
+# 단일 ASGI CORS 레이어 (프리플라이트는 라우팅 전에 캐시된 응답으로 처리)
 app.add_middleware(
-    CORSMiddleware,
+    CORSLayer,
     allow_origins=allowed_origins,
     allow_credentials=True,
     allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
     allow_headers=["*"],
-    expose_headers=["*"],
+    expose_headers=CORS_EXPOSE_HEADERS,
 )
 
-# CORS 헤더를 명시적으로 추가하는 미들웨어
-@app.middleware("http")
-async def add_cors_headers(request: Request, call_next):
-    response = await call_next(request)
-    
-    # 명시적인 CORS 헤더 추가
-    response.headers["Access-Control-Allow-Origin"] = "*"
-    response.headers["Access-Control-Allow-Methods"] = "GET, POST, PUT, DELETE, OPTIONS"
-    response.headers["Access-Control-Allow-Headers"] = "*"
-    response.headers["Access-Control-Expose-Headers"] = "*"
-    response.headers["Access-Control-Allow-Credentials"] = "true"
-    
-    return response
-
-# OPTIONS 요청 처리
-@app.options("/{path:path}")
-async def options_handler(path: str):
-    return JSONResponse(
-        content={"message": "OK"},
-        headers={
-            "Access-Control-Allow-Origin": "*",
-            "Access-Control-Allow-Methods": "GET, POST, PUT, DELETE, OPTIONS",
-            "Access-Control-Allow-Headers": "*",
-            "Access-Control-Expose-Headers": "*",
-            "Access-Control-Allow-Credentials": "true",
-        }
-    )
+# 라우트별 요청 수/지연 시간 (가장 바깥 레이어 - 프리플라이트 응답도 포함)
+app.add_middleware(MetricsMiddleware)
 
 # === API 엔드포인트 ===
-@app.get("/api/status")
-async def get_status():
-    """서버 상태 확인"""
+def build_status() -> Dict[str, Any]:
+    """서버 상태 데이터"""
+    final_collection_done()
     now = datetime.now()
     today = now.strftime("%Y-%m-%d")
     today_files = file_manager.get_today_files()
+    latest_file = file_manager.find_latest_news_file()
     cache_status = news_cache.get_status()
+    latest_data = news_cache.latest_data
+    collection = collection_status()
     
     return {
         "status": "healthy" if cache_status["is_healthy"] else "degraded",
         "server_time": now.isoformat(),
         "timezone": "UTC",
         "cache": cache_status,
-        "scheduler_status": "DISABLED - 최종 수집 모드",
-        "collection_mode": "ONE_TIME_FINAL",
+        "scheduler_status": "ENABLED - 증분 수집 모드" if incremental_scheduler.enabled else "DISABLED - 최종 수집 모드",
+        "collection_mode": "INCREMENTAL" if incremental_scheduler.enabled else "ONE_TIME_FINAL",
+        "scheduler": collection["scheduler"],
+        "shared_state": shared_state.get_status() if shared_state is not None else {"enabled": False},
+        "collection_progress": collection["collection_progress"],
+        "collection_task": collection["collection_task"],
+        "static_assets": static_manifest.get_status() if static_manifest is not None else None,
         "files": {
             "today_files_count": len(today_files),
             "today_files": [f.name for f in today_files],
-            "latest_file": file_manager.find_latest_news_file().name if file_manager.find_latest_news_file() else None,
+            "latest_file": latest_file.name if latest_file else None,
         },
         "data_status": {
             "has_today_data": news_cache.is_today_data(),
-            "news_count": len(news_cache.latest_data.get("news_list", [])) if news_cache.latest_data else 0,
-            "time_range": news_cache.latest_data.get("time_range", "없음") if news_cache.latest_data else "없음",
+            "news_count": len(latest_data.get("news_list", [])) if latest_data else 0,
+            "time_range": latest_data.get("time_range", "없음") if latest_data else "없음",
             "final_collection_completed": news_cache.final_collection_completed
         }
     }
 
+# 상태 검증자(ETag)에서 제외하는 시각 파생 값 - 경과 시간은 started_at으로 다시 계산 가능
+STATUS_VOLATILE_KEYS = ("server_time", "collection_task.elapsed_seconds")
+
+@app.get("/api/status")
+async def get_status(request: Request):
+    """서버 상태 확인 - 시각에서 계산되는 값만 바뀐 폴링에는 304 (수집 진행 개수가 바뀌면 200)"""
+    return json_response(request, build_status(), STATUS_CACHE_CONTROL, volatile_keys=STATUS_VOLATILE_KEYS)
+
+async def current_snapshot() -> Optional[CacheSnapshot]:
+    """현재 캐시 스냅샷 - 없으면 캐시를 채우고, 오늘 데이터가 아니면 백그라운드 수집 시작"""
+    # 캐시에 데이터가 없으면 업데이트 (파일 읽기/압축은 스레드에서)
+    if news_cache.snapshot is None:
+        await asyncio.to_thread(update_news_cache)
+    
+    # 여전히 데이터가 없으면 백그라운드에서 데이터 수집 시작
+    snapshot = news_cache.snapshot
+    if snapshot is None:
+        if not news_cache.initial_fetch_done:
+            collection_supervisor.trigger("empty_cache")
+            news_cache.initial_fetch_done = True
+        return None
+    
+    # 오늘 데이터가 아니면 새로 수집 (진행 중인 수집이 있으면 합류)
+    if not news_cache.is_today_data() and not final_collection_done():
+        if collection_supervisor.trigger("stale_cache")["action"] == "started":
+            logger.warning("⚠️ 캐시의 데이터가 오늘 것이 아닙니다. 새로 수집합니다.")
+    
+    return snapshot
+
+async def current_news_data() -> Optional[Dict[str, Any]]:
+    """현재 뉴스 데이터"""
+    snapshot = await current_snapshot()
+    return snapshot.data if snapshot else None
+
 @app.get("/api/trend-summary")
-async def get_news_data():
+async def get_news_data(request: Request):
     """뉴스 데이터 조회"""
     try:
-        # 캐시에 데이터가 없으면 업데이트
-        if not news_cache.latest_data:
-            update_news_cache()
-        
-        # 여전히 데이터가 없으면 기본 데이터 반환
-        if not news_cache.latest_data:
-            default_data = data_processor.create_default_data()
-            
-            # 백그라운드에서 데이터 수집 시작
-            if not news_cache.initial_fetch_done:
-                threading.Thread(target=force_news_collection, daemon=True).start()
-                news_cache.initial_fetch_done = True
-            
-            return default_data
+        snapshot = await current_snapshot()
+        if snapshot is None:
+            # 기본 데이터 반환
+            return data_processor.create_default_data()
         
-        # 오늘 데이터가 아니면 새로 수집
-        if not news_cache.is_today_data():
-            logger.warning("⚠️ 캐시의 데이터가 오늘 것이 아닙니다. 새로 수집합니다.")
-            threading.Thread(target=force_news_collection, daemon=True).start()
-        
-        return news_cache.latest_data
+        return payload_response(request, snapshot.rendered["trend_summary"],
+                                TREND_CACHE_CONTROL, snapshot.activated_at)
         
     except Exception as e:
         logger.error(f"❌ 뉴스 데이터 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/api/prediction")
-async def get_prediction_data():
+async def get_prediction_data(request: Request):
     """예측 데이터 조회"""
     try:
         # 캐시에 데이터가 없으면 업데이트
-        if not news_cache.latest_data:
-            update_news_cache()
+        if news_cache.snapshot is None:
+            await asyncio.to_thread(update_news_cache)
         
         # 기본 예측 데이터 생성
-        if not news_cache.latest_data:
-            return {
-                "predictions": {
-                    "이재명": 35.0,
-                    "김문수": 30.0,
-                    "이준석": 25.0
-                },
-                "analysis": "데이터를 수집 중입니다. 잠시 후 다시 확인해주세요.",
-                "total_articles": 0,
-                "time_range": "데이터 수집 중"
-            }
-        
-        # 뉴스 데이터를 기반으로 예측 생성
-        candidate_stats = news_cache.latest_data.get("candidate_stats", {})
-        total_articles = news_cache.latest_data.get("total_articles", 0)
-        
-        # 간단한 예측 알고리즘 (감성 분석 기반)
-        predictions = {}
-        base_score = 30.0  # 기본 점수
-        
-        for candidate, stats in candidate_stats.items():
-            positive = stats.get("긍정", 0)
-            negative = stats.get("부정", 0)
-            neutral = stats.get("중립", 0)
-            total = positive + negative + neutral
-            
-            if total > 0:
-                sentiment_score = (positive - negative) / total * 10
-                predictions[candidate] = max(10.0, min(50.0, base_score + sentiment_score))
-            else:
-                predictions[candidate] = base_score
-        
-        # 정규화 (총합 100%)
-        total_pred = sum(predictions.values())
-        if total_pred > 0:
-            predictions = {k: (v / total_pred) * 100 for k, v in predictions.items()}
+        snapshot = news_cache.snapshot
+        if snapshot is None:
+            return build_prediction_data(None)
         
-        return {
-            "predictions": predictions,
-            "analysis": news_cache.latest_data.get("trend_summary", "분석 중..."),
-            "total_articles": total_articles,
-            "time_range": news_cache.latest_data.get("time_range", "")
-        }
+        return payload_response(request, snapshot.rendered["prediction"],
+                                PREDICTION_CACHE_CONTROL, snapshot.activated_at)
         
     except Exception as e:
         logger.error(f"❌ 예측 데이터 조회 실패: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+@app.get("/api/news")
+async def get_news_page(
+    request: Request,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(NEWS_PAGE_DEFAULT_LIMIT, ge=1, le=NEWS_PAGE_MAX_LIMIT),
+    candidate: Optional[str] = None,
+    sentiment: Optional[str] = None,
+    source: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """뉴스 목록 페이지 조회 (후보/감성/언론사 필터, 필드 선택)"""
+    field_list = [field.strip() for field in fields.split(",") if field.strip()] if fields else None
+    if field_list:
+        unknown = [field for field in field_list if field not in NEWS_ARTICLE_FIELDS]
+        if unknown:
+            raise HTTPException(status_code=400, detail=f"알 수 없는 필드: {', '.join(unknown)}")
+    
+    snapshot = await current_snapshot()
+    if snapshot is None:
+        return {"total": 0, "offset": offset, "limit": limit, "items": []}
+    
+    index = snapshot.index
+    # 캐시 내용 + 쿼리로 ETag를 만들어 직렬화 전에 304 판단
+    version = snapshot.rendered["trend_summary"].etag_value
+    query_key = repr((offset, limit, candidate, sentiment, source, field_list))
+    query_hash = hashlib.blake2b(query_key.encode("utf-8"), digest_size=8).hexdigest()
+    last_modified = http_date(snapshot.activated_at)
+    headers = validator_headers(f'W/"{version}-{query_hash}"', NEWS_CACHE_CONTROL, last_modified)
+    if is_not_modified(request, headers["ETag"], last_modified):
+        return Response(status_code=304, headers=headers)
+    
+    positions = index.filter(candidate, sentiment, source)
+    return JSONResponse(content={
+        "total": len(positions),
+        "offset": offset,
+        "limit": limit,
+        "items": index.page(positions, offset, limit, field_list)
+    }, headers=headers)
+
+def parse_history_time(value: Optional[str], name: str) -> Optional[datetime]:
+    """from/to 파라미터 파싱 (YYYY-MM-DD 또는 ISO 8601) - 오프셋이 없으면 서버 로컬 시각, UTC로 변환해 반환"""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).astimezone(timezone.utc)
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"잘못된 {name} 형식입니다: {value}")
+
+def load_history(start: datetime, end: datetime, candidate: Optional[str], bucket: str) -> Dict[str, Any]:
+    """아직 적재되지 않은 스냅샷만 반영한 뒤 조회"""
+    history_store.sync(asset_catalog.snapshots())
+    return history_store.query(start, end, candidate=candidate, bucket=bucket)
+
+@app.get("/api/history")
+async def get_history(
+    request: Request,
+    from_: Optional[str] = Query(None, alias="from"),
+    to: Optional[str] = None,
+    candidate: Optional[str] = None,
+    bucket: str = "day"
+):
+    """후보별 감성 시계열 조회 (시간/일 버킷 집계)"""
+    if bucket not in BUCKET_FORMATS:
+        raise HTTPException(status_code=400, detail=f"bucket은 {', '.join(BUCKET_FORMATS)} 중 하나여야 합니다.")
+    
+    end = parse_history_time(to, "to") or datetime.now(timezone.utc)
+    start = parse_history_time(from_, "from") or end - timedelta(days=HISTORY_DEFAULT_DAYS)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="from은 to보다 이전이어야 합니다.")
+    
+    try:
+        # 스냅샷 적재와 SQLite 조회는 파일 I/O라 이벤트 루프 밖에서 실행
+        result = await asyncio.to_thread(load_history, start, end, candidate, bucket)
+    except Exception as e:
+        logger.error(f"❌ 히스토리 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return json_response(request, result, HISTORY_CACHE_CONTROL)
+
+@app.get("/api/collection")
+async def get_collection_status():
+    """현재/최근 수집 실행 상태 (팔로워 워커도 리더의 상태)"""
+    collection = collection_status()
+    return {**collection["collection_task"], "progress": collection["collection_progress"]}
+
+# === 지표 ===
+def _memory_cache_stat(key: str) -> float:
+    analyzer = getattr(news_cache.pipeline, "analyzer", None)
+    return analyzer.get_cache_stats().get(key, 0) if analyzer is not None else 0
+
+def _cache_age_seconds() -> float:
+    last_update = news_cache.last_update
+    return (datetime.now() - last_update).total_seconds() if last_update else float("nan")
+
+gauge("news_cache_updates", "캐시 스냅샷 교체 횟수").set_function(lambda: news_cache.update_count)
+gauge("news_cache_age_seconds", "현재 캐시 스냅샷이 활성화된 뒤 지난 시간").set_function(_cache_age_seconds)
+for _stat in ("entries", "bytes", "hit_ratio", "evictions"):
+    gauge(f"analysis_memory_cache_{_stat}", f"분석 결과 메모리 캐시 {_stat}").set_function(
+        lambda stat=_stat: _memory_cache_stat(stat)
+    )
+
+@app.get("/metrics")
+async def get_metrics():
+    """Prometheus 텍스트 형식 지표 (워커별 값)"""
+    return Response(content=REGISTRY.render(), media_type=METRICS_CONTENT_TYPE,
+                    headers={"Cache-Control": "no-store"})
+
+@app.get("/api/cache/snapshots")
+async def list_cache_snapshots():
+    """현재/이전 캐시 스냅샷 목록"""
+    return {"snapshots": news_cache.list_snapshots()}
+
+@app.get("/api/cache/diff")
+async def diff_cache_snapshots(from_version: Optional[int] = Query(None, alias="from"),
+                               to_version: Optional[int] = Query(None, alias="to")):
+    """두 캐시 스냅샷 비교 - 기본값은 직전 스냅샷 → 현재"""
+    current = news_cache.snapshot
+    new = news_cache.find(to_version) if to_version is not None else current
+    if from_version is not None:
+        old = news_cache.find(from_version)
+    else:
+        old = news_cache.history[-1] if news_cache.history else None
+    if old is None or new is None:
+        raise HTTPException(status_code=404, detail="비교할 스냅샷이 없습니다.")
+    return news_cache.diff(old, new)
+
+@app.post("/api/cache/rollback")
+async def rollback_cache(version: Optional[int] = None):
+    """이전 캐시 스냅샷으로 즉시 되돌리기 - 팔로워 워커는 리더에 전달 (리더가 되돌린 스냅샷을 모든 워커에 게시)"""
+    if not is_collection_leader():
+        try:
+            shared_state.request_rollback(version)
+        except OSError as e:
+            logger.error(f"❌ 리더 워커에 롤백 요청 전달 실패: {str(e)}")
+            raise HTTPException(status_code=503, detail="리더 워커에 롤백 요청을 전달하지 못했습니다.")
+        return JSONResponse(status_code=202, content={"status": "forwarded_to_leader", "version": version})
+    restored = news_cache.rollback(version)
+    if restored is None:
+        raise HTTPException(status_code=404, detail="되돌릴 스냅샷이 없습니다.")
+    return {"status": "rolled_back", "snapshot": restored.summary()}
+
+def trigger_collection(reason: str) -> Dict[str, Any]:
+    """수동 수집 요청 - 리더 워커에 전달하지 못하면 503"""
+    handle = collection_supervisor.trigger(reason)
+    if handle["action"] == "unavailable":
+        raise HTTPException(status_code=503, detail="수집을 담당하는 리더 워커에 요청을 전달하지 못했습니다.")
+    return handle
+
+def trigger_message(action: str, started_message: str) -> str:
+    if action == "started":
+        return started_message
+    if action == "forwarded_to_leader":
+        return "수집을 담당하는 리더 워커에 요청을 전달했습니다."
+    return "진행 중이거나 방금 끝난 수집이 있어 새로 시작하지 않았습니다."
+
 @app.post("/api/refresh")
 async def force_refresh(background_tasks: BackgroundTasks):
     """수동 새로고침 - 최종 수집 완료 후에는 비활성화"""
-    if news_cache.final_collection_completed:
+    if final_collection_done():
         return {
             "message": "최종 수집이 완료되어 더 이상 새로고침할 수 없습니다.",
             "status": "disabled",
@@ -584,11 +1583,13 @@ async def force_refresh(background_tasks: BackgroundTasks):
         }
     
     logger.info("🔄 수동 새로고침 요청")
-    background_tasks.add_task(force_news_collection)
+    handle = trigger_collection("manual_refresh")
     
     return {
-        "message": "최종 뉴스 데이터 수집이 시작되었습니다.",
-        "status": "started",
+        "message": trigger_message(handle["action"], "최종 뉴스 데이터 수집이 시작되었습니다."),
+        "status": handle["action"],
+        "collection": handle,
+        "status_url": "/api/collection",
         "estimated_completion": (datetime.now() + timedelta(minutes=5)).isoformat()
     }
 
@@ -597,15 +1598,17 @@ async def force_update_cache():
     """캐시 강제 업데이트"""
     try:
         logger.info("🔄 캐시 강제 업데이트 요청")
-        update_news_cache()
+        await asyncio.to_thread(update_news_cache)
         
-        if news_cache.latest_data:
+        snapshot = news_cache.snapshot
+        if snapshot is not None:
             return {
                 "message": "캐시가 성공적으로 업데이트되었습니다.",
                 "status": "success",
-                "last_updated": news_cache.last_update.isoformat() if news_cache.last_update else None,
-                "news_count": len(news_cache.latest_data.get("news_list", [])),
-                "time_range": news_cache.latest_data.get("time_range", "알 수 없음")
+                "last_updated": snapshot.activated_at.isoformat(),
+                "version": snapshot.version,
+                "news_count": len(snapshot.data.get("news_list", [])),
+                "time_range": snapshot.data.get("time_range", "알 수 없음")
             }
         else:
             return {
@@ -619,22 +1622,23 @@ async def force_update_cache():
 @app.post("/api/force-today-collection")
 async def force_today_collection(background_tasks: BackgroundTasks):
     """오늘 데이터 강제 수집 - 최종 수집 완료 후에는 비활성화"""
-    if news_cache.final_collection_completed:
+    if final_collection_done():
         return {
             "message": "최종 수집이 완료되어 더 이상 수집할 수 없습니다.",
             "status": "disabled",
             "reason": "final_collection_completed"
         }
         
+    today = datetime.now().strftime("%Y-%m-%d")
+    logger.info(f"🔥 오늘({today}) 최종 데이터 수집 요청")
+    handle = trigger_collection("force_today")
+    
     try:
-        today = datetime.now().strftime("%Y-%m-%d")
-        logger.info(f"🔥 오늘({today}) 최종 데이터 수집 요청")
-        
-        background_tasks.add_task(force_news_collection)
-        
         return {
-            "message": f"오늘({today}) 최종 뉴스 데이터 수집이 시작되었습니다.",
-            "status": "started",
+            "message": trigger_message(handle["action"], f"오늘({today}) 최종 뉴스 데이터 수집이 시작되었습니다."),
+            "status": handle["action"],
+            "collection": handle,
+            "status_url": "/api/collection",
             "target_date": today,
             "estimated_completion": (datetime.now() + timedelta(minutes=5)).isoformat(),
             "note": "이것이 마지막 수집입니다."
@@ -647,16 +1651,20 @@ async def force_today_collection(background_tasks: BackgroundTasks):
 @app.get("/status")
 async def get_status_legacy():
     """서버 상태 확인 (레거시)"""
-    return await get_status()
+    return build_status()
 
 @app.get("/news")
 async def get_news_data_legacy():
     """뉴스 데이터 조회 (레거시)"""
-    result = await get_news_data()
+    try:
+        snapshot = await current_snapshot()
+    except Exception as e:
+        logger.error(f"❌ 뉴스 데이터 조회 실패: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
     return {
-        "data": result,
+        "data": snapshot.data if snapshot else data_processor.create_default_data(),
         "metadata": {
-            "last_updated": news_cache.last_update.isoformat() if news_cache.last_update else datetime.now().isoformat(),
+            "last_updated": snapshot.activated_at.isoformat() if snapshot else datetime.now().isoformat(),
             "status": "success"
         }
     }
@@ -677,70 +1685,45 @@ async def force_today_collection_legacy(background_tasks: BackgroundTasks):
     return await force_today_collection(background_tasks)
 
 # === Flutter 웹 앱 서빙 ===
-if FLUTTER_WEB_DIR.exists():
-    # 정적 파일 서빙
-    app.mount("/assets", StaticFiles(directory=str(FLUTTER_WEB_DIR / "assets")), name="assets")
-    app.mount("/canvaskit", StaticFiles(directory=str(FLUTTER_WEB_DIR / "canvaskit")), name="canvaskit")
-    app.mount("/icons", StaticFiles(directory=str(FLUTTER_WEB_DIR / "icons")), name="icons")
-    
-    # 개별 파일들 서빙
-    @app.get("/main.dart.js")
-    async def serve_main_dart_js():
-        return FileResponse(str(FLUTTER_WEB_DIR / "main.dart.js"), media_type="application/javascript")
-    
-    @app.get("/flutter.js")
-    async def serve_flutter_js():
-        return FileResponse(str(FLUTTER_WEB_DIR / "flutter.js"), media_type="application/javascript")
-    
-    @app.get("/flutter_bootstrap.js")
-    async def serve_flutter_bootstrap_js():
-        return FileResponse(str(FLUTTER_WEB_DIR / "flutter_bootstrap.js"), media_type="application/javascript")
-    
-    @app.get("/flutter_service_worker.js")
-    async def serve_flutter_service_worker():
-        return FileResponse(str(FLUTTER_WEB_DIR / "flutter_service_worker.js"), media_type="application/javascript")
-    
-    @app.get("/manifest.json")
-    async def serve_manifest():
-        return FileResponse(str(FLUTTER_WEB_DIR / "manifest.json"), media_type="application/json")
-    
-    @app.get("/version.json")
-    async def serve_version():
-        return FileResponse(str(FLUTTER_WEB_DIR / "version.json"), media_type="application/json")
+def static_response(request: Request, asset) -> Response:
+    """매니페스트 항목 응답 - 사전 압축본 선택, 조건부 요청(304), Range(206)"""
+    # Range는 원본 바이트 기준 (압축본에 대한 부분 요청은 지원하지 않음)
+    if "range" in request.headers:
+        encoding, path, stat = None, asset.path, asset.stat
+    else:
+        encoding, path, stat = asset.select(request.headers.get("accept-encoding", ""))
+    headers = {
+        "ETag": asset.etag(encoding),
+        "Cache-Control": asset.cache_control,
+        "Last-Modified": format_datetime(asset.last_modified, usegmt=True),
+    }
+    if asset.compressible:
+        headers["Vary"] = "Accept-Encoding"
     
-    @app.get("/favicon.png")
-    async def serve_favicon():
-        return FileResponse(str(FLUTTER_WEB_DIR / "favicon.png"), media_type="image/png")
+    if is_not_modified(request, headers["ETag"], asset.last_modified):
+        return Response(status_code=304, headers=headers)
     
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    # stat을 넘겨 요청마다 stat 호출을 하지 않음 (Range/If-Range는 FileResponse가 처리)
+    return FileResponse(str(path), media_type=asset.media_type, headers=headers, stat_result=stat)
+
+if static_manifest is not None:
     # 메인 페이지
-    @app.get("/")
-    async def root():
-        return FileResponse(str(FLUTTER_WEB_DIR / "index.html"), media_type="text/html")
-    
-    # 모든 다른 경로는 Flutter 앱으로 라우팅 (SPA 지원)
-    @app.get("/{path:path}")
-    async def serve_flutter_web(path: str):
-        # 파일이 실제로 존재하는지 확인
-        file_path = FLUTTER_WEB_DIR / path
-        if file_path.exists() and file_path.is_file():
-            # 파일 확장자에 따른 MIME 타입 설정
-            if path.endswith('.js'):
-                return FileResponse(str(file_path), media_type="application/javascript")
-            elif path.endswith('.css'):
-                return FileResponse(str(file_path), media_type="text/css")
-            elif path.endswith('.html'):
-                return FileResponse(str(file_path), media_type="text/html")
-            elif path.endswith('.json'):
-                return FileResponse(str(file_path), media_type="application/json")
-            elif path.endswith('.png'):
-                return FileResponse(str(file_path), media_type="image/png")
-            elif path.endswith('.ico'):
-                return FileResponse(str(file_path), media_type="image/x-icon")
-            else:
-                return FileResponse(str(file_path))
-        
-        # 파일이 없으면 index.html로 리다이렉트 (SPA 라우팅)
-        return FileResponse(str(FLUTTER_WEB_DIR / "index.html"), media_type="text/html")
+    @app.api_route("/", methods=["GET", "HEAD"])
+    async def root(request: Request):
+        return static_response(request, static_manifest.get("index.html"))
+    
+    # 모든 다른 경로는 매니페스트에서 조회, 없으면 Flutter 앱으로 라우팅 (SPA 지원)
+    @app.api_route("/{path:path}", methods=["GET", "HEAD"])
+    async def serve_flutter_web(request: Request, path: str):
+        asset = static_manifest.get(path)
+        if asset is None:
+            if path.startswith(STATIC_NOT_FOUND_PREFIXES):
+                raise HTTPException(status_code=404, detail="Not Found")
+            # 파일이 없으면 index.html로 응답 (SPA 라우팅)
+            asset = static_manifest.get("index.html")
+        return static_response(request, asset)
     
     logger.info("✅ Flutter 웹 앱 서빙 설정 완료")
 else:
@@ -758,4 +1741,8 @@ else:
 # === 서버 실행 ===
 if __name__ == "__main__":
     port = int(os.environ.get("PORT", 10000))
-    uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file
+    if WEB_CONCURRENCY > 1:
+        # 워커 여러 개는 import 문자열로만 실행 가능 - start.py와 같은 문자열 (parent_dir가 sys.path에 있음)
+        uvicorn.run("web.api_server:app", host="0.0.0.0", port=port, workers=WEB_CONCURRENCY)
+    else:
+        uvicorn.run(app, host="0.0.0.0", port=port)
\ No newline at end of file